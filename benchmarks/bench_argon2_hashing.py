@@ -0,0 +1,59 @@
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from marketgram.identity.access.port.adapter.argon2_calibration_command import (
+    hash_once
+)
+
+HASHES_PER_WORKER = 20
+REPEATS = 3
+TIME_COST = int(os.environ.get('ARGON2_TIME_COST', 2))
+MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', 19 * 1024))
+PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', 1))
+
+
+def hashes_per_second(workers: int) -> float:
+    total = workers * HASHES_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(
+            hash_once,
+            [TIME_COST] * workers,
+            [MEMORY_COST] * workers,
+            [PARALLELISM] * workers
+        ))
+
+        started_at = time.perf_counter()
+        list(executor.map(
+            hash_once,
+            [TIME_COST] * total,
+            [MEMORY_COST] * total,
+            [PARALLELISM] * total
+        ))
+        elapsed = time.perf_counter() - started_at
+
+    return total / elapsed
+
+
+def main() -> None:
+    cpu_count = os.cpu_count()
+    print(
+        f'time_cost={TIME_COST} memory_cost={MEMORY_COST}KiB '
+        f'parallelism={PARALLELISM} cpus={cpu_count}'
+    )
+
+    workers = 1
+    while workers <= cpu_count:
+        rates = [hashes_per_second(workers) for _ in range(REPEATS)]
+        rate = statistics.median(rates)
+        print(
+            f'workers={workers:<3} {rate:8.1f} hashes/s '
+            f'{rate / workers:7.1f} hashes/s per core '
+            f'(min {min(rates):.1f}, max {max(rates):.1f})'
+        )
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
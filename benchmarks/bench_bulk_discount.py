@@ -0,0 +1,158 @@
+import asyncio
+import os
+import time
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import registry
+
+from marketgram.trade.application.commands.discount_setting import (
+    DiscountSettingCommand,
+    DiscountSettingHandler
+)
+from marketgram.trade.domain.model.trade_item.bulk_discount import (
+    BulkDiscount,
+    CardsFilter
+)
+from marketgram.trade.domain.model.trade_item.exceptions import DomainError
+from marketgram.trade.port.adapter.sqlalchemy_resources.cards_repository import (
+    SQLAlchemyCardsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_registry import (
+    cards_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+
+CARDS = int(os.environ.get('DISCOUNT_CARDS', 5_000))
+PERCENT = Decimal('15')
+
+
+class FixedIdProvider:
+    def __init__(self, user_id: UUID) -> None:
+        self._user_id = user_id
+
+    def provided_id(self) -> UUID:
+        return self._user_id
+
+
+async def seed(engine) -> tuple[UUID, list[int]]:
+    owner_id = uuid4()
+    async with engine.begin() as connection:
+        for table in (outbox_table, cards_table):
+            await connection.run_sync(table.drop, checkfirst=True)
+        for table in (members_table, cards_table, outbox_table):
+            await connection.run_sync(table.create, checkfirst=True)
+
+        await connection.execute(
+            insert(members_table).values(user_id=owner_id, is_blocked=False)
+        )
+        await connection.execute(text(
+            """
+            INSERT INTO cards (
+                owner_id, price, title, text_description, account_format,
+                region, spam_block, format, method, min_price, min_discount,
+                created_at, is_archived, is_purchased, version_id
+            )
+            SELECT
+                :owner_id,
+                CASE WHEN n % 10 = 0 THEN 105 ELSE 150 + n % 500 END,
+                'card ' || n, 'card', 'autoreg', 'random', false, 'login_code',
+                'provides_seller', 100, 0.1, now(), false, false, 1
+            FROM generate_series(1, :cards) AS n
+            """
+        ), {'owner_id': owner_id, 'cards': CARDS})
+        await connection.execute(text('ANALYZE cards'))
+        card_ids = (await connection.execute(
+            select(cards_table.c.card_id).order_by(cards_table.c.card_id)
+        )).scalars().all()
+
+    return owner_id, list(card_ids)
+
+
+async def reset(engine) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            update(cards_table)
+            .where(cards_table.c.dirty_price.is_not(None))
+            .values(price=cards_table.c.dirty_price, dirty_price=None)
+        )
+        await connection.execute(outbox_table.delete())
+
+
+async def per_card(engine, owner_id: UUID, card_ids: list[int]) -> tuple[int, int]:
+    discounted = rejected = 0
+    async with AsyncSession(engine) as session:
+        prices = dict((await session.execute(
+            select(cards_table.c.card_id, cards_table.c.price)
+            .where(cards_table.c.card_id.in_(card_ids))
+        )).all())
+
+    for card_id in card_ids:
+        async with AsyncSession(engine) as session:
+            await session.begin()
+            handler = DiscountSettingHandler(
+                FixedIdProvider(owner_id),
+                SQLAlchemyCardsRepository(session)
+            )
+            try:
+                await handler.handle(DiscountSettingCommand(
+                    card_id,
+                    str(prices[card_id] * (100 - PERCENT) / 100)
+                ))
+                await session.commit()
+                discounted += 1
+            except DomainError:
+                await session.rollback()
+                rejected += 1
+
+    return discounted, rejected
+
+
+async def set_based(engine, owner_id: UUID, card_ids: list[int]) -> tuple[int, int]:
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        report = await SQLAlchemyCardsRepository(session).set_discounted_prices(
+            owner_id,
+            CardsFilter(card_ids=tuple(card_ids)),
+            BulkDiscount(percent=PERCENT)
+        )
+        await session.commit()
+
+    return len(report.discounted), len(report.rejected)
+
+
+async def main() -> None:
+    cards_registry_mapper(registry())
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    try:
+        owner_id, card_ids = await seed(engine)
+        print(f'seeded {CARDS} cards')
+
+        for name, apply in (('per-card loop', per_card), ('set-based', set_based)):
+            await reset(engine)
+            started_at = time.perf_counter()
+            discounted, rejected = await apply(engine, owner_id, card_ids)
+            elapsed = time.perf_counter() - started_at
+            print(
+                f'{name:<14} {elapsed * 1e3:10.1f}ms '
+                f'discounted={discounted} rejected={rejected}'
+            )
+    finally:
+        async with engine.begin() as connection:
+            for table in (outbox_table, cards_table):
+                await connection.run_sync(table.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import registry
+
+from marketgram.trade.application.commands.card_buy import (
+    CardBuyCommand,
+    CardBuyHandler
+)
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.sell_card import SellCard
+from marketgram.trade.port.adapter.errors import ConcurrencyConflictError
+from marketgram.trade.port.adapter.sqlalchemy_resources.cards_repository import (
+    SQLAlchemyCardsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.deals_repository import (
+    SQLAlchemyDealsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balances_table import (
+    balances_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_registry import (
+    cards_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_registry import (
+    deals_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_registry import (
+    entries_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_registry import (
+    members_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_registry import (
+    operations_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.members_repository import (
+    SQLAlchemyMembersRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.stock_repository import (
+    SQLAlchemyStockRepository
+)
+
+BUYERS = 200
+PRICE = '200.00'
+
+
+class FixedIdProvider:
+    def __init__(self, user_id: UUID) -> None:
+        self._user_id = user_id
+
+    def provided_id(self) -> UUID:
+        return self._user_id
+
+
+class LockingCardsRepository(SQLAlchemyCardsRepository):
+    async def for_sale_with_price_and_id(
+        self, 
+        price: Money, 
+        card_id: int
+    ) -> SellCard | None:
+        stmt = (
+            select(SellCard)
+            .where(and_(
+                SellCard._price == price,
+                SellCard._card_id == card_id
+            ))
+            .with_for_update()
+        )
+        result = await self._async_session.execute(stmt)
+        card = result.scalar_one_or_none()
+        if card is None or card._is_purchased:
+            return None
+
+        return card
+
+
+async def seed(engine) -> tuple[int, list[UUID]]:
+    seller_id = uuid4()
+    buyers = [uuid4() for _ in range(BUYERS)]
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        await session.execute(
+            insert(members_table),
+            [{'user_id': user_id, 'is_blocked': False} for user_id in [seller_id, *buyers]]
+        )
+        await session.execute(
+            insert(balances_table),
+            [
+                {'user_id': user_id, 'account_type': 'user', 'amount': 1000}
+                for user_id in buyers
+            ]
+        )
+        card_id = await session.scalar(
+            insert(cards_table)
+            .values(
+                owner_id=seller_id, price=PRICE, title='card',
+                text_description='card', account_format='autoreg',
+                region='random', spam_block=False, format='login_code',
+                method='provides_seller', min_price=100, min_discount=0.1,
+                shipping_hours=1, receipt_hours=1, check_hours=24,
+                created_at=datetime.now(), is_archived=False,
+                is_purchased=False, version_id=1
+            )
+            .returning(cards_table.c.card_id)
+        )
+        await session.commit()
+
+    return card_id, buyers
+
+
+async def buy(engine, cards_repository_class, card_id: int, buyer_id: UUID) -> str:
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        handler = CardBuyHandler(
+            FixedIdProvider(buyer_id),
+            SQLAlchemyMembersRepository(session),
+            cards_repository_class(session),
+            SQLAlchemyDealsRepository(session),
+            SQLAlchemyStockRepository(session)
+        )
+        try:
+            await handler.handle(CardBuyCommand(card_id, 1, PRICE))
+            await session.commit()
+        except ConcurrencyConflictError:
+            return 'conflict'
+        except Exception:
+            return 'rejected'
+
+        return 'purchased'
+
+
+async def main() -> None:
+    mapper = registry()
+    members_registry_mapper(mapper)
+    entries_registry_mapper(mapper)
+    operations_registry_mapper(mapper)
+    cards_registry_mapper(mapper)
+    deals_registry_mapper(mapper)
+
+    engine = create_async_engine(
+        os.environ['DATABASE_URL'], 
+        pool_size=50, 
+        max_overflow=0
+    )
+    try:
+        for cards_repository_class in (LockingCardsRepository, SQLAlchemyCardsRepository):
+            async with engine.begin() as connection:
+                await connection.run_sync(sqlalchemy_metadata.drop_all)
+                await connection.run_sync(sqlalchemy_metadata.create_all)
+
+            card_id, buyers = await seed(engine)
+            started_at = time.perf_counter()
+            outcomes = await asyncio.gather(*[
+                buy(engine, cards_repository_class, card_id, buyer_id)
+                for buyer_id in buyers
+            ])
+            elapsed = time.perf_counter() - started_at
+            print(
+                f'{cards_repository_class.__name__:<26} '
+                f'{elapsed * 1e3:8.1f}ms total '
+                f'purchased={outcomes.count("purchased")} '
+                f'conflict={outcomes.count("conflict")} '
+                f'rejected={outcomes.count("rejected")}'
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(sqlalchemy_metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from bench_catalog_search import ITERATIONS, SCENARIOS, seed
+from marketgram.trade.port.adapter.catalog_index import CatalogIndex
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog_index_loader import (
+    SQLAlchemyCatalogIndexLoader
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+
+MEMORY_BUDGET = int(os.environ.get('CATALOG_INDEX_BUDGET', 2 * 1024 * 1024 * 1024))
+
+
+def percentiles(latencies: list[float]) -> str:
+    points = statistics.quantiles(latencies, n=100)
+
+    return f'p50={points[49] * 1e3:8.2f}ms p99={points[98] * 1e3:8.2f}ms'
+
+
+async def sql_latencies(engine, catalog_filter) -> list[float]:
+    latencies = []
+    async with AsyncSession(engine) as session:
+        catalog = SQLAlchemyCatalog(session)
+        for _ in range(ITERATIONS):
+            started_at = time.perf_counter()
+            await catalog.cards(catalog_filter)
+            await catalog.facets(catalog_filter)
+            latencies.append(time.perf_counter() - started_at)
+
+    return latencies
+
+
+def index_latencies(index: CatalogIndex, catalog_filter) -> list[float]:
+    latencies = []
+    for _ in range(ITERATIONS):
+        started_at = time.perf_counter()
+        index.search(
+            catalog_filter.query,
+            catalog_filter.region,
+            catalog_filter.account_format,
+            catalog_filter.spam_block,
+            catalog_filter.min_price,
+            catalog_filter.max_price
+        )
+        index.facets(
+            catalog_filter.query,
+            catalog_filter.region,
+            catalog_filter.account_format,
+            catalog_filter.spam_block
+        )
+        latencies.append(time.perf_counter() - started_at)
+
+    return latencies
+
+
+async def main() -> None:
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    try:
+        await seed(engine)
+        async with engine.begin() as connection:
+            await connection.run_sync(outbox_table.create, checkfirst=True)
+
+        index = CatalogIndex(MEMORY_BUDGET)
+        loader = SQLAlchemyCatalogIndexLoader(
+            async_sessionmaker(engine, expire_on_commit=False), 
+            index
+        )
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        await loader.load()
+        elapsed = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f'index loaded {index.size} cards in {elapsed:.1f}s '
+            f'estimated={index.memory_usage() / 2**20:.0f}MiB '
+            f'peak={peak / 2**20:.0f}MiB complete={index.is_complete}'
+        )
+
+        for name, catalog_filter in SCENARIOS.items():
+            print(f'{name:<14} sql   {percentiles(await sql_latencies(engine, catalog_filter))}')
+            print(f'{name:<14} index {percentiles(index_latencies(index, catalog_filter))}')
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(cards_table.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import statistics
+import time
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    CatalogFilter,
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+
+CARDS = int(os.environ.get('CATALOG_CARDS', 1_000_000))
+ITERATIONS = 200
+WORDS = [
+    'telegram', 'premium', 'aged', 'account', 'verified', 'business', 'stars',
+    'channel', 'bot', 'phone', 'session', 'tdata', 'fresh', 'warmed', 'rare'
+]
+SCENARIOS = {
+    'browse': CatalogFilter(),
+    'region+format': CatalogFilter(
+        region=Region.Europe, 
+        account_format=AccountFormat.Autoreg
+    ),
+    'price range': CatalogFilter(
+        min_price=Decimal('150'), 
+        max_price=Decimal('160')
+    ),
+    'text common': CatalogFilter('telegram account'),
+    'text rare': CatalogFilter('rare warmed tdata'),
+    'text+facets': CatalogFilter('premium', region=Region.Asia, spam_block=False),
+}
+
+
+async def seed(engine) -> None:
+    owner_id = uuid4()
+    regions = "ARRAY[{}]".format(', '.join(f"'{region}'" for region in Region))
+    words = "ARRAY[{}]".format(', '.join(f"'{word}'" for word in WORDS))
+    async with engine.begin() as connection:
+        await connection.run_sync(cards_table.drop, checkfirst=True)
+        await connection.run_sync(members_table.create, checkfirst=True)
+        await connection.run_sync(cards_table.create)
+        await connection.execute(
+            insert(members_table).values(user_id=owner_id, is_blocked=False)
+        )
+        await connection.execute(text(
+            f"""
+            INSERT INTO cards (
+                owner_id, price, title, text_description, account_format, 
+                region, spam_block, format, method, min_price, min_discount, 
+                created_at, is_archived, is_purchased, version_id
+            )
+            SELECT
+                :owner_id,
+                round((50 + random() * 950)::numeric, 2),
+                {words}[1 + n % 15] || ' ' || {words}[1 + (n / 15) % 15],
+                {words}[1 + (n / 7) % 15] || ' ' || {words}[1 + (n / 225) % 15] 
+                    || ' ' || {words}[1 + (n / 3375) % 15],
+                'autoreg',
+                {regions}[1 + n % 6],
+                n % 4 = 0,
+                'login_code',
+                'provides_seller',
+                50,
+                0.1,
+                now() - (n % 1000) * interval '1 minute',
+                n % 50 = 0,
+                n % 20 = 0,
+                1
+            FROM generate_series(1, :cards) AS n
+            """
+        ), {'owner_id': owner_id, 'cards': CARDS})
+        await connection.execute(text('ANALYZE cards'))
+
+
+async def measure(engine, catalog_filter: CatalogFilter) -> list[float]:
+    latencies = []
+    async with AsyncSession(engine) as session:
+        catalog = SQLAlchemyCatalog(session)
+        for _ in range(ITERATIONS):
+            started_at = time.perf_counter()
+            rows = await catalog.cards(catalog_filter)
+            await catalog.facets(catalog_filter)
+            if rows:
+                await catalog.cards(
+                    catalog_filter, 
+                    (rows[-1].price, rows[-1].card_id)
+                )
+            latencies.append(time.perf_counter() - started_at)
+
+    return latencies
+
+
+async def main() -> None:
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    try:
+        started_at = time.perf_counter()
+        await seed(engine)
+        print(f'seeded {CARDS} cards in {time.perf_counter() - started_at:.1f}s')
+
+        for name, catalog_filter in SCENARIOS.items():
+            latencies = await measure(engine, catalog_filter)
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(
+                f'{name:<14} p50={percentiles[49] * 1e3:8.2f}ms '
+                f'p99={percentiles[98] * 1e3:8.2f}ms'
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(cards_table.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
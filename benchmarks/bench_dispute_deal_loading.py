@@ -0,0 +1,182 @@
+import asyncio
+import os
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import and_, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import registry
+
+from marketgram.trade.domain.model.p2p.deal.dispute_deal import DisputeDeal
+from marketgram.trade.domain.model.p2p.members import Members
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.p2p.type_deal import TypeDeal
+from marketgram.trade.port.adapter.sqlalchemy_resources.deals_repository import (
+    SQLAlchemyDealsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_registry import (
+    cards_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_registry import (
+    deals_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
+    deals_members_table,
+    deals_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_registry import (
+    entries_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_registry import (
+    members_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_registry import (
+    operations_registry_mapper
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_table import (
+    operations_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.operations_mapper import (
+    SQLAlchemyOperationsMapper
+)
+
+DEALS = 200
+ROUNDS = 5
+
+
+async def two_round_trips(session: AsyncSession, buyer_id, deal_id) -> DisputeDeal:
+    result = await session.execute(
+        select(DisputeDeal)
+        .join(Members)
+        .where(and_(
+            deals_table.c.deal_id == deal_id,
+            Members.buyer_id == buyer_id
+        ))
+    )
+    deal = result.unique().scalar()
+    payout = await SQLAlchemyOperationsMapper(session) \
+        .payout_with_seller_id(deal.seller_id)
+    deal.add_payout(payout)
+
+    return deal
+
+
+async def one_statement(session: AsyncSession, buyer_id, deal_id) -> DisputeDeal:
+    return await SQLAlchemyDealsRepository(session) \
+        .not_disputed_with_id(buyer_id, deal_id)
+
+
+async def seed(engine) -> list[tuple]:
+    deals = []
+    async with AsyncSession(engine) as session:
+        await session.begin()
+        for _ in range(DEALS):
+            seller_id, buyer_id = uuid4(), uuid4()
+            await session.execute(
+                insert(members_table),
+                [
+                    {'user_id': seller_id, 'is_blocked': False},
+                    {'user_id': buyer_id, 'is_blocked': False}
+                ]
+            )
+            card_id = await session.scalar(
+                insert(cards_table)
+                .values(
+                    owner_id=seller_id, price=200, title='card',
+                    text_description='card', account_format='autoreg',
+                    region='random', spam_block=False, format='login_code',
+                    method='provides_seller', min_price=100,
+                    min_discount=0.1, created_at=datetime.now(),
+                    is_archived=False, is_purchased=False,
+                    version_id=1
+                )
+                .returning(cards_table.c.card_id)
+            )
+            created_at = datetime.now(UTC) - timedelta(hours=2)
+            deal_id = await session.scalar(
+                insert(deals_table)
+                .values(
+                    card_id=card_id, qty_purchased=1,
+                    type=TypeDeal.PROVIDING_CODE,
+                    card_created_at=datetime.now(), price=200,
+                    created_at=created_at, shipped_at=created_at,
+                    received_at=created_at, shipping_hours=1,
+                    receipt_hours=1, check_hours=24,
+                    status=StatusDeal.CHECK, is_disputed=False
+                )
+                .returning(deals_table.c.deal_id)
+            )
+            await session.execute(
+                insert(deals_members_table)
+                .values(deal_id=deal_id, seller_id=seller_id, buyer_id=buyer_id)
+            )
+            await session.execute(
+                insert(operations_table)
+                .values(
+                    operation_id=uuid4(), user_id=seller_id, amount=150,
+                    created_at=datetime.now(), is_processed=False,
+                    is_blocked=False, count_block=0,
+                    paycard_synonym='card', type='payout'
+                )
+            )
+            deals.append((buyer_id, deal_id))
+        await session.commit()
+
+    return deals
+
+
+async def measure(engine, loader, deals) -> list[float]:
+    latencies = []
+    for _ in range(ROUNDS):
+        for buyer_id, deal_id in deals:
+            async with AsyncSession(engine) as session:
+                await session.begin()
+                started_at = time.perf_counter()
+                await loader(session, buyer_id, deal_id)
+                latencies.append(time.perf_counter() - started_at)
+                await session.rollback()
+
+    return latencies
+
+
+async def main() -> None:
+    mapper = registry()
+    members_registry_mapper(mapper)
+    entries_registry_mapper(mapper)
+    operations_registry_mapper(mapper)
+    cards_registry_mapper(mapper)
+    deals_registry_mapper(mapper)
+
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    async with engine.begin() as connection:
+        await connection.run_sync(sqlalchemy_metadata.drop_all)
+        await connection.run_sync(sqlalchemy_metadata.create_all)
+
+    try:
+        deals = await seed(engine)
+        for loader in (two_round_trips, one_statement):
+            latencies = sorted(await measure(engine, loader, deals))
+            print(
+                f'{loader.__name__:<16} '
+                f'p50={statistics.median(latencies) * 1e3:7.3f}ms '
+                f'p99={latencies[int(len(latencies) * 0.99)] * 1e3:7.3f}ms'
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(sqlalchemy_metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import time
+from email.message import EmailMessage
+
+from aiosmtplib import SMTP
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from marketgram.identity.access.port.adapter.email_outbox_relay import (
+    EmailOutboxRelay,
+    SMTPConnectionPool,
+    TokenBucket
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.email_outbox_table import (
+    email_outbox_table
+)
+from tests.integration.identity.access.fake_smtp_server import (
+    HOST,
+    FakeSMTPServer
+)
+
+MESSAGES = 500
+SMTP_LATENCY = 0.005
+
+
+def message(number: int) -> EmailMessage:
+    message = EmailMessage()
+    message['From'] = 'noreply@marketgram.ru'
+    message['To'] = f'user{number}@mail.ru'
+    message['Subject'] = 'Активация аккаунта'
+    message.set_content('<a href="https://marketgram.ru/activate">link</a>', subtype='html')
+
+    return message
+
+
+async def main() -> None:
+    smtp_server = FakeSMTPServer(SMTP_LATENCY)
+    port = await smtp_server.start()
+
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        for pool_size in (1, 4, 16):
+            async with engine.begin() as connection:
+                await connection.run_sync(email_outbox_table.drop, checkfirst=True)
+                await connection.run_sync(email_outbox_table.create)
+                await connection.execute(
+                    insert(email_outbox_table),
+                    [{'message': message(i).as_bytes()} for i in range(MESSAGES)]
+                )
+
+            connection_pool = SMTPConnectionPool(
+                lambda: SMTP(hostname=HOST, port=port, use_tls=False, start_tls=False),
+                pool_size
+            )
+            relay = EmailOutboxRelay(
+                session_factory,
+                connection_pool,
+                TokenBucket(rate=100_000),
+                batch_size=100
+            )
+            smtp_server.delivered.clear()
+
+            started_at = time.perf_counter()
+            while await relay.run_once():
+                pass
+            elapsed = time.perf_counter() - started_at
+            await connection_pool.close()
+
+            async with session_factory() as session:
+                pending = await session.scalar(
+                    select(func.count())
+                    .select_from(email_outbox_table)
+                    .where(email_outbox_table.c.sent_at.is_(None))
+                )
+
+            print(
+                f'pool_size={pool_size:<3} {MESSAGES / elapsed:8.1f} msg/s '
+                f'delivered={len(smtp_server.delivered)} pending={pending}'
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(email_outbox_table.drop, checkfirst=True)
+        await engine.dispose()
+        await smtp_server.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
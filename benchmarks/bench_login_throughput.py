@@ -0,0 +1,75 @@
+import asyncio
+import os
+import time
+from uuid import uuid4
+
+from marketgram.identity.access.domain.model.authentication_service import (
+    AuthenticationService
+)
+from marketgram.identity.access.domain.model.user import User
+from marketgram.identity.access.port.adapter.argon2_password_hasher import (
+    Argon2PasswordHasher
+)
+from marketgram.identity.access.port.adapter.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher
+)
+
+LOGINS = 64
+PASSWORD = 'protected'
+PARAMETERS = {'time_cost': 2, 'memory_cost': 19 * 1024, 'parallelism': 1}
+
+
+async def loop_lag(stopped: asyncio.Event, lags: list[float]) -> None:
+    while not stopped.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started_at - 0.001)
+
+
+async def run(password_hasher, user: User, concurrency: int) -> tuple[float, float]:
+    service = AuthenticationService(password_hasher)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with slots:
+            await service.authenticate(user, PASSWORD)
+
+    stopped = asyncio.Event()
+    lags = []
+    ticker = asyncio.create_task(loop_lag(stopped, lags))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(LOGINS)])
+    elapsed = time.perf_counter() - started_at
+
+    stopped.set()
+    await ticker
+
+    return LOGINS / elapsed, max(lags, default=0.0)
+
+
+async def main() -> None:
+    inline = Argon2PasswordHasher(**PARAMETERS)
+    pool = ProcessPoolPasswordHasher(
+        max_workers=os.cpu_count(),
+        max_pending=LOGINS,
+        **PARAMETERS
+    )
+    user = User(uuid4(), 'test@mail.ru', await inline.hash(PASSWORD), True)
+    await pool.verify(user.password, PASSWORD)
+
+    try:
+        for name, password_hasher in (('inline', inline), ('process_pool', pool)):
+            for concurrency in (1, 4, 16):
+                throughput, lag = await run(password_hasher, user, concurrency)
+                print(
+                    f'{name:<13} concurrency={concurrency:<3} '
+                    f'{throughput:8.1f} logins/s '
+                    f'max loop lag={lag * 1e3:7.1f}ms'
+                )
+    finally:
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+import timeit
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+from marketgram.trade.domain.model.rule.agreement.money import Currency, Money
+
+
+@dataclass(frozen=True, order=True)
+class DecimalMoney:
+    number: str
+    currency = Currency.RUB
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, 
+            'number', 
+            Decimal(str(self.number)).quantize(Decimal('0.01'), ROUND_HALF_EVEN)
+        )
+
+    def round_up(self) -> 'DecimalMoney':
+        return DecimalMoney(self.number.quantize(Decimal('1'), ROUND_HALF_UP))
+
+    def __mul__(self, value: int | Decimal) -> 'DecimalMoney':
+        return DecimalMoney(
+            self.number 
+            * Decimal(str(value)).quantize(Decimal('0.01'), ROUND_HALF_EVEN)
+        )
+
+    def __sub__(self, value: 'DecimalMoney') -> 'DecimalMoney':
+        return DecimalMoney(self.number - value.number)
+
+    def __add__(self, value: 'DecimalMoney') -> 'DecimalMoney':
+        return DecimalMoney(self.number + value.number)
+
+    def __neg__(self) -> 'DecimalMoney':
+        return DecimalMoney(-self.number)
+
+
+def scenario(cls) -> None:
+    balance = cls('15000.00')
+    price = cls('1999.90')
+    fee = Decimal('0.05')
+
+    for _ in range(20):
+        amount = price * 2
+        commission = (amount * fee).round_up()
+        if balance < amount + commission:
+            balance = balance + cls(10000)
+        balance = balance - amount - commission
+        balance += -(-commission)
+
+
+def main() -> None:
+    for cls in (DecimalMoney, Money):
+        timer = timeit.Timer(lambda: scenario(cls))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f'{cls.__name__:<14} {best * 1e6:10.2f} us/scenario')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import time
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from marketgram.trade.domain.model.events import DealShipped
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.port.adapter.event_dispatcher import (
+    EventDispatcher,
+    OutboxMessage
+)
+from marketgram.trade.port.adapter.outbox_relay import OutboxRelay
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.outbox_writer import (
+    outbox_row
+)
+
+EVENTS = 20_000
+AGGREGATES = 500
+
+
+async def seed(engine) -> None:
+    occurred_at = datetime.now(UTC)
+    rows = [
+        outbox_row(DealShipped(number % AGGREGATES, occurred_at, StatusDeal.CHECK))
+        for number in range(EVENTS)
+    ]
+    async with engine.begin() as connection:
+        await connection.run_sync(outbox_table.drop, checkfirst=True)
+        await connection.run_sync(outbox_table.create)
+        await connection.execute(insert(outbox_table), rows)
+
+
+async def main() -> None:
+    engine = create_async_engine(os.environ['DATABASE_URL'])
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        for batch_size in (100, 500, 2000):
+            await seed(engine)
+
+            delivered = 0
+
+            async def subscriber(message: OutboxMessage) -> None:
+                nonlocal delivered
+                delivered += 1
+                await asyncio.sleep(0)
+
+            dispatcher = EventDispatcher()
+            dispatcher.subscribe(DealShipped, subscriber)
+            relay = OutboxRelay(session_factory, dispatcher, batch_size)
+
+            started_at = time.perf_counter()
+            while await relay.run_once():
+                pass
+            elapsed = time.perf_counter() - started_at
+
+            print(
+                f'batch_size={batch_size:<5} {EVENTS / elapsed:10.1f} events/s '
+                f'delivered={delivered} batches={relay.metrics.batches}'
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(outbox_table.drop, checkfirst=True)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+import random
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from marketgram.trade.domain.model.rule.agreement.limits import Limits
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.rule.agreement.temporal_collection import (
+    TemporalCollection
+)
+
+
+class LinearTemporalCollection:
+    def __init__(self):
+        self._contents = {}
+        self._cache: list[date] = None
+
+    def get(self, date: date):
+        for milestone in self._milestone():
+            if milestone <= date:
+                return self._contents.get(milestone)
+            
+        raise ValueError
+
+    def put(self, date_from: date, limit: Limits):
+        self._contents[date_from] = limit
+        self._cache = None
+
+    def _milestone(self):
+        if self._cache is None:
+            self._cache = sorted(self._contents, reverse=True)
+        
+        return self._cache
+
+
+def fill(collection, versions: int, start: datetime) -> None:
+    for day in range(versions):
+        install_date = start + timedelta(days=day)
+        collection.put(
+            install_date.date(),
+            Limits(
+                Money(100),
+                Money(100),
+                Money(100),
+                Decimal('0.1'),
+                Decimal('0.1'),
+                Decimal('0.1'),
+                install_date
+            )
+        )
+
+
+def main() -> None:
+    start = datetime(2020, 1, 1)
+    random.seed(1)
+
+    for versions in (10, 100, 500, 1000):
+        lookups = [
+            (start + timedelta(days=random.randrange(versions))).date()
+            for _ in range(1000)
+        ]
+        lookups_today = [(start + timedelta(days=versions)).date()] * 1000
+
+        for cls in (LinearTemporalCollection, TemporalCollection):
+            collection = cls()
+            fill(collection, versions, start)
+
+            for name, dates in (('history', lookups), ('today', lookups_today)):
+                timer = timeit.Timer(lambda: [collection.get(d) for d in dates])
+                number, _ = timer.autorange()
+                best = min(timer.repeat(repeat=5, number=number)) / number
+                print(
+                    f'{cls.__name__:<26} versions={versions:<5} '
+                    f'{name:<8} {best / len(dates) * 1e9:10.1f} ns/get'
+                )
+
+
+if __name__ == '__main__':
+    main()
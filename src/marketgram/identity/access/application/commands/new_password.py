@@ -14,6 +14,9 @@ from marketgram.identity.access.port.adapter.sqlalchemy_resources.users_reposito
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.web_sessions_repository import (
     WebSessionsRepository
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 
 
 @dataclass
@@ -27,11 +30,15 @@ class NewPasswordHandler:
         self, 
         context: IAMContext,
         jwt_manager: JwtTokenManager,
-        password_hasher: PasswordHasher
+        password_hasher: PasswordHasher,
+        web_sessions_cache: WebSessionsCache
     ) -> None:
         self._context = context
         self._users_repository = UsersRepository(context)
-        self._web_sessions_repository = WebSessionsRepository(context)
+        self._web_sessions_repository = WebSessionsRepository(
+            context, 
+            web_sessions_cache
+        )
         self._jwt_manager = jwt_manager
         self._password_hasher = password_hasher
     
@@ -43,7 +50,7 @@ class NewPasswordHandler:
         if user is None:
             raise ApplicationError()
         
-        user.change_password(command.password, self._password_hasher)
+        await user.change_password(command.password, self._password_hasher)
 
         await self._web_sessions_repository \
             .delete_all_with_user_id(user.user_id)
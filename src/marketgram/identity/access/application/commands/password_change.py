@@ -18,6 +18,9 @@ from marketgram.identity.access.port.adapter.sqlalchemy_resources.users_reposito
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.web_sessions_repository import (
     WebSessionsRepository
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 
 
 @dataclass
@@ -31,11 +34,15 @@ class PasswordChangeHandler:
     def __init__(
         self,
         context: IAMContext,
-        password_hasher: PasswordHasher
+        password_hasher: PasswordHasher,
+        web_sessions_cache: WebSessionsCache
     ) -> None:
         self._context = context
         self._users_repository = UsersRepository(context)
-        self._web_sessions_repository = WebSessionsRepository(context)
+        self._web_sessions_repository = WebSessionsRepository(
+            context, 
+            web_sessions_cache
+        )
         self._password_hasher = password_hasher
 
     async def execute(self, command: PasswordChangeCommand) -> None:
@@ -47,10 +54,10 @@ class PasswordChangeHandler:
         
         user = await self._users_repository.with_id(web_session.user_id)
 
-        AuthenticationService(self._password_hasher) \
+        await AuthenticationService(self._password_hasher) \
             .authenticate(user, command.old_password)
 
-        user.change_password(command.new_password, self._password_hasher)
+        await user.change_password(command.new_password, self._password_hasher)
 
         await self._web_sessions_repository \
             .delete_all_with_user_id(user.user_id)
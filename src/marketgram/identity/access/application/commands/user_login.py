@@ -6,6 +6,9 @@ from marketgram.identity.access.domain.model.authentication_service import (
     AuthenticationService
 )
 from marketgram.identity.access.domain.model.password_hasher import PasswordHasher
+from marketgram.identity.access.domain.model.password_rehasher import (
+    PasswordRehasher
+)
 from marketgram.identity.access.domain.model.web_session_factory import (
     WebSessionFactory
 )
@@ -18,6 +21,9 @@ from marketgram.identity.access.port.adapter.sqlalchemy_resources.users_reposito
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.web_sessions_repository import (
     WebSessionsRepository
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 
 
 @dataclass
@@ -32,19 +38,30 @@ class UserLoginHandler:
         self,
         context: IAMContext,
         password_hasher: PasswordHasher,
+        web_sessions_cache: WebSessionsCache,
+        password_rehasher: PasswordRehasher
     ) -> None:
         self._context = context
         self._users_repository = UsersRepository(context)
-        self._web_sessions_repository = WebSessionsRepository(context)
+        self._web_sessions_repository = WebSessionsRepository(
+            context, 
+            web_sessions_cache
+        )
         self._password_hasher = password_hasher
+        self._password_rehasher = password_rehasher
         
     async def execute(self, command: UserLoginCommand) -> dict[str, str]:
         user = await self._users_repository.with_email(command.email)
         if user is None:
             raise ApplicationError()
         
-        AuthenticationService(self._password_hasher) \
-            .authenticate(user, command.password)
+        authentication_service = AuthenticationService(self._password_hasher)
+        await authentication_service.authenticate(user, command.password)
+
+        if authentication_service.needs_rehash(user):
+            self._password_rehasher.schedule(
+                user.user_id, user.password, command.password
+            )
         
         await self._web_sessions_repository \
             .delete_this_device(user.user_id, command.device)       
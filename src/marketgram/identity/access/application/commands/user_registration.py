@@ -48,7 +48,7 @@ class UserRegistrationHandler:
         if user is not None:
             raise ApplicationError()
         
-        user = UserFactory(self._password_hasher) \
+        user = await UserFactory(self._password_hasher) \
             .create(command.email, command.password)
         role = Role(user.user_id, Permission.USER)
     
@@ -15,12 +15,12 @@ class AuthenticationService:
     ) -> None:
         self._password_hasher = password_hasher
     
-    def authenticate(self, user: User, plain_password: str) -> None:
+    async def authenticate(self, user: User, plain_password: str) -> None:
         if not user.is_active:
             raise PersonalDataError(INVALID_EMAIL_OR_PASSWORD)
         
-        if not self._password_hasher.verify(user.password, plain_password):
+        if not await self._password_hasher.verify(user.password, plain_password):
             raise PersonalDataError(INVALID_EMAIL_OR_PASSWORD)
 
-        if self._password_hasher.check_needs_rehash(user.password):
-            user.change_password(plain_password, self._password_hasher)
\ No newline at end of file
+    def needs_rehash(self, user: User) -> bool:
+        return self._password_hasher.check_needs_rehash(user.password)
\ No newline at end of file
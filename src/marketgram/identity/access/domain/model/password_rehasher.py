@@ -0,0 +1,12 @@
+from typing import Protocol
+from uuid import UUID
+
+
+class PasswordRehasher(Protocol):
+    def schedule(
+        self, 
+        user_id: UUID, 
+        current_hash: str, 
+        plain_password: str
+    ) -> None:
+        raise NotImplementedError
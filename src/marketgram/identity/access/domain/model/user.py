@@ -22,7 +22,7 @@ class User:
         self._password = password
         self._is_active = is_active
 
-    def change_password(
+    async def change_password(
         self,
         password: str,
         password_hasher: PasswordHasher
@@ -33,7 +33,7 @@ class User:
         if password == self._email:
             raise PersonalDataError(INVALID_EMAIL_OR_PASSWORD)
         
-        self._password = password_hasher.hash(password)
+        self._password = await password_hasher.hash(password)
 
     def activate(self) -> None:
         self._is_active = True
@@ -18,12 +18,12 @@ class UserFactory:
     ) -> None:
         self._password_hasher = password_hasher
 
-    def create(self, email: str, password: str) -> User:
+    async def create(self, email: str, password: str) -> User:
         if email == password:
             raise PersonalDataError(INVALID_EMAIL_OR_PASSWORD)
 
         return User(
             uuid4(),
             email.lower(),
-            self._password_hasher.hash(password)
+            await self._password_hasher.hash(password)
         )
\ No newline at end of file
@@ -1,18 +1,34 @@
-from typing import AsyncGenerator
+from typing import AsyncIterator, Iterator
 
 from dishka import Provider, Scope, alias, provide, provide_all
-from aiosmtplib import SMTP
 from jinja2 import Environment
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
 from marketgram.common.application.email_sender import EmailSender
 from marketgram.common.application.message_renderer import MessageRenderer
 from marketgram.identity.access.domain.model.password_hasher import (
     PasswordHasher
 )
-from marketgram.identity.access.port.adapter.argon2_password_hasher import (
-    Argon2PasswordHasher
+from marketgram.identity.access.domain.model.password_rehasher import (
+    PasswordRehasher
+)
+from marketgram.identity.access.port.adapter.background_password_rehasher import (
+    BackgroundPasswordRehasher
+)
+from marketgram.identity.access.port.adapter.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher
 )
 from marketgram.identity.access.port.adapter.html_renderers import JwtTokenHtmlRenderer
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.outbox_email_sender import (
+    OutboxEmailSender
+)
+from marketgram.identity.access.port.adapter.notification_listener import (
+    NotificationListener
+)
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    INVALIDATION_CHANNEL,
+    WebSessionsCache
+)
 from marketgram.identity.access.settings import (
     Settings, 
     identity_access_load_settings
@@ -52,31 +68,63 @@ class IdentityAccessIoC(Provider):
     def settings(self) -> Settings:
         return identity_access_load_settings()
 
+    email_sender = provide(OutboxEmailSender, provides=EmailSender)
+
     @provide(scope=Scope.APP)
-    async def email_client(self, settings: Settings) -> AsyncGenerator[SMTP]:
-        email_settings = settings.for_email_client()
-
-        client = SMTP(
-            hostname=email_settings.hostname, 
-            port=email_settings.port,
-            username=email_settings.username,
-            password=email_settings.password,
-            validate_certs=email_settings.validate_certs
+    def password_hasher(
+        self, 
+        settings: Settings
+    ) -> Iterator[ProcessPoolPasswordHasher]:
+        hasher_settings = settings.password_hasher
+
+        hasher = ProcessPoolPasswordHasher(
+            max_workers=hasher_settings.max_workers,
+            max_pending=hasher_settings.max_pending,
+            time_cost=hasher_settings.time_cost,
+            memory_cost=hasher_settings.memory_cost,
+            parallelism=hasher_settings.parallelism
         )
-        async with client:
-            yield client  
+        yield hasher
 
-    a_smtp = alias(source=SMTP, provides=EmailSender) 
+        hasher.shutdown()
+    
+    a_ph = alias(ProcessPoolPasswordHasher, provides=PasswordHasher)
 
-    @provide
-    def password_hasher(self) -> Argon2PasswordHasher:
-        return Argon2PasswordHasher(
-            time_cost=2,
-            memory_cost=19 * 1024,
-            parallelism=1
+    @provide(scope=Scope.APP)
+    async def password_rehasher(
+        self, 
+        engine: AsyncEngine,
+        password_hasher: PasswordHasher
+    ) -> AsyncIterator[BackgroundPasswordRehasher]:
+        rehasher = BackgroundPasswordRehasher(
+            async_sessionmaker(engine, expire_on_commit=False),
+            password_hasher
         )
-    
-    a_ph = alias(Argon2PasswordHasher, provides=PasswordHasher)
+        rehasher.start()
+        yield rehasher
+
+        await rehasher.stop()
+
+    a_prh = alias(BackgroundPasswordRehasher, provides=PasswordRehasher)
+
+    @provide(scope=Scope.APP)
+    async def web_sessions_cache(
+        self, 
+        settings: Settings
+    ) -> AsyncIterator[WebSessionsCache]:
+        cache_settings = settings.web_sessions_cache
+
+        cache = WebSessionsCache(cache_settings.max_size, cache_settings.ttl)
+        listener = NotificationListener(
+            cache_settings.listen_conninfo, 
+            INVALIDATION_CHANNEL,
+            cache.apply_notification,
+            cache.clear
+        )
+        listener.start()
+        yield cache
+
+        await listener.stop()
 
     @provide
     def jwt_manager(self, settings: Settings) -> JwtTokenManager:
@@ -0,0 +1,155 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from argon2.low_level import Type, hash_secret_raw
+
+MIN_MEMORY_COST = 7 * 1024
+MAX_TIME_COST = 10
+SALT = b'marketgram-calibration'
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+    def to_env(self) -> dict[str, str]:
+        return {
+            'ARGON2_TIME_COST': str(self.time_cost),
+            'ARGON2_MEMORY_COST': str(self.memory_cost),
+            'ARGON2_PARALLELISM': str(self.parallelism)
+        }
+
+
+def hash_once(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    started_at = time.perf_counter()
+    hash_secret_raw(
+        b'calibration-password',
+        SALT,
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=32,
+        type=Type.ID
+    )
+    return time.perf_counter() - started_at
+
+
+def concurrent_latency(
+    executor: ProcessPoolExecutor,
+    parameters: Argon2Parameters,
+    concurrency: int,
+    rounds: int
+) -> float:
+    latencies = []
+    for _ in range(rounds):
+        futures = [
+            executor.submit(
+                hash_once,
+                parameters.time_cost,
+                parameters.memory_cost,
+                parameters.parallelism
+            )
+            for _ in range(concurrency)
+        ]
+        latencies.extend(future.result() for future in futures)
+
+    return statistics.median(latencies)
+
+
+def calibrate(
+    measure: Callable[[Argon2Parameters], float],
+    target_latency: float,
+    memory_budget: int,
+    concurrency: int,
+    parallelism: int = 1
+) -> Argon2Parameters:
+    memory_cost = max(MIN_MEMORY_COST, memory_budget // concurrency)
+
+    while True:
+        chosen = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            parameters = Argon2Parameters(time_cost, memory_cost, parallelism)
+            if measure(parameters) > target_latency:
+                break
+
+            chosen = parameters
+
+        if chosen is not None or memory_cost <= MIN_MEMORY_COST:
+            return chosen or Argon2Parameters(1, memory_cost, parallelism)
+
+        memory_cost = max(MIN_MEMORY_COST, memory_cost // 2)
+
+
+def update_env_file(path: Path, values: dict[str, str]) -> None:
+    lines = path.read_text().splitlines() if path.exists() else []
+    remaining = dict(values)
+
+    for number, line in enumerate(lines):
+        key = line.split('=', 1)[0].strip()
+        if key in remaining:
+            lines[number] = f'{key}={remaining.pop(key)}'
+
+    lines.extend(f'{key}={value}' for key, value in remaining.items())
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            'Pick Argon2 parameters for this host and print them as '
+            'ARGON2_* variables. The settings read them only from the '
+            'process environment, so the deployment must export them.'
+        )
+    )
+    parser.add_argument('--target-ms', type=float, default=250.0)
+    parser.add_argument('--memory-budget-mb', type=int, default=1024)
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count())
+    parser.add_argument('--parallelism', type=int, default=1)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument(
+        '--env-file', 
+        type=Path, 
+        help='also merge the variables into this file for the deployment to source'
+    )
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=args.concurrency) as executor:
+        def measure(parameters: Argon2Parameters) -> float:
+            latency = concurrent_latency(
+                executor, parameters, args.concurrency, args.rounds
+            )
+            print(
+                f't={parameters.time_cost} m={parameters.memory_cost}KiB '
+                f'p={parameters.parallelism}: {latency * 1e3:.1f}ms',
+                file=sys.stderr
+            )
+            return latency
+
+        parameters = calibrate(
+            measure,
+            args.target_ms / 1e3,
+            args.memory_budget_mb * 1024,
+            args.concurrency,
+            args.parallelism
+        )
+
+    print(f'Chosen {parameters}', file=sys.stderr)
+    for key, value in parameters.to_env().items():
+        print(f'{key}={value}')
+
+    if args.env_file is not None:
+        update_env_file(args.env_file, parameters.to_env())
+        print(f'Written to {args.env_file}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
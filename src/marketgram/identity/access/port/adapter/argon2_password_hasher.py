@@ -1,10 +1,33 @@
-from argon2 import PasswordHasher
+from argon2 import (
+    DEFAULT_MEMORY_COST,
+    DEFAULT_PARALLELISM,
+    DEFAULT_TIME_COST,
+    PasswordHasher
+)
 from argon2.exceptions import VerifyMismatchError
 
 
-class Argon2PasswordHasher(PasswordHasher):
-    def verify(self, hash: str, password: str) -> bool:
+class Argon2PasswordHasher:
+    def __init__(
+        self,
+        time_cost: int = DEFAULT_TIME_COST,
+        memory_cost: int = DEFAULT_MEMORY_COST,
+        parallelism: int = DEFAULT_PARALLELISM
+    ) -> None:
+        self._hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism
+        )
+
+    async def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    async def verify(self, hash: str, password: str) -> bool:
         try:
-            return super().verify(hash, password)
+            return self._hasher.verify(hash, password)
         except VerifyMismatchError:
-            return False
\ No newline at end of file
+            return False
+
+    def check_needs_rehash(self, hash: str) -> bool:
+        return self._hasher.check_needs_rehash(hash)
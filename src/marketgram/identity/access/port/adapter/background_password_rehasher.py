@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import and_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.identity.access.domain.model.password_hasher import (
+    PasswordHasher
+)
+from marketgram.identity.access.port.adapter.errors import (
+    PasswordHasherOverloadError
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.users_table import (
+    user_table
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _RehashTask:
+    user_id: UUID
+    current_hash: str
+    plain_password: str | None
+
+
+@dataclass
+class PasswordRehashMetrics:
+    rehashed: int = 0
+    conflicts: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+class BackgroundPasswordRehasher:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        password_hasher: PasswordHasher,
+        max_queued: int = 100,
+        metrics: PasswordRehashMetrics = None
+    ) -> None:
+        if max_queued < 1:
+            raise ValueError('max_queued must be positive')
+
+        self._session_factory = session_factory
+        self._password_hasher = password_hasher
+        self._queue: asyncio.Queue[_RehashTask] = asyncio.Queue(max_queued)
+        self._metrics = metrics or PasswordRehashMetrics()
+        self._pending: set[UUID] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def metrics(self) -> PasswordRehashMetrics:
+        return self._metrics
+
+    def schedule(
+        self, 
+        user_id: UUID, 
+        current_hash: str, 
+        plain_password: str
+    ) -> None:
+        if user_id in self._pending:
+            return
+
+        try:
+            self._queue.put_nowait(
+                _RehashTask(user_id, current_hash, plain_password)
+            )
+        except asyncio.QueueFull:
+            self._metrics.dropped += 1
+            return
+
+        self._pending.add(user_id)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        while not self._queue.empty():
+            task = self._queue.get_nowait()
+            task.plain_password = None
+            self._pending.discard(task.user_id)
+            self._metrics.dropped += 1
+            self._queue.task_done()
+
+    async def _run(self) -> None:
+        while True:
+            task = await self._queue.get()
+            try:
+                await self._rehash(task)
+            except PasswordHasherOverloadError:
+                self._metrics.dropped += 1
+            except Exception:
+                self._metrics.failed += 1
+                logger.exception('Password rehash failed for %s', task.user_id)
+            finally:
+                task.plain_password = None
+                self._pending.discard(task.user_id)
+                self._queue.task_done()
+
+    async def _rehash(self, task: _RehashTask) -> None:
+        plain_password, task.plain_password = task.plain_password, None
+        new_hash = await self._password_hasher.hash(plain_password)
+        del plain_password
+
+        stmt = (
+            update(user_table)
+            .where(and_(
+                user_table.c.user_id == task.user_id,
+                user_table.c.password == task.current_hash
+            ))
+            .values(
+                password=new_hash,
+                version_id=user_table.c.version_id + 1
+            )
+        )
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(stmt)
+
+        if result.rowcount == 1:
+            self._metrics.rehashed += 1
+        else:
+            self._metrics.conflicts += 1
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import os
+import signal
+
+from aiosmtplib import SMTP
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from marketgram.identity.access.port.adapter.email_outbox_relay import (
+    EmailOutboxRelay,
+    SMTPConnectionPool,
+    TokenBucket
+)
+from marketgram.identity.access.settings import (
+    Settings,
+    identity_access_load_settings
+)
+
+
+async def run(database_url: str, settings: Settings) -> None:
+    email_settings = settings.for_email_client()
+    outbox_settings = settings.email_outbox
+
+    engine = create_async_engine(database_url)
+    connection_pool = SMTPConnectionPool(
+        lambda: SMTP(
+            hostname=email_settings.hostname,
+            port=email_settings.port,
+            username=email_settings.username,
+            password=email_settings.password,
+            validate_certs=email_settings.validate_certs
+        ),
+        outbox_settings.pool_size
+    )
+    relay = EmailOutboxRelay(
+        async_sessionmaker(engine, expire_on_commit=False),
+        connection_pool,
+        TokenBucket(outbox_settings.rate_per_second),
+        batch_size=outbox_settings.batch_size,
+        max_attempts=outbox_settings.max_attempts
+    )
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, relay.stop)
+
+    try:
+        await relay.run()
+    finally:
+        await connection_pool.close()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Deliver queued emails from the email_outbox table.'
+    )
+    parser.add_argument(
+        '--database-url',
+        default=os.environ.get('DATABASE_URL')
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.database_url, identity_access_load_settings()))
+
+
+if __name__ == '__main__':
+    main()
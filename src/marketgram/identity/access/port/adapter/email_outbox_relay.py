@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from email import policy
+from email.message import EmailMessage
+from email.parser import BytesParser
+from typing import AsyncIterator, Callable
+
+from aiosmtplib import (
+    SMTP,
+    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPResponseException
+)
+from sqlalchemy import Row, and_, bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.email_outbox_table import (
+    email_outbox_table
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    def __init__(
+        self,
+        client_factory: Callable[[], SMTP],
+        size: int
+    ) -> None:
+        self._client_factory = client_factory
+        self._slots = asyncio.Semaphore(size)
+        self._idle: asyncio.LifoQueue[SMTP] = asyncio.LifoQueue()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[SMTP]:
+        async with self._slots:
+            client = await self._take()
+            try:
+                yield client
+            except SMTPResponseException:
+                self._idle.put_nowait(client)
+                raise
+            except BaseException:
+                client.close()
+                raise
+
+            self._idle.put_nowait(client)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            client = self._idle.get_nowait()
+            try:
+                await client.quit()
+            except (SMTPException, OSError):
+                client.close()
+
+    async def _take(self) -> SMTP:
+        while not self._idle.empty():
+            client = self._idle.get_nowait()
+            if client.is_connected:
+                return client
+
+        client = self._client_factory()
+        await client.connect()
+
+        return client
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        self._rate = rate
+        self._capacity = capacity or rate
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+@dataclass
+class EmailOutboxMetrics:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+
+
+class EmailOutboxRelay:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        connection_pool: SMTPConnectionPool,
+        rate_limit: TokenBucket,
+        batch_size: int = 50,
+        max_attempts: int = 8,
+        lease: timedelta = timedelta(minutes=5),
+        base_backoff: float = 5.0,
+        max_backoff: float = 3600.0,
+        idle_interval: float = 1.0,
+        max_idle_backoff: float = 30.0,
+        metrics: EmailOutboxMetrics = None
+    ) -> None:
+        self._session_factory = session_factory
+        self._connection_pool = connection_pool
+        self._rate_limit = rate_limit
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._lease = lease
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._idle_interval = idle_interval
+        self._max_idle_backoff = max_idle_backoff
+        self._metrics = metrics or EmailOutboxMetrics()
+        self._parser = BytesParser(policy=policy.default)
+        self._stopped = asyncio.Event()
+
+    @property
+    def metrics(self) -> EmailOutboxMetrics:
+        return self._metrics
+
+    async def run(self) -> None:
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if await self.run_once():
+                    failures = 0
+                    continue
+
+                failures = 0
+                delay = self._idle_interval
+            except Exception:
+                logger.exception('Email outbox relay batch failed')
+                self._metrics.failed_batches += 1
+                failures += 1
+                delay = min(
+                    self._idle_interval * 2 ** failures, 
+                    self._max_idle_backoff
+                )
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run_once(self) -> int:
+        rows = await self._claim()
+        if not rows:
+            return 0
+
+        errors = await asyncio.gather(*[self._send(row) for row in rows])
+        await self._settle(rows, errors)
+        self._metrics.batches += 1
+
+        return len(rows)
+
+    async def _claim(self) -> list[Row]:
+        current_date = datetime.now(UTC)
+        pending = (
+            select(email_outbox_table.c.message_id)
+            .where(and_(
+                email_outbox_table.c.sent_at.is_(None),
+                email_outbox_table.c.failed_at.is_(None),
+                email_outbox_table.c.next_attempt_at <= current_date
+            ))
+            .order_by(email_outbox_table.c.next_attempt_at)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(email_outbox_table)
+            .where(email_outbox_table.c.message_id.in_(pending))
+            .values(
+                attempts=email_outbox_table.c.attempts + 1,
+                next_attempt_at=current_date + self._lease
+            )
+            .returning(
+                email_outbox_table.c.message_id,
+                email_outbox_table.c.message,
+                email_outbox_table.c.attempts
+            )
+        )
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(stmt)
+
+                return result.all()
+
+    async def _send(self, row: Row) -> Exception | None:
+        try:
+            message: EmailMessage = self._parser.parsebytes(row.message)
+            await self._rate_limit.acquire()
+            async with self._connection_pool.connection() as client:
+                await client.send_message(message)
+        except Exception as error:
+            return error
+
+        return None
+
+    async def _settle(
+        self,
+        rows: list[Row],
+        errors: list[Exception | None]
+    ) -> None:
+        current_date = datetime.now(UTC)
+        sent = []
+        failures = []
+
+        for row, error in zip(rows, errors):
+            if error is None:
+                sent.append(row.message_id)
+                continue
+
+            if self._is_permanent(error) or row.attempts >= self._max_attempts:
+                failures.append({
+                    'b_message_id': row.message_id,
+                    'b_next_attempt_at': current_date,
+                    'b_failed_at': current_date,
+                    'b_last_error': repr(error)
+                })
+                self._metrics.failed += 1
+            else:
+                failures.append({
+                    'b_message_id': row.message_id,
+                    'b_next_attempt_at': current_date + self._backoff(row.attempts),
+                    'b_failed_at': None,
+                    'b_last_error': repr(error)
+                })
+                self._metrics.retried += 1
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                if sent:
+                    await session.execute(
+                        update(email_outbox_table)
+                        .where(email_outbox_table.c.message_id.in_(sent))
+                        .values(sent_at=current_date, last_error=None)
+                    )
+                if failures:
+                    await session.execute(
+                        update(email_outbox_table)
+                        .where(
+                            email_outbox_table.c.message_id
+                            == bindparam('b_message_id')
+                        )
+                        .values(
+                            next_attempt_at=bindparam('b_next_attempt_at'),
+                            failed_at=bindparam('b_failed_at'),
+                            last_error=bindparam('b_last_error')
+                        ),
+                        failures
+                    )
+
+        self._metrics.sent += len(sent)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = min(self._max_backoff, self._base_backoff * 2 ** (attempts - 1))
+
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    def _is_permanent(self, error: Exception) -> bool:
+        if not isinstance(error, (SMTPException, OSError)):
+            return True
+
+        if isinstance(error, SMTPRecipientsRefused):
+            return all(
+                recipient.code >= 500 for recipient in error.recipients
+            )
+
+        return isinstance(error, SMTPResponseException) and error.code >= 500
@@ -23,4 +23,10 @@ JWT_ERROR = 'Некорректный токен'
 class UnknowError(Exception):
     pass
 
-UNKNOWN_EXCEPTION = 'Возникла неизвестная ошибка. Повторите операцию позже!'
\ No newline at end of file
+UNKNOWN_EXCEPTION = 'Возникла неизвестная ошибка. Повторите операцию позже!'
+
+
+class PasswordHasherOverloadError(InfrastructureError):
+    pass
+
+HASHER_OVERLOADED = 'Сервис временно перегружен. Повторите попытку позже!'
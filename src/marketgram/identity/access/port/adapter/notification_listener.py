@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from typing import Callable
+
+from psycopg import AsyncConnection, OperationalError
+from psycopg.sql import SQL, Identifier
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    def __init__(
+        self,
+        conninfo: str,
+        channel: str,
+        on_notify: Callable[[str], None],
+        on_reset: Callable[[], None],
+        reconnect_interval: float = 1.0
+    ) -> None:
+        self._conninfo = conninfo
+        self._channel = channel
+        self._on_notify = on_notify
+        self._on_reset = on_reset
+        self._reconnect_interval = reconnect_interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except OperationalError:
+                logger.warning('Lost the %s listener connection', self._channel)
+            except Exception:
+                logger.exception('The %s listener failed', self._channel)
+
+            self._reset()
+            await asyncio.sleep(self._reconnect_interval)
+
+    async def _listen(self) -> None:
+        async with await AsyncConnection.connect(
+            self._conninfo, 
+            autocommit=True
+        ) as connection:
+            await connection.execute(
+                SQL('LISTEN {}').format(Identifier(self._channel))
+            )
+            self._reset()
+
+            async for notify in connection.notifies():
+                self._notify(notify.payload)
+
+    def _notify(self, payload: str) -> None:
+        try:
+            self._on_notify(payload)
+        except Exception:
+            logger.exception(
+                'Skipped the %s notification %r', 
+                self._channel, 
+                payload
+            )
+
+    def _reset(self) -> None:
+        try:
+            self._on_reset()
+        except Exception:
+            logger.exception('Failed to reset the %s listener', self._channel)
@@ -0,0 +1,77 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, TypeVar
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+from marketgram.identity.access.port.adapter.errors import (
+    HASHER_OVERLOADED,
+    PasswordHasherOverloadError
+)
+
+T = TypeVar('T')
+
+_worker_hasher: PasswordHasher = None
+
+
+def _init_worker(time_cost: int, memory_cost: int, parallelism: int) -> None:
+    global _worker_hasher
+    _worker_hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism
+    )
+
+
+def _hash(password: str) -> str:
+    return _worker_hasher.hash(password)
+
+
+def _verify(hash: str, password: str) -> bool:
+    try:
+        return _worker_hasher.verify(hash, password)
+    except VerifyMismatchError:
+        return False
+
+
+class ProcessPoolPasswordHasher:
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int
+    ) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(time_cost, memory_cost, parallelism)
+        )
+        self._slots = asyncio.Semaphore(max_workers + max_pending)
+        self._local_hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password)
+
+    async def verify(self, hash: str, password: str) -> bool:
+        return await self._submit(_verify, hash, password)
+
+    def check_needs_rehash(self, hash: str) -> bool:
+        return self._local_hasher.check_needs_rehash(hash)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _submit(self, function: Callable[..., T], *args) -> T:
+        if self._slots.locked():
+            raise PasswordHasherOverloadError(HASHER_OVERLOADED)
+
+        async with self._slots:
+            return await asyncio.get_running_loop() \
+                .run_in_executor(self._executor, function, *args)
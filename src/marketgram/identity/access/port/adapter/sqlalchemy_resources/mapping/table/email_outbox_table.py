@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Table,
+    text
+)
+
+from marketgram.common.port.adapter.sqlalchemy_metadata import metadata
+
+email_outbox_table = Table(
+    'email_outbox',
+    metadata,
+    Column('message_id', BigInteger, primary_key=True, autoincrement=True),
+    Column('message', LargeBinary, nullable=False),
+    Column('attempts', Integer, nullable=False, server_default=text('0')),
+    Column(
+        'next_attempt_at', 
+        DateTime(timezone=True), 
+        nullable=False,
+        server_default=text('now()')
+    ),
+    Column(
+        'created_at', 
+        DateTime(timezone=True), 
+        nullable=False,
+        server_default=text('now()')
+    ),
+    Column('sent_at', DateTime(timezone=True), nullable=True),
+    Column('failed_at', DateTime(timezone=True), nullable=True),
+    Column('last_error', String, nullable=True),
+    Index(
+        'ix_email_outbox_pending',
+        'next_attempt_at',
+        postgresql_where=text('sent_at IS NULL AND failed_at IS NULL')
+    )
+)
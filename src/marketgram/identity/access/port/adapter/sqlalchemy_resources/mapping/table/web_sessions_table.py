@@ -1,4 +1,13 @@
-from sqlalchemy import UUID, Column, DateTime, Integer, String, Table, text
+from sqlalchemy import (
+    UUID,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    text
+)
 
 from marketgram.common.port.adapter.sqlalchemy_metadata import metadata
 
@@ -18,5 +27,7 @@ web_session_table = Table(
     Column('created_at', DateTime(timezone=True), nullable=False),
     Column('expires_in', DateTime(timezone=True), nullable=False),
     Column('device', String, nullable=False),
-    Column('version_id', Integer, nullable=False)
+    Column('version_id', Integer, nullable=False),
+    Index('ix_web_session_session_id', 'session_id', unique=True),
+    Index('ix_web_session_user_id_device', 'user_id', 'device')
 )
\ No newline at end of file
@@ -0,0 +1,22 @@
+from email.message import EmailMessage
+
+from sqlalchemy import insert
+
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
+    IAMContext
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.email_outbox_table import (
+    email_outbox_table
+)
+
+
+class OutboxEmailSender:
+    def __init__(
+        self,
+        context: IAMContext
+    ) -> None:
+        self.session = context.session
+
+    async def send_message(self, message: EmailMessage) -> None:
+        stmt = insert(email_outbox_table).values(message=message.as_bytes())
+        await self.session.execute(stmt)
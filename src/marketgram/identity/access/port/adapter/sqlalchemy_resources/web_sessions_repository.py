@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, func, select
 
 from marketgram.identity.access.domain.model.web_session import (
     WebSession
@@ -9,14 +9,23 @@ from marketgram.identity.access.domain.model.web_session import (
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
     IAMContext
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    INVALIDATION_CHANNEL,
+    WebSessionsCache,
+    device_payload,
+    session_payload,
+    user_payload
+)
 
 
 class WebSessionsRepository:
     def __init__(
         self,
-        context: IAMContext
+        context: IAMContext,
+        cache: WebSessionsCache
     ) -> None:
         self.session = context.session
+        self.cache = cache
 
     async def add(self, web_session: WebSession) -> None:
         self.session.add(web_session)
@@ -28,19 +37,41 @@ class WebSessionsRepository:
         ))
         await self.session.execute(stmt)
 
+        self.cache.invalidate_device(user_id, device)
+        await self._notify(device_payload(user_id, device))
+
     async def delete_with_id(self, session_id: UUID) -> None:
         stmt = delete(WebSession).where(WebSession.session_id == session_id)
         await self.session.execute(stmt)
 
+        self.cache.invalidate(session_id)
+        await self._notify(session_payload(session_id))
+
     async def delete_all_with_user_id(self, user_id: UUID) -> None:
         stmt = delete(WebSession).where(WebSession.user_id == user_id)
         await self.session.execute(stmt)
 
+        self.cache.invalidate_user(user_id)
+        await self._notify(user_payload(user_id))
+
     async def lively_with_id(self, session_id: UUID, current_time: datetime) -> WebSession | None:
+        web_session = self.cache.get(session_id, current_time)
+        if web_session is not None:
+            return web_session
+
         stmt = select(WebSession).where(and_(
             WebSession.session_id == session_id,
             WebSession.expires_in > current_time
         ))
         result = await self.session.execute(stmt)
+        web_session = result.scalar_one_or_none()
+
+        if web_session is not None:
+            self.cache.put(web_session)
+
+        return web_session
 
-        return result.scalar_one_or_none()
\ No newline at end of file
+    async def _notify(self, payload: str) -> None:
+        await self.session.execute(
+            select(func.pg_notify(INVALIDATION_CHANNEL, payload))
+        )
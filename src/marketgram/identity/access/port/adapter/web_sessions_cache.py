@@ -0,0 +1,132 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from marketgram.identity.access.domain.model.web_session import WebSession
+
+INVALIDATION_CHANNEL = 'web_session_invalidated'
+
+
+class WebSessionsCache:
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[WebSession, float]] = OrderedDict()
+        self._by_user: dict[UUID, set[UUID]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / lookups
+
+    def get(self, session_id: UUID, current_time: datetime) -> WebSession | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        web_session, cached_at = entry
+        if (
+            self._clock() - cached_at >= self._ttl
+            or web_session.expires_in <= self._aware(current_time)
+        ):
+            self._remove(session_id)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(session_id)
+        self.hits += 1
+
+        return web_session
+
+    def put(self, web_session: WebSession) -> None:
+        snapshot = WebSession(
+            web_session.user_id,
+            web_session.session_id,
+            web_session.created_at,
+            web_session.expires_in,
+            web_session.device
+        )
+        self._entries[snapshot.session_id] = (snapshot, self._clock())
+        self._entries.move_to_end(snapshot.session_id)
+        self._by_user.setdefault(snapshot.user_id, set()).add(snapshot.session_id)
+
+        while len(self._entries) > self._max_size:
+            session_id, (evicted, _) = self._entries.popitem(last=False)
+            self._unlink(evicted.user_id, session_id)
+
+    def invalidate(self, session_id: UUID) -> None:
+        self._remove(session_id)
+
+    def invalidate_device(self, user_id: UUID, device: str) -> None:
+        for session_id in list(self._by_user.get(user_id, ())):
+            web_session, _ = self._entries[session_id]
+            if web_session.device == device:
+                self._remove(session_id)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        for session_id in self._by_user.pop(user_id, set()):
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+
+    def apply_notification(self, payload: str) -> None:
+        message = json.loads(payload)
+
+        if 'session_id' in message:
+            self.invalidate(UUID(message['session_id']))
+        elif 'device' in message:
+            self.invalidate_device(UUID(message['user_id']), message['device'])
+        else:
+            self.invalidate_user(UUID(message['user_id']))
+
+    def _remove(self, session_id: UUID) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._unlink(entry[0].user_id, session_id)
+
+    def _unlink(self, user_id: UUID, session_id: UUID) -> None:
+        sessions = self._by_user.get(user_id)
+        if sessions is None:
+            return
+
+        sessions.discard(session_id)
+        if not sessions:
+            del self._by_user[user_id]
+
+    def _aware(self, current_time: datetime) -> datetime:
+        if current_time.tzinfo is None:
+            return current_time.astimezone()
+
+        return current_time
+
+
+def session_payload(session_id: UUID) -> str:
+    return json.dumps({'session_id': str(session_id)})
+
+
+def device_payload(user_id: UUID, device: str) -> str:
+    return json.dumps({'user_id': str(user_id), 'device': device})
+
+
+def user_payload(user_id: UUID) -> str:
+    return json.dumps({'user_id': str(user_id)})
@@ -20,6 +20,30 @@ class JwtHtmlSettings(HtmlSettings):
     link: str
 
 
+@dataclass
+class PasswordHasherSettings:
+    max_workers: int
+    max_pending: int
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+
+@dataclass
+class EmailOutboxSettings:
+    pool_size: int
+    batch_size: int
+    rate_per_second: float
+    max_attempts: int
+
+
+@dataclass
+class WebSessionsCacheSettings:
+    max_size: int
+    ttl: float
+    listen_conninfo: str
+
+
 @dataclass
 class Settings:
     email_client: EmailClientSettings
@@ -27,6 +51,9 @@ class Settings:
     activate_html_settings: JwtHtmlSettings
     forgot_pwd_html_settings: JwtHtmlSettings
     jinja_env: Environment
+    password_hasher: PasswordHasherSettings
+    email_outbox: EmailOutboxSettings
+    web_sessions_cache: WebSessionsCacheSettings
 
     def for_email_client(self) -> EmailClientSettings:
         return self.email_client
@@ -59,11 +86,32 @@ def identity_access_load_settings() -> Settings:
         os.environ.get('VALIDATE_CERTS')
     )
     jwt_manager = os.environ.get('JWT_SECRET')
+    password_hasher = PasswordHasherSettings(
+        int(os.environ.get('PASSWORD_HASHER_WORKERS', os.cpu_count())),
+        int(os.environ.get('PASSWORD_HASHER_MAX_PENDING', 64)),
+        int(os.environ.get('ARGON2_TIME_COST', 2)),
+        int(os.environ.get('ARGON2_MEMORY_COST', 19 * 1024)),
+        int(os.environ.get('ARGON2_PARALLELISM', 1))
+    )
+    email_outbox = EmailOutboxSettings(
+        int(os.environ.get('EMAIL_OUTBOX_POOL_SIZE', 4)),
+        int(os.environ.get('EMAIL_OUTBOX_BATCH_SIZE', 50)),
+        float(os.environ.get('EMAIL_OUTBOX_RATE', 10)),
+        int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 8))
+    )
+    web_sessions_cache = WebSessionsCacheSettings(
+        int(os.environ.get('WEB_SESSIONS_CACHE_SIZE', 10_000)),
+        float(os.environ.get('WEB_SESSIONS_CACHE_TTL', 60)),
+        os.environ.get('DATABASE_URL', '').replace('+psycopg', '', 1)
+    )
     
     return Settings(
         email_client,
         jwt_manager,
         activate_html_settings,
         forgot_pwd_html_settings,
-        env
+        env,
+        password_hasher,
+        email_outbox,
+        web_sessions_cache
     )
\ No newline at end of file
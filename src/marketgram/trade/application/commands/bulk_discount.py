@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.trade.application.exceptions import ApplicationError
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.bulk_discount import (
+    BulkDiscount,
+    BulkDiscountReport,
+    CardsFilter
+)
+from marketgram.trade.domain.model.trade_item.cards_repository import CardsRepository
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+
+
+@dataclass
+class BulkDiscountCommand:
+    percent: str | None = None
+    amount: str | None = None
+    card_ids: list[int] | None = None
+    region: Region | None = None
+    account_format: AccountFormat | None = None
+    min_price: str | None = None
+    max_price: str | None = None
+
+
+class BulkDiscountHandler:
+    def __init__(
+        self,
+        id_provider: IdProvider,
+        cards_repository: CardsRepository
+    ) -> None:
+        self._id_provider = id_provider
+        self._cards_repository = cards_repository
+
+    async def handle(self, command: BulkDiscountCommand) -> BulkDiscountReport:
+        if (command.percent is None) == (command.amount is None):
+            raise ApplicationError()
+
+        try:
+            discount = BulkDiscount(
+                _percent(command.percent),
+                _money(command.amount)
+            )
+            cards_filter = CardsFilter(
+                tuple(command.card_ids) if command.card_ids is not None else None,
+                command.region,
+                command.account_format,
+                _money(command.min_price),
+                _money(command.max_price)
+            )
+        except InvalidOperation as error:
+            raise ApplicationError() from error
+
+        return await self._cards_repository.set_discounted_prices(
+            self._id_provider.provided_id(),
+            cards_filter,
+            discount
+        )
+
+
+def _percent(value: str | None) -> Decimal | None:
+    if value is None:
+        return None
+
+    percent = Decimal(value)
+    if not 0 < percent < 100:
+        raise ApplicationError()
+
+    return percent
+
+
+def _money(value: str | None) -> Money | None:
+    if value is None:
+        return None
+
+    return Money(value)
@@ -5,6 +5,7 @@ from uuid import UUID
 from marketgram.common.application.id_provider import IdProvider
 from marketgram.trade.application.exceptions import ApplicationError
 from marketgram.trade.domain.model.trade_item.cards_repository import CardsRepository
+from marketgram.trade.domain.model.trade_item.stock_repository import StockRepository
 from marketgram.trade.domain.model.p2p.deal_repository import DealsRepository
 from marketgram.trade.domain.model.p2p.members_repository import MembersRepository
 from marketgram.trade.domain.model.rule.agreement.money import Money
@@ -24,11 +25,13 @@ class CardBuyHandler:
         members_repository: MembersRepository,
         cards_repository: CardsRepository,
         deals_repository: DealsRepository,
+        stock_repository: StockRepository
     ) -> None:
         self._id_provider = id_provider
         self._members_repository = members_repository
         self._cards_repository = cards_repository
         self._deals_repository = deals_repository
+        self._stock_repository = stock_repository
 
     async def handle(self, command: CardBuyCommand) -> None:
         card = await self._cards_repository \
@@ -48,4 +51,15 @@ class CardBuyHandler:
             card,
             datetime.now(UTC)
         )
-        return await self._deals_repository.add(new_deal)
+        self._deals_repository.add(new_deal)
+
+        await self._cards_repository.save_purchased(card)
+
+        if card.from_stock():
+            items = await self._stock_repository.allocate(
+                card.card_id,
+                new_deal.deal_id,
+                command.qty
+            )
+            if len(items) < command.qty:
+                raise ApplicationError()
@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import AsyncIterable
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.trade.application.exceptions import ApplicationError
+from marketgram.trade.domain.model.p2p.delivery import Delivery
+from marketgram.trade.domain.model.p2p.format import Format
+from marketgram.trade.domain.model.p2p.members_repository import MembersRepository
+from marketgram.trade.domain.model.p2p.seller import Seller
+from marketgram.trade.domain.model.p2p.transfer_method import TransferMethod
+from marketgram.trade.domain.model.rule.agreement.limits import Limits
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.rule.agreement.service_agreement import (
+    ServiceAgreement
+)
+from marketgram.trade.domain.model.trade_item.card import Card
+from marketgram.trade.domain.model.trade_item.cards_repository import CardsRepository
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Description,
+    Region
+)
+from marketgram.trade.domain.model.trade_item.exceptions import DomainError
+
+TRUE_VALUES = ('true', '1', 'yes')
+FALSE_VALUES = ('false', '0', 'no')
+
+
+@dataclass
+class CardsBulkCreateCommand:
+    rows: AsyncIterable[dict]
+
+
+@dataclass(frozen=True)
+class RowError:
+    row: int
+    error: str
+
+
+@dataclass
+class CardsBulkCreateResult:
+    created: int = 0
+    failed: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+class CardsBulkCreateHandler:
+    _BATCH_SIZE = 500
+    _MAX_REPORTED_ERRORS = 1000
+
+    def __init__(
+        self,
+        id_provider: IdProvider,
+        members_repository: MembersRepository,
+        cards_repository: CardsRepository,
+        agreement: ServiceAgreement
+    ) -> None:
+        self._id_provider = id_provider
+        self._members_repository = members_repository
+        self._cards_repository = cards_repository
+        self._agreement = agreement
+
+    async def handle(self, command: CardsBulkCreateCommand) -> CardsBulkCreateResult:
+        seller = await self._members_repository \
+            .seller_with_id(self._id_provider.provided_id())
+        if seller is None:
+            raise ApplicationError()
+
+        seller.accept_agreement(self._agreement)
+        limits = self._agreement.actual_limits()
+        current_time = datetime.now(UTC)
+
+        result = CardsBulkCreateResult()
+        batch = []
+        row_number = 0
+        async for row in command.rows:
+            row_number += 1
+            try:
+                batch.append(
+                    self._make_card(seller, limits, row, current_time)
+                )
+            except (DomainError, LookupError, ValueError, TypeError, ArithmeticError) as error:
+                result.failed += 1
+                if len(result.errors) < self._MAX_REPORTED_ERRORS:
+                    result.errors.append(RowError(row_number, _describe(error)))
+                continue
+
+            if len(batch) >= self._BATCH_SIZE:
+                result.created += len(
+                    await self._cards_repository.add_many(batch)
+                )
+                batch = []
+
+        result.created += len(await self._cards_repository.add_many(batch))
+
+        return result
+
+    def _make_card(
+        self,
+        seller: Seller,
+        limits: Limits,
+        row: dict,
+        current_time: datetime
+    ) -> Card:
+        if not isinstance(row, dict):
+            raise ValueError('malformed row')
+
+        delivery = Delivery(
+            Format(row['format']),
+            TransferMethod(row['method'])
+        )
+        return seller.make_card(
+            Money(row['amount']),
+            Description(
+                str(row['title']),
+                str(row['text_description']),
+                AccountFormat(row['account_format']),
+                Region(row['region']),
+                _flag(row['spam_block'])
+            ),
+            delivery,
+            current_time,
+            delivery.calculate_deadlines(
+                _hours(row.get('shipping_hours')),
+                _hours(row.get('receipt_hours')),
+                int(row['check_hours'])
+            ),
+            limits
+        )
+
+
+def _flag(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    if str(value).strip().lower() in TRUE_VALUES:
+        return True
+    if str(value).strip().lower() in FALSE_VALUES:
+        return False
+
+    raise ValueError(f'invalid boolean {value!r}')
+
+
+def _hours(value: object) -> int | None:
+    if value is None or value == '':
+        return None
+
+    return int(value)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f'missing field {error}'
+    if isinstance(error, ArithmeticError):
+        return 'invalid number'
+
+    return str(error) or type(error).__name__
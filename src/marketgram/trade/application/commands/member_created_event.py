@@ -1,29 +1,84 @@
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from uuid import UUID
 
+from marketgram.trade.application.processed_events import ProcessedEvents
 from marketgram.trade.domain.model.p2p.members_repository import (
     MembersRepository
 )
-from marketgram.trade.domain.model.p2p.user import User
 
 
 @dataclass
 class MemberCreatedEvent:
     member_id: UUID
+    event_id: UUID
+    occurred_at: datetime
+
+
+@dataclass
+class MemberProvisioningMetrics:
+    batches: int = 0
+    events: int = 0
+    duplicates: int = 0
+    inserted: int = 0
+    last_batch_size: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
 
 
 class MemberCreatedEventHandler:
+    CONSUMER = 'trade.member_created'
+
     def __init__(
         self,
-        members_repository: MembersRepository
+        members_repository: MembersRepository,
+        processed_events: ProcessedEvents,
+        metrics: MemberProvisioningMetrics = None
     ) -> None:
         self._members_repository = members_repository
+        self._processed_events = processed_events
+        self._metrics = metrics or MemberProvisioningMetrics()
+
+    @property
+    def metrics(self) -> MemberProvisioningMetrics:
+        return self._metrics
 
     async def handle(self, event: MemberCreatedEvent) -> None:
-        member = await self._members_repository \
-            .user_with_id(event.member_id)
-        
-        if member is None:
-            new_member = User(event.member_id)
+        await self.handle_many([event])
+
+    async def handle_many(self, events: list[MemberCreatedEvent]) -> int:
+        if not events:
+            return 0
+
+        unique_events = {event.event_id: event for event in events}
+        new_event_ids = await self._processed_events \
+            .mark_processed(self.CONSUMER, list(unique_events))
+
+        member_ids = list(dict.fromkeys(
+            unique_events[event_id].member_id 
+            for event_id in unique_events 
+            if event_id in new_event_ids
+        ))
+        inserted = await self._members_repository.add_many_new(member_ids)
+
+        self._record(events, len(events) - len(new_event_ids), inserted)
+
+        return inserted
+
+    def _record(
+        self, 
+        events: list[MemberCreatedEvent], 
+        duplicates: int, 
+        inserted: int
+    ) -> None:
+        lag = (
+            datetime.now(UTC) - min(event.occurred_at for event in events)
+        ).total_seconds()
 
-            return self._members_repository.add(new_member)
\ No newline at end of file
+        self._metrics.batches += 1
+        self._metrics.events += len(events)
+        self._metrics.duplicates += duplicates
+        self._metrics.inserted += inserted
+        self._metrics.last_batch_size = len(events)
+        self._metrics.last_lag = lag
+        self._metrics.max_lag = max(self._metrics.max_lag, lag)
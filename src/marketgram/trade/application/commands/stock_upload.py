@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import AsyncIterable
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.trade.application.exceptions import ApplicationError
+from marketgram.trade.domain.model.trade_item.cards_repository import CardsRepository
+from marketgram.trade.domain.model.trade_item.stock_repository import StockRepository
+
+
+@dataclass
+class StockUploadCommand:
+    card_id: int
+    payloads: AsyncIterable[str]
+
+
+class StockUploadHandler:
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        id_provider: IdProvider,
+        cards_repository: CardsRepository,
+        stock_repository: StockRepository
+    ) -> None:
+        self._id_provider = id_provider
+        self._cards_repository = cards_repository
+        self._stock_repository = stock_repository
+
+    async def handle(self, command: StockUploadCommand) -> int:
+        card = await self._cards_repository \
+            .with_owner_and_card_id(
+                self._id_provider.provided_id(),
+                command.card_id
+            )
+        if card is None or not card.from_stock():
+            raise ApplicationError()
+        
+        uploaded = 0
+        batch = []
+        async for payload in command.payloads:
+            batch.append(payload)
+            if len(batch) >= self._BATCH_SIZE:
+                uploaded += await self._stock_repository \
+                    .add_many(card.card_id, batch)
+                batch = []
+
+        uploaded += await self._stock_repository \
+            .add_many(card.card_id, batch)
+        
+        return uploaded
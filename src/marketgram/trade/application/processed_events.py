@@ -0,0 +1,11 @@
+from typing import Protocol
+from uuid import UUID
+
+
+class ProcessedEvents(Protocol):
+    async def mark_processed(
+        self, 
+        consumer: str, 
+        event_ids: list[UUID]
+    ) -> set[UUID]:
+        raise NotImplementedError
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import ClassVar
+from uuid import UUID
+
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.rule.agreement.money import Money
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    aggregate_type: ClassVar[str]
+
+    @property
+    def aggregate_id(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def event_type(self) -> str:
+        return type(self).__name__
+
+
+@dataclass(frozen=True)
+class DealEvent(DomainEvent):
+    aggregate_type: ClassVar[str] = 'deal'
+
+    deal_id: int
+    occurred_at: datetime
+
+    @property
+    def aggregate_id(self) -> str:
+        return str(self.deal_id)
+
+
+@dataclass(frozen=True)
+class DealOpened(DealEvent):
+    seller_id: UUID
+    buyer_id: UUID
+    card_id: int
+
+
+@dataclass(frozen=True)
+class DealShipped(DealEvent):
+    status: StatusDeal
+
+
+@dataclass(frozen=True)
+class DealReceived(DealEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class DealClosed(DealEvent):
+    seller_id: UUID
+
+
+@dataclass(frozen=True)
+class DealCancelled(DealEvent):
+    buyer_id: UUID
+
+
+@dataclass(frozen=True)
+class DisputeOpened(DealEvent):
+    seller_id: UUID
+    buyer_id: UUID
+
+
+@dataclass(frozen=True)
+class DisputeSettledForSeller(DealEvent):
+    seller_id: UUID
+
+
+@dataclass(frozen=True)
+class DisputeSettledForBuyer(DealEvent):
+    buyer_id: UUID
+    refund: Money
+
+
+@dataclass(frozen=True)
+class PaymentAccepted(DomainEvent):
+    aggregate_type: ClassVar[str] = 'payment'
+
+    payment_id: UUID
+    user_id: UUID
+    amount: Money
+    occurred_at: datetime
+
+    @property
+    def aggregate_id(self) -> str:
+        return str(self.payment_id)
+
+
+@dataclass(frozen=True)
+class PayoutCalculated(DomainEvent):
+    aggregate_type: ClassVar[str] = 'payout'
+
+    payout_id: UUID
+    user_id: UUID
+    amount: Money
+    occurred_at: datetime
+
+    @property
+    def aggregate_id(self) -> str:
+        return str(self.payout_id)
+
+
+@dataclass(frozen=True)
+class CardEvent(DomainEvent):
+    aggregate_type: ClassVar[str] = 'card'
+
+    card_id: int
+    occurred_at: datetime
+
+    @property
+    def aggregate_id(self) -> str:
+        return str(self.card_id)
+
+
+@dataclass(frozen=True)
+class CardCreated(CardEvent):
+    owner_id: UUID
+    price: Money
+
+
+@dataclass(frozen=True)
+class CardPriceChanged(CardEvent):
+    price: Money
+
+
+@dataclass(frozen=True)
+class CardDescriptionChanged(CardEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class CardArchived(CardEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class CardShown(CardEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class CardPurchased(CardEvent):
+    pass
+
+
+class AggregateRoot:
+    _events: list[DomainEvent]
+
+    def release_events(self) -> list[DomainEvent]:
+        return self.__dict__.pop('_events', [])
+
+    def _record(self, event: DomainEvent) -> None:
+        self.__dict__.setdefault('_events', []).append(event)
@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from marketgram.trade.domain.model.events import AggregateRoot, DealCancelled
 from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
 from marketgram.trade.domain.model.p2p.time_tags import TimeTags
 from marketgram.trade.domain.model.rule.agreement.entry import PostingEntry
@@ -9,7 +10,7 @@ from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.rule.agreement.types import AccountType, Operation
 
 
-class CancellationDeal:
+class CancellationDeal(AggregateRoot):
     def __init__(
         self,
         deal_id: int,
@@ -41,8 +42,11 @@ class CancellationDeal:
                 EntryStatus.ACCEPTED
             )
         )
-        self._time_tags.closed(current_date)
+        self._time_tags = self._time_tags.closed(current_date)
         self._status = StatusDeal.CANCELLED
+        self._record(
+            DealCancelled(self._deal_id, current_date, self._buyer_id)
+        )
     
     def __eq__(self, other: 'CancellationDeal') -> bool:
         if not isinstance(other, CancellationDeal):
@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from marketgram.trade.domain.model.events import AggregateRoot, DealClosed
 from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.p2p.deadlines import Deadlines
@@ -13,7 +14,7 @@ from marketgram.trade.domain.model.rule.agreement.service_agreement import (
 from marketgram.trade.domain.model.rule.agreement.types import EventType
 
 
-class ConfirmationDeal:
+class ConfirmationDeal(AggregateRoot):
     def __init__(
         self, 
         deal_id: int,
@@ -39,6 +40,23 @@ class ConfirmationDeal:
         if self.check_deadline() < occurred_at:
             raise DomainError()
 
+        self._close(occurred_at)
+
+    def confirm_by_deadline(self, current_date: datetime) -> None:
+        deadline = self.check_deadline()
+        if current_date < deadline:
+            raise DomainError()
+
+        self._close(deadline)
+
+    def check_deadline(self) -> datetime:
+        return (self._time_tags.received_at 
+                + self._deadlines.total_check_hours)
+
+    def accept_agreement(self, agreement: ServiceAgreement) -> None:
+        self._agreement = agreement
+
+    def _close(self, occurred_at: datetime) -> None:
         rule = self._agreement.find_deal_rule(
             EventType.PRODUCT_CONFIRMED
         )
@@ -47,18 +65,13 @@ class ConfirmationDeal:
             self._price,
             [],
             self._agreement,
-            self._card_created_at
+            self._card_created_at,
+            self._deal_id
         )
         self._entries.extend(entries)
-        self._time_tags.closed(occurred_at)
+        self._time_tags = self._time_tags.closed(occurred_at)
         self._status = StatusDeal.CLOSED
-
-    def check_deadline(self) -> datetime:
-        return (self._time_tags.received_at 
-                + self._deadlines.total_check_hours)
-
-    def accept_agreement(self, agreement: ServiceAgreement) -> None:
-        self._agreement = agreement
+        self._record(DealClosed(self._deal_id, occurred_at, self._seller_id))
 
     def __eq__(self, other: 'ConfirmationDeal') -> bool:
         if not isinstance(other, ConfirmationDeal):
@@ -1,6 +1,12 @@
 from datetime import datetime
 from uuid import UUID
 
+from marketgram.trade.domain.model.events import (
+    AggregateRoot,
+    DisputeOpened,
+    DisputeSettledForBuyer,
+    DisputeSettledForSeller
+)
 from marketgram.trade.domain.model.p2p.members import Members
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.p2p.deadlines import Deadlines
@@ -13,7 +19,7 @@ from marketgram.trade.domain.model.p2p.payout import Payout
 from marketgram.trade.domain.model.rule.agreement.types import AccountType, Operation
 
 
-class DisputeDeal:
+class DisputeDeal(AggregateRoot):
     def __init__(
         self,
         deal_id: int,
@@ -51,9 +57,17 @@ class DisputeDeal:
             if self._payout.created_at < occurred_at:
                 self._payout.temporarily_block()
 
-        self._time_tags.closing_reset()
+        self._time_tags = self._time_tags.closing_reset()
         self._is_disputed = True
         self._status = StatusDeal.DISPUTE
+        self._record(
+            DisputeOpened(
+                self._deal_id, 
+                occurred_at, 
+                self.seller_id, 
+                self.buyer_id
+            )
+        )
 
     def dispute_deadline(self) -> datetime:
         return (self._time_tags.received_at 
@@ -68,8 +82,11 @@ class DisputeDeal:
             if self._payout.created_at < occurred_at:
                 self._payout.unlock()
 
-        self._time_tags.closed(occurred_at)
+        self._time_tags = self._time_tags.closed(occurred_at)
         self._status = StatusDeal.CLOSED
+        self._record(
+            DisputeSettledForSeller(self._deal_id, occurred_at, self.seller_id)
+        )
 
     def satisfy_buyer(self, occurred_at: datetime) -> None:
         if self._deal_entries is not None:
@@ -90,8 +107,16 @@ class DisputeDeal:
             if self._payout.created_at < occurred_at:
                 self._payout.unlock()
 
-        self._time_tags.closed(occurred_at)
-        self._status = StatusDeal.CANCELLED  
+        self._time_tags = self._time_tags.closed(occurred_at)
+        self._status = StatusDeal.CANCELLED
+        self._record(
+            DisputeSettledForBuyer(
+                self._deal_id, 
+                occurred_at, 
+                self.buyer_id, 
+                self._price
+            )
+        )
 
     def add_payout(self, payout: Payout) -> None:
         self._payout = payout
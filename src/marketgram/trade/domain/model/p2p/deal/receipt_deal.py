@@ -1,12 +1,13 @@
 from datetime import datetime
 
+from marketgram.trade.domain.model.events import AggregateRoot, DealReceived
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.p2p.deadlines import Deadlines
 from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
 from marketgram.trade.domain.model.p2p.time_tags import TimeTags
 
 
-class ReceiptDeal:
+class ReceiptDeal(AggregateRoot):
     def __init__(
         self, 
         deal_id: int,
@@ -23,8 +24,18 @@ class ReceiptDeal:
         if self.receipt_deadline() < occurred_at:
             raise DomainError()
         
-        self._time_tags.received(occurred_at)
+        self._time_tags = self._time_tags.received(occurred_at)
         self._status = StatusDeal.CHECK
+        self._record(DealReceived(self._deal_id, occurred_at))
+
+    def receive_by_deadline(self, current_date: datetime) -> None:
+        deadline = self.receipt_deadline()
+        if current_date < deadline:
+            raise DomainError()
+
+        self._time_tags = self._time_tags.received(deadline)
+        self._status = StatusDeal.CHECK
+        self._record(DealReceived(self._deal_id, deadline))
 
     def receipt_deadline(self) -> datetime:
         return (self._time_tags.shipped_at 
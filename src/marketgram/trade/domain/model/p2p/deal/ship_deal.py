@@ -1,5 +1,12 @@
+from dataclasses import replace
 from datetime import datetime
 
+from marketgram.trade.domain.model.events import (
+    AggregateRoot,
+    DealEvent,
+    DealOpened,
+    DealShipped
+)
 from marketgram.trade.domain.model.p2p.members import Members
 from marketgram.trade.domain.model.trade_item.exceptions import (
     DomainError,
@@ -12,7 +19,7 @@ from marketgram.trade.domain.model.p2p.type_deal import TypeDeal
 from marketgram.trade.domain.model.rule.agreement.money import Money
 
 
-class ShipDeal:
+class ShipDeal(AggregateRoot):
     def __init__(
         self,
         members: Members,
@@ -39,12 +46,38 @@ class ShipDeal:
         self._status = status
         self._is_disputed = is_disputed
 
+        if deal_id is None:
+            self._record(
+                DealOpened(
+                    None,
+                    time_tags.created_at,
+                    members.seller_id,
+                    members.buyer_id,
+                    card_id
+                )
+            )
+
     def confirm_shipment(self, occurred_at: datetime) -> None:
         raise InvalidOperationError()
     
+    def release_events(self) -> list[DealEvent]:
+        return [
+            replace(event, deal_id=self._deal_id) 
+            if event.deal_id is None else event
+            for event in super().release_events()
+        ]
+
     def delivery_deadline(self) -> datetime:
         return (self._time_tags.created_at
                 + self._deadlines.total_shipping_hours)
+    
+    @property
+    def deal_id(self) -> int:
+        return self._deal_id
+    
+    @property
+    def qty_purchased(self) -> int:
+        return self._qty_purchased
 
     def __eq__(self, other: 'ShipDeal') -> bool:
         if not isinstance(other, ShipDeal):
@@ -66,6 +99,7 @@ class ShipLoginCodeDeal(ShipDeal):
             .received(occurred_at)
             
         self._status = StatusDeal.CHECK
+        self._record(DealShipped(self._deal_id, occurred_at, self._status))
 
 
 class ShipProvidingLinkDeal(ShipDeal):
@@ -76,4 +110,5 @@ class ShipProvidingLinkDeal(ShipDeal):
         self._time_tags = self._time_tags \
             .shipped(occurred_at)
             
-        self._status = StatusDeal.AWAITING
\ No newline at end of file
+        self._status = StatusDeal.AWAITING
+        self._record(DealShipped(self._deal_id, occurred_at, self._status))
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Protocol
+from datetime import datetime
+from typing import Collection, Protocol
 from uuid import UUID
 
 from marketgram.trade.domain.model.p2p.deal.cancellation_deal import CancellationDeal
@@ -51,4 +52,28 @@ class DealsRepository(Protocol):
         self,
         deal_id: int,
     ) -> DisputeDeal | None:
+        raise NotImplementedError
+    
+    async def overdue_unshipped(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[CancellationDeal]:
+        raise NotImplementedError
+    
+    async def overdue_unreceived(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[ReceiptDeal]:
+        raise NotImplementedError
+    
+    async def overdue_unconfirmed(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[ConfirmationDeal]:
         raise NotImplementedError
\ No newline at end of file
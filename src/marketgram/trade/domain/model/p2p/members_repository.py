@@ -9,6 +9,9 @@ class MembersRepository(Protocol):
     def add(self, user: User) -> None:
         raise NotImplementedError
     
+    async def add_many_new(self, user_ids: list[UUID]) -> int:
+        raise NotImplementedError
+    
     async def seller_with_id(self, user_id: UUID) -> Seller:
         raise NotImplementedError
     
@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
 from marketgram.trade.domain.model.rule.agreement.entry import (
     EntryStatus, 
     PostingEntry
 )
+from marketgram.trade.domain.model.events import AggregateRoot, PaymentAccepted
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.rule.agreement.types import (
@@ -13,7 +14,7 @@ from marketgram.trade.domain.model.rule.agreement.types import (
 )
 
 
-class Payment:
+class Payment(AggregateRoot):
     def __init__(
         self,
         payment_id: UUID,
@@ -46,6 +47,14 @@ class Payment:
         self._is_processed = True
 
         self._entries.append(new_entry)
+        self._record(
+            PaymentAccepted(
+                self._payment_id,
+                self._user_id,
+                self._amount,
+                datetime.now(UTC)
+            )
+        )
 
     def __eq__(self, other: 'Payment') -> bool:
         if not isinstance(other, Payment):
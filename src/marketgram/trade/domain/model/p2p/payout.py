@@ -1,10 +1,11 @@
 from __future__ import annotations
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
 from marketgram.trade.domain.model.rule.agreement.entry import (
     PostingEntry
 )
+from marketgram.trade.domain.model.events import AggregateRoot, PayoutCalculated
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.rule.agreement.service_agreement import (
@@ -16,7 +17,7 @@ from marketgram.trade.domain.model.rule.agreement.types import (
 )
 
 
-class Payout:
+class Payout(AggregateRoot):
     def __init__(
         self,
         payout_id: UUID,
@@ -57,7 +58,8 @@ class Payout:
             self._tax_free, 
             [], 
             self._agreement, 
-            self._created_at
+            self._created_at,
+            self._payout_id
         )
         for entry in result:
             self._entries.append(entry)
@@ -65,6 +67,14 @@ class Payout:
                 amount_payout = entry._amount
 
         self._is_processed = True
+        self._record(
+            PayoutCalculated(
+                self._payout_id,
+                self._user_id,
+                abs(amount_payout),
+                datetime.now(UTC)
+            )
+        )
 
         return abs(amount_payout)
 
@@ -5,6 +5,7 @@ from marketgram.trade.domain.model.trade_item.card import Card
 from marketgram.trade.domain.model.p2p.deadlines import Deadlines
 from marketgram.trade.domain.model.p2p.delivery import Delivery
 from marketgram.trade.domain.model.p2p.paycard import Paycard
+from marketgram.trade.domain.model.rule.agreement.limits import Limits
 from marketgram.trade.domain.model.rule.agreement.service_agreement import (
     ServiceAgreement
 )
@@ -40,12 +41,14 @@ class Seller:
         description: Description,
         delivery: Delivery,
         current_time: datetime,
-        deadlines: Deadlines | None
+        deadlines: Deadlines | None,
+        limits: Limits | None = None
     ) -> Card:
         if self._is_blocked:
             raise DomainError(BALANCE_BLOCKED)
         
-        limits = self._agreement.actual_limits()
+        if limits is None:
+            limits = self._agreement.actual_limits()
 
         if amount < limits.min_price:
             raise DomainError(MINIMUM_PRICE)
@@ -69,6 +69,7 @@ class User:
                 self._user_id
             ),
             card.card_id,
+            quantity,
             card.type_deal,
             card.created_in,
             card.price * quantity,
@@ -8,6 +8,9 @@ from marketgram.trade.domain.model.rule.agreement.posting_rule import (
 from marketgram.trade.domain.model.rule.agreement.service_agreement import (
     ServiceAgreement
 )
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
 from marketgram.trade.domain.model.rule.agreement.types import (
     AccountType, 
     EventType, 
@@ -25,7 +28,8 @@ class DealPostingRule(PostingRule):
         self, 
         member_id: UUID, 
         empty_list: list, 
-        amount: Money
+        amount: Money,
+        source_id: object | None = None
     ) -> None:
         entry = PostingEntry(
             member_id,
@@ -43,10 +47,16 @@ class DealPostingRule(PostingRule):
         amount: Money,
         empty_list: list, 
         agreement: ServiceAgreement,
-        occurred_at: datetime
+        occurred_at: datetime,
+        source_id: object | None = None
     ) -> list[PostingEntry]:
         limits = agreement.limits_from(occurred_at)
-        self.make_entry(member_id, self.calculate_amount(amount, limits))
+        self.make_entry(
+            member_id, 
+            empty_list, 
+            self.calculate_amount(amount, limits),
+            source_id
+        )
 
         return empty_list
 
@@ -61,14 +71,16 @@ class PaymentFormula(DealPostingRule):
         amount: Money,
         empty_list: list, 
         agreement: ServiceAgreement,
-        occurred_at: datetime
+        occurred_at: datetime,
+        source_id: object | None = None
     ) -> list[PostingEntry]:
         super().process(
             member_id,
             amount,
             empty_list,
             agreement,
-            occurred_at
+            occurred_at,
+            source_id
         )
         secondary_rule = agreement.find_deal_rule(
             EventType.TAX_PAYMENT
@@ -78,7 +90,8 @@ class PaymentFormula(DealPostingRule):
             amount,
             empty_list,
             agreement,
-            occurred_at
+            occurred_at,
+            source_id
         )
         return empty_list
 
@@ -89,7 +102,7 @@ class PaymentFormula(DealPostingRule):
 class PaymentTaxFormula(DealPostingRule):
     def __init__(
         self, 
-        superuser_id: UUID,
+        tax_accounts: TaxAccounts,
         account_type: AccountType,
         operation_type: Operation,
         entry_status: EntryStatus
@@ -99,16 +112,17 @@ class PaymentTaxFormula(DealPostingRule):
             operation_type, 
             entry_status
         )
-        self._superuser_id = superuser_id
+        self._tax_accounts = tax_accounts
 
     def make_entry(
         self, 
         member_id: UUID, 
         empty_list: list, 
-        amount: Money
+        amount: Money,
+        source_id: object | None = None
     ) -> None:
         entry = PostingEntry(
-            self._superuser_id,
+            self._tax_accounts.for_source(source_id),
             amount,
             datetime.now(),
             self._account_type,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from dataclasses import FrozenInstanceError
+from decimal import ROUND_HALF_EVEN, Decimal
 from enum import StrEnum, auto
 
 
@@ -12,28 +12,66 @@ class Currency(StrEnum):
         return '₽'
 
 
-@dataclass(frozen=True, order=True)
 class Money:
-    number: str
-    currency: Currency = field(default=Currency.RUB)
-
-    def __post_init__(self) -> None:
-        object.__setattr__(
-            self, 
-            'number', 
-            Decimal(str(self.number))
-            .quantize(Decimal('1.00'), ROUND_HALF_EVEN)
+    __slots__ = ('_minor', 'currency')
+
+    _CENTS = Decimal('1.00')
+    _SCALE = 100
+
+    def __init__(
+        self,
+        number: int | str | Decimal,
+        currency: Currency = Currency.RUB
+    ) -> None:
+        if type(number) is int:
+            minor = number * self._SCALE
+        else:
+            minor = self._to_minor(number)
+
+        object.__setattr__(self, '_minor', minor)
+        object.__setattr__(self, 'currency', currency)
+
+    @classmethod
+    def _of(cls, minor: int, currency: Currency) -> Money:
+        money = object.__new__(cls)
+        object.__setattr__(money, '_minor', minor)
+        object.__setattr__(money, 'currency', currency)
+
+        return money
+
+    @classmethod
+    def _to_minor(cls, value: str | Decimal) -> int:
+        return int(
+            Decimal(str(value))
+            .quantize(cls._CENTS, ROUND_HALF_EVEN)
+            .scaleb(2)
         )
 
+    @property
+    def number(self) -> Decimal:
+        return Decimal(self._minor).scaleb(-2)
+
     def round_up(self) -> Money:
-        value = self.number.quantize(Decimal('1'), ROUND_HALF_UP)
-        return Money(value)
+        rubles, kopecks = divmod(abs(self._minor), self._SCALE)
+        if kopecks * 2 >= self._SCALE:
+            rubles += 1
+
+        if self._minor < 0:
+            rubles = -rubles
+
+        return Money._of(rubles * self._SCALE, self.currency)
+
+    def __composite_values__(self) -> tuple[Decimal]:
+        return (self.number,)
+
+    def __reduce__(self) -> tuple:
+        return (Money, (self.number, self.currency))
 
     def __repr__(self) -> str:
         return f'{self.number}{self.currency.mark()}'
 
     def __abs__(self) -> Money:
-        return Money(abs(self.number))
+        return Money._of(abs(self._minor), self.currency)
 
     def __mul__(self, value: int | Decimal) -> Money:
         if not isinstance(value, (int, Decimal)):
@@ -42,34 +80,80 @@ class Money:
         if value == 0:
             raise ArithmeticError
 
-        return Money(
-            self.number 
-            * Decimal(str(value))
-            .quantize(Decimal('1.00'), ROUND_HALF_EVEN)
-        )
+        if type(value) is int:
+            return Money._of(self._minor * value, self.currency)
+
+        factor = self._to_minor(value)
+        quotient, remainder = divmod(self._minor * factor, self._SCALE)
+
+        double = remainder * 2
+        if double > self._SCALE or (double == self._SCALE and quotient & 1):
+            quotient += 1
+
+        return Money._of(quotient, self.currency)
 
     def __sub__(self, value: Money) -> Money:
         self._isinstance(value)
-        return Money(self.number - value.number)
-    
+        return Money._of(self._minor - value._minor, self.currency)
+
     def __isub__(self, value: Money) -> Money:
-        self._isinstance(value)
-        return Money(self.number - value.number)
+        return self.__sub__(value)
 
     def __iadd__(self, value: Money) -> Money:
-        self._isinstance(value)
-        return Money(self.number + value.number)
+        return self.__add__(value)
 
     def __add__(self, value: Money) -> Money:
         self._isinstance(value)
-        return Money(self.number + value.number)
+        return Money._of(self._minor + value._minor, self.currency)
 
     def __neg__(self) -> Money:
-        return Money(-self.number)
-    
+        return Money._of(-self._minor, self.currency)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (
+            self._minor == other._minor
+            and self.currency == other.currency
+        )
+
+    def __lt__(self, other: Money) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self._minor, self.currency) < (other._minor, other.currency)
+
+    def __le__(self, other: Money) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self._minor, self.currency) <= (other._minor, other.currency)
+
+    def __gt__(self, other: Money) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self._minor, self.currency) > (other._minor, other.currency)
+
+    def __ge__(self, other: Money) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (self._minor, self.currency) >= (other._minor, other.currency)
+
+    def __hash__(self) -> int:
+        return hash((self._minor, self.currency))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f'cannot delete field {name!r}')
+
     def _isinstance(self, value: Money) -> None:
         if not isinstance(value, Money):
             raise TypeError
-        
+
         if self.currency != value.currency:
-            raise TypeError
\ No newline at end of file
+            raise TypeError
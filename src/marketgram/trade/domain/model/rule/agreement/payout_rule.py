@@ -12,6 +12,9 @@ from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.rule.agreement.posting_rule import (
     PostingRule
 )
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
 from marketgram.trade.domain.model.rule.agreement.types import (
     AccountType, 
     EventType, 
@@ -29,7 +32,8 @@ class PayoutPostingRule(PostingRule):
         self, 
         member_id: UUID, 
         empty_list: list, 
-        amount: Money
+        amount: Money,
+        source_id: object | None = None
     ) -> None:
         entry = PostingEntry(
             member_id,
@@ -47,14 +51,16 @@ class PayoutPostingRule(PostingRule):
         amount: Money,
         empty_list: list, 
         agreement: ServiceAgreement,
-        occurred_at: datetime
+        occurred_at: datetime,
+        source_id: object | None = None
     ) -> list[PostingEntry]:
         limits = agreement.limits_from(occurred_at)
 
         self.make_entry(
             member_id, 
             empty_list, 
-            self.calculate_amount(amount, limits)
+            self.calculate_amount(amount, limits),
+            source_id
         )
 
         return empty_list
@@ -70,14 +76,16 @@ class PayoutFormula(PayoutPostingRule):
         amount: Money,
         empty_list: list, 
         agreement: ServiceAgreement,
-        occurred_at: datetime
+        occurred_at: datetime,
+        source_id: object | None = None
     ) -> list[PostingEntry]:
         super().process(
             member_id, 
             amount, 
             empty_list, 
             agreement, 
-            occurred_at
+            occurred_at,
+            source_id
         )
         secondary_rule = agreement.find_payout_rule(EventType.TAX_PAYOUT)
         secondary_rule.process(
@@ -85,7 +93,8 @@ class PayoutFormula(PayoutPostingRule):
             amount, 
             empty_list, 
             agreement, 
-            occurred_at
+            occurred_at,
+            source_id
         )
 
         return empty_list
@@ -97,7 +106,7 @@ class PayoutFormula(PayoutPostingRule):
 class PayoutTaxFormula(PayoutPostingRule):
     def __init__(
         self, 
-        superuser_id: UUID,
+        tax_accounts: TaxAccounts,
         account_type: AccountType,
         operation_type: Operation,
         entry_status: EntryStatus
@@ -107,16 +116,17 @@ class PayoutTaxFormula(PayoutPostingRule):
             operation_type, 
             entry_status
         )
-        self._superuser_id = superuser_id
+        self._tax_accounts = tax_accounts
 
     def make_entry(
         self, 
         member_id: UUID, 
         empty_list: list, 
-        amount: Money
+        amount: Money,
+        source_id: object | None = None
     ) -> None:
         entry = PostingEntry(
-            self._superuser_id,
+            self._tax_accounts.for_source(source_id),
             amount,
             datetime.now(),
             self._account_type,
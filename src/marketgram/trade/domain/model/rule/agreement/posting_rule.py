@@ -42,6 +42,7 @@ class PostingRule:
         amount: Money,
         empty_list: list, 
         agreement: ServiceAgreement,
-        occurred_at: datetime
+        occurred_at: datetime,
+        source_id: object | None = None
     ) -> list[PostingEntry]:
         raise NotImplementedError
\ No newline at end of file
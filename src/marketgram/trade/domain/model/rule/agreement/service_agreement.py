@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from marketgram.trade.domain.model.trade_item.exceptions import (
+    AGREEMENT_IS_FROZEN,
     NO_RULE, 
     DomainError
 )
@@ -29,8 +30,10 @@ class ServiceAgreement:
         self._posting_rules: dict[
             EventType, PostingRule
         ] = {}
+        self._is_frozen = False
 
     def new_limits(self, limits: Limits) -> None:
+        self._check_not_frozen()
         self._new_limits.append(limits)
         self._add_limits(limits)
 
@@ -45,6 +48,7 @@ class ServiceAgreement:
         return self._deadlines
 
     def add_rule(self, event_type: EventType, rule: PostingRule) -> None:
+        self._check_not_frozen()
         self._posting_rules[event_type] = rule
 
     def find_payout_rule(self, event_type: EventType) -> PayoutPostingRule:
@@ -53,6 +57,14 @@ class ServiceAgreement:
     def find_deal_rule(self, event_type: EventType) -> DealPostingRule:
         return self._find_rule(event_type)
 
+    def freeze(self) -> ServiceAgreement:
+        self._is_frozen = True
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._is_frozen
+
     def _find_rule(self, event_type: EventType) -> PostingRule:
         rule = self._posting_rules.get(event_type, None)
         if rule is None:
@@ -60,5 +72,9 @@ class ServiceAgreement:
         
         return rule
     
+    def _check_not_frozen(self) -> None:
+        if self._is_frozen:
+            raise DomainError(AGREEMENT_IS_FROZEN)
+
     def _add_limits(self, limits: Limits) -> None:
         self._past_limits.put(limits.install_date.date(), limits)
\ No newline at end of file
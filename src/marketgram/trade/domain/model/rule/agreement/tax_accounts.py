@@ -0,0 +1,22 @@
+from uuid import UUID, uuid5
+from zlib import crc32
+
+
+class TaxAccounts:
+    def __init__(self, superuser_id: UUID, shards: int = 1) -> None:
+        self._account_ids = [superuser_id] + [
+            uuid5(superuser_id, f'tax-shard-{shard}') 
+            for shard in range(1, max(shards, 1))
+        ]
+
+    @property
+    def account_ids(self) -> list[UUID]:
+        return list(self._account_ids)
+
+    def for_source(self, source_id: object | None) -> UUID:
+        if source_id is None:
+            return self._account_ids[0]
+
+        shard = crc32(str(source_id).encode()) % len(self._account_ids)
+
+        return self._account_ids[shard]
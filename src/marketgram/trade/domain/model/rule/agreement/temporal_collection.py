@@ -1,3 +1,4 @@
+from bisect import bisect_right, insort
 from datetime import date
 
 from marketgram.trade.domain.model.rule.agreement.limits import (
@@ -7,27 +8,27 @@ from marketgram.trade.domain.model.rule.agreement.limits import (
 
 class TemporalCollection:
     def __init__(self):
-        self._contents = {}
-        self._cache: list[date] = None
+        self._contents: dict[date, Limits] = {}
+        self._milestones: list[date] = []
+        self._memo: dict[date, Limits] = {}
 
-    def get(self, date: date):
-        for milestone in self._milestone():
-            if milestone <= date:
-                return self._contents.get(milestone)
-            
-        raise ValueError
+    def get(self, date: date) -> Limits:
+        limits = self._memo.get(date)
+        if limits is not None:
+            return limits
+        
+        index = bisect_right(self._milestones, date)
+        if index == 0:
+            raise ValueError
+        
+        limits = self._contents[self._milestones[index - 1]]
+        self._memo[date] = limits
 
-    def put(self, date_from: date, limit: Limits):
-        self._contents[date_from] = limit
-        self._cache = None
+        return limits
 
-    def _milestone(self):
-        if self._cache is None:
-            self._calculate_milestones()
-        
-        return self._cache
+    def put(self, date_from: date, limit: Limits) -> None:
+        if date_from not in self._contents:
+            insort(self._milestones, date_from)
 
-    def _calculate_milestones(self):
-        self._cache = list(self._contents.keys())
-        self._cache.sort()
-        self._cache.reverse()
\ No newline at end of file
+        self._contents[date_from] = limit
+        self._memo.clear()
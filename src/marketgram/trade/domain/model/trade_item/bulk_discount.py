@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+
+
+@dataclass(frozen=True)
+class CardsFilter:
+    card_ids: tuple[int, ...] | None = None
+    region: Region | None = None
+    account_format: AccountFormat | None = None
+    min_price: Money | None = None
+    max_price: Money | None = None
+
+
+@dataclass(frozen=True)
+class BulkDiscount:
+    percent: Decimal | None = None
+    price: Money | None = None
+
+
+@dataclass(frozen=True)
+class RejectedCard:
+    card_id: int
+    reason: str
+
+
+@dataclass
+class BulkDiscountReport:
+    discounted: list[int] = field(default_factory=list)
+    rejected: list[RejectedCard] = field(default_factory=list)
@@ -1,7 +1,17 @@
-from datetime import datetime
+from dataclasses import replace
+from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
+from marketgram.trade.domain.model.events import (
+    AggregateRoot,
+    CardArchived,
+    CardCreated,
+    CardDescriptionChanged,
+    CardEvent,
+    CardPriceChanged,
+    CardShown
+)
 from marketgram.trade.domain.model.trade_item.exceptions import (
     DISCOUNT_ERROR, 
     UNACCEPTABLE_DISCOUNT_RANGE, 
@@ -13,7 +23,7 @@ from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.trade_item.description import Description
 
 
-class Card:
+class Card(AggregateRoot):
     def __init__(
         self,
         owner_id: UUID,
@@ -41,6 +51,9 @@ class Card:
         self._dirty_price = dirty_price
         self._is_archived = is_archived
         self._is_purchased = is_purchased
+
+        if card_id is None:
+            self._record(CardCreated(None, created_at, owner_id, price))
     
     def set_discounted_price(self, new_price: Money) -> None:
         initial_price = self._price
@@ -64,19 +77,39 @@ class Card:
         else:
             self._price = new_price
 
+        self._record(
+            CardPriceChanged(self._card_id, datetime.now(UTC), self._price)
+        )
+
     def remove_discount(self) -> None:
         if self._dirty_price is not None:
             self._price = self._dirty_price
             self._dirty_price = None
+            self._record(
+                CardPriceChanged(self._card_id, datetime.now(UTC), self._price)
+            )
 
     def change_description(self, description: Description) -> None:
         self._description = description
+        self._record(CardDescriptionChanged(self._card_id, datetime.now(UTC)))
 
     def archive(self) -> None:
         self._is_archived = True
+        self._record(CardArchived(self._card_id, datetime.now(UTC)))
 
     def show(self) -> None:
         self._is_archived = False
+        self._record(CardShown(self._card_id, datetime.now(UTC)))
+
+    def release_events(self) -> list[CardEvent]:
+        return [
+            replace(event, card_id=self._card_id) 
+            if event.card_id is None else event
+            for event in super().release_events()
+        ]
+
+    def from_stock(self) -> bool:
+        return self._delivery.from_stock()
     
     @property
     def card_id(self) -> UUID:
@@ -1,6 +1,11 @@
 from typing import Protocol
 from uuid import UUID
 
+from marketgram.trade.domain.model.trade_item.bulk_discount import (
+    BulkDiscount,
+    BulkDiscountReport,
+    CardsFilter
+)
 from marketgram.trade.domain.model.trade_item.card import Card
 from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.trade_item.sell_card import SellCard
@@ -9,6 +14,9 @@ from marketgram.trade.domain.model.trade_item.sell_card import SellCard
 class CardsRepository(Protocol):
     def add(self, card: Card) -> None:
         raise NotImplementedError
+
+    async def add_many(self, cards: list[Card]) -> list[int]:
+        raise NotImplementedError
     
     async def for_sale_with_price_and_id(
         self,
@@ -17,9 +25,27 @@ class CardsRepository(Protocol):
     ) -> SellCard | None:
         raise NotImplementedError
     
+    async def save_purchased(self, card: SellCard) -> None:
+        raise NotImplementedError
+    
+    async def with_owner_and_card_id(
+        self,
+        owner_id: UUID,
+        card_id: int
+    ) -> Card | None:
+        raise NotImplementedError
+
     async def for_edit_with_owner_and_card_id(
         self,
         owner_id: UUID,
         card_id: int
     ) -> Card | None:
+        raise NotImplementedError
+
+    async def set_discounted_prices(
+        self,
+        owner_id: UUID,
+        cards_filter: CardsFilter,
+        discount: BulkDiscount
+    ) -> BulkDiscountReport:
         raise NotImplementedError
\ No newline at end of file
@@ -18,4 +18,5 @@ BALANCE_BLOCKED = 'Операции с балансом невозможны. В
 BALANCE_IS_FROZEN = 'Баланс заморожен для вывода средств!'
 INSUFFICIENT_FUNDS = 'Недостаточно средств'
 NO_RULE = 'Невозможно выполнить операцию! Правило публикации отсутствует.'
-NO_WITHDRAWAL = 'Заявка на вывод средств отсутствует!'
\ No newline at end of file
+NO_WITHDRAWAL = 'Заявка на вывод средств отсутствует!'
+AGREEMENT_IS_FROZEN = 'Соглашение доступно только для чтения!'
\ No newline at end of file
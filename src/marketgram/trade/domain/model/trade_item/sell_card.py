@@ -1,6 +1,7 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
+from marketgram.trade.domain.model.events import AggregateRoot, CardPurchased
 from marketgram.trade.domain.model.trade_item.exceptions import DomainError
 from marketgram.trade.domain.model.p2p.deadlines import Deadlines
 from marketgram.trade.domain.model.p2p.delivery import Delivery
@@ -10,7 +11,7 @@ from marketgram.trade.domain.model.p2p.type_deal import TypeDeal
 from marketgram.trade.domain.model.rule.agreement.money import Money
 
 
-class SellCard:
+class SellCard(AggregateRoot):
     def __init__(
         self,
         card_id: int,
@@ -41,7 +42,17 @@ class SellCard:
         if self._is_purchased:
             raise DomainError()
         
+        if self.from_stock():
+            return
+        
+        if quantity != 1:
+            raise DomainError()
+        
         self._is_purchased = True
+        self._record(CardPurchased(self._card_id, datetime.now(UTC)))
+
+    def from_stock(self) -> bool:
+        return self._delivery.from_stock()
 
     def time_tags(self, current_time: datetime) -> TimeTags:
         return self._delivery.provide_time_tags(current_time)
@@ -0,0 +1,18 @@
+from typing import Protocol
+
+
+class StockRepository(Protocol):
+    async def allocate(
+        self, 
+        card_id: int, 
+        deal_id: int, 
+        qty: int
+    ) -> list[int]:
+        raise NotImplementedError
+    
+    async def add_many(
+        self, 
+        card_id: int, 
+        payloads: list[str]
+    ) -> int:
+        raise NotImplementedError
@@ -1,5 +1,117 @@
-from dishka import Provider
+import asyncio
+from typing import AsyncIterator
+
+from dishka import Provider, Scope, provide
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.identity.access.port.adapter.notification_listener import (
+    NotificationListener
+)
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
+from marketgram.trade.port.adapter.card_views_cache import (
+    INVALIDATION_CHANNEL,
+    CardViewsCache
+)
+from marketgram.trade.port.adapter.catalog_index import CatalogIndex
+from marketgram.trade.port.adapter.session_identity_provider import (
+    SessionIdentityProvider
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.card_views import (
+    SQLAlchemyCardViews
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog_index_loader import (
+    SQLAlchemyCatalogIndexLoader
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.deal_views import (
+    SQLAlchemyDealViews
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.statements import (
+    SQLAlchemyStatements
+)
 
 
 class TradeCommandHandlers(Provider):
-    pass
\ No newline at end of file
+    pass
+
+
+class TradeQueries(Provider):
+    scope = Scope.REQUEST
+
+    deal_views = provide(SQLAlchemyDealViews)
+    statements = provide(SQLAlchemyStatements)
+    catalog = provide(SQLAlchemyCatalog)
+
+    @provide(scope=Scope.APP)
+    async def card_views_cache(
+        self, 
+        engine: AsyncEngine
+    ) -> AsyncIterator[CardViewsCache]:
+        cache = CardViewsCache()
+        listener = NotificationListener(
+            engine.url.set(drivername='postgresql')
+            .render_as_string(hide_password=False),
+            INVALIDATION_CHANNEL,
+            cache.apply_notification,
+            cache.clear
+        )
+        listener.start()
+        yield cache
+
+        await listener.stop()
+
+    @provide(scope=Scope.APP)
+    def card_views(
+        self, 
+        engine: AsyncEngine,
+        cache: CardViewsCache
+    ) -> SQLAlchemyCardViews:
+        return SQLAlchemyCardViews(
+            async_sessionmaker(engine, expire_on_commit=False),
+            cache
+        )
+
+
+class TradeIdentityIoC(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    async def id_provider(
+        self,
+        request: Request,
+        async_session: AsyncSession,
+        cache: WebSessionsCache
+    ) -> IdProvider:
+        provider = SessionIdentityProvider(request, async_session, cache)
+        await provider.get_user_id()
+
+        return provider
+
+
+class TradeCatalogIndexIoC(Provider):
+    def __init__(self, memory_budget: int = 256 * 1024 * 1024) -> None:
+        super().__init__()
+        self._memory_budget = memory_budget
+
+    @provide(scope=Scope.APP)
+    async def catalog_index(
+        self, 
+        engine: AsyncEngine
+    ) -> AsyncIterator[CatalogIndex]:
+        index = CatalogIndex(self._memory_budget)
+        loader = SQLAlchemyCatalogIndexLoader(
+            async_sessionmaker(engine, expire_on_commit=False),
+            index
+        )
+        await loader.load()
+        task = asyncio.create_task(loader.run())
+        yield index
+
+        loader.stop()
+        await task
@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.balances_rebuild import (
+    SQLAlchemyBalancesRebuild
+)
+
+
+async def run(database_url: str, verify_only: bool) -> int:
+    engine = create_async_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            async with session.begin():
+                balances = SQLAlchemyBalancesRebuild(session)
+
+                if verify_only:
+                    mismatches = await balances.verify()
+                    for mismatch in mismatches:
+                        print(
+                            f'{mismatch.user_id} {mismatch.account_type}: '
+                            f'stored={mismatch.stored} expected={mismatch.expected}'
+                        )
+                    print(f'Mismatches: {len(mismatches)}')
+
+                    return 1 if mismatches else 0
+
+                rows = await balances.rebuild()
+                print(f'Balances rebuilt: {rows}')
+
+                return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Recompute the balances table from the entries ledger.'
+    )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='only compare stored balances with entries, do not write'
+    )
+    parser.add_argument(
+        '--database-url',
+        default=os.environ.get('DATABASE_URL')
+    )
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(run(args.database_url, args.verify)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+INVALIDATION_CHANNEL = 'card_view_invalidated'
+
+CardViewLoader = Callable[[int], Awaitable[dict | None]]
+
+
+class CardViewsCache:
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[dict, float]] = OrderedDict()
+        self._inflight: dict[int, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / lookups
+
+    async def get(self, card_id: int, loader: CardViewLoader) -> dict | None:
+        entry = self._entries.get(card_id)
+        if entry is not None:
+            view, cached_at = entry
+            if self._clock() - cached_at < self._ttl:
+                self._entries.move_to_end(card_id)
+                self.hits += 1
+                return view
+
+            del self._entries[card_id]
+
+        task = self._inflight.get(card_id)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(card_id, loader))
+            self._inflight[card_id] = task
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def invalidate(self, card_id: int) -> None:
+        self._entries.pop(card_id, None)
+        self._inflight.pop(card_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def apply_notification(self, payload: str) -> None:
+        self.invalidate(int(payload))
+
+    async def _load(self, card_id: int, loader: CardViewLoader) -> dict | None:
+        task = asyncio.current_task()
+        try:
+            view = await loader(card_id)
+        finally:
+            is_current = self._inflight.get(card_id) is task
+            if is_current:
+                del self._inflight[card_id]
+
+        if is_current and view is not None:
+            self._entries[card_id] = (view, self._clock())
+            self._entries.move_to_end(card_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return view
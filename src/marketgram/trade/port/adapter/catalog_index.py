@@ -0,0 +1,365 @@
+import heapq
+import math
+import re
+import sys
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from decimal import Decimal
+
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+
+TOKEN = re.compile(r'\w+')
+MAX_PREFIX_EXPANSIONS = 64
+POSTING_BYTES = 80
+DOCUMENT_BYTES = 400
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class CatalogDocument:
+    card_id: int
+    title: str
+    text_description: str
+    account_format: AccountFormat
+    region: Region
+    spam_block: bool
+    price: Decimal
+
+
+@dataclass(frozen=True)
+class CatalogHit:
+    card_id: int
+    title: str
+    price: Decimal
+    score: float
+
+
+def _to_bytes(mask: int) -> bytes:
+    return mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+
+
+def _has(mask: bytes, slot: int) -> bool:
+    index = slot >> 3
+
+    return index < len(mask) and bool(mask[index] >> (slot & 7) & 1)
+
+
+class Bitset:
+    def __init__(self) -> None:
+        self._bits = bytearray()
+
+    def add(self, slot: int) -> None:
+        index = slot >> 3
+        if index >= len(self._bits):
+            self._bits.extend(bytes(index - len(self._bits) + 1))
+
+        self._bits[index] |= 1 << (slot & 7)
+
+    def discard(self, slot: int) -> None:
+        index = slot >> 3
+        if index < len(self._bits):
+            self._bits[index] &= ~(1 << (slot & 7)) & 0xFF
+
+    def to_int(self) -> int:
+        return int.from_bytes(self._bits, 'little')
+
+
+class CatalogIndex:
+    def __init__(
+        self,
+        memory_budget: int = 256 * 1024 * 1024,
+        k1: float = 1.2,
+        b: float = 0.75
+    ) -> None:
+        self._memory_budget = memory_budget
+        self._k1 = k1
+        self._b = b
+        self._slots: dict[int, int] = {}
+        self._free_slots: list[int] = []
+        self._documents: list[CatalogDocument | None] = []
+        self._document_terms: list[Counter | None] = []
+        self._lengths: list[int] = []
+        self._postings: dict[str, dict[int, int]] = {}
+        self._terms: list[str] = []
+        self._terms_sorted = True
+        self._by_price: list[tuple[Decimal, int, int]] = []
+        self._facets: dict[tuple[str, object], Bitset] = {}
+        self._alive = Bitset()
+        self._total_length = 0
+        self._posting_count = 0
+        self._term_bytes = 0
+        self._is_complete = True
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    @property
+    def is_complete(self) -> bool:
+        return self._is_complete
+
+    def memory_usage(self) -> int:
+        return (
+            self._posting_count * POSTING_BYTES
+            + len(self._slots) * DOCUMENT_BYTES
+            + self._term_bytes
+        )
+
+    def upsert(self, document: CatalogDocument) -> bool:
+        self.remove(document.card_id)
+        if self.memory_usage() >= self._memory_budget:
+            self._is_complete = False
+            return False
+
+        slot = self._free_slots.pop() if self._free_slots else len(self._documents)
+        if slot == len(self._documents):
+            self._documents.append(None)
+            self._document_terms.append(None)
+            self._lengths.append(0)
+
+        terms = Counter(tokenize(f'{document.title} {document.text_description}'))
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._terms.append(term)
+                self._terms_sorted = False
+                self._term_bytes += sys.getsizeof(term)
+
+            postings[slot] = frequency
+
+        self._slots[document.card_id] = slot
+        self._documents[slot] = document
+        self._document_terms[slot] = terms
+        self._lengths[slot] = terms.total()
+        self._total_length += self._lengths[slot]
+        self._posting_count += len(terms)
+        insort(self._by_price, (document.price, document.card_id, slot))
+        for facet in self._facet_keys(document):
+            self._facets.setdefault(facet, Bitset()).add(slot)
+
+        self._alive.add(slot)
+
+        return True
+
+    def remove(self, card_id: int) -> None:
+        slot = self._slots.pop(card_id, None)
+        if slot is None:
+            return
+
+        document = self._documents[slot]
+        terms = self._document_terms[slot]
+        for term in terms:
+            postings = self._postings[term]
+            del postings[slot]
+            if not postings:
+                del self._postings[term]
+                sorted_terms = self._sorted_terms()
+                del sorted_terms[bisect_left(sorted_terms, term)]
+                self._term_bytes -= sys.getsizeof(term)
+
+        position = bisect_left(self._by_price, (document.price, card_id, slot))
+        del self._by_price[position]
+        for facet in self._facet_keys(document):
+            self._facets[facet].discard(slot)
+
+        self._alive.discard(slot)
+        self._total_length -= self._lengths[slot]
+        self._posting_count -= len(terms)
+        self._documents[slot] = None
+        self._document_terms[slot] = None
+        self._free_slots.append(slot)
+
+    def search(
+        self,
+        query: str | None = None,
+        region: Region | None = None,
+        account_format: AccountFormat | None = None,
+        spam_block: bool | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        limit: int = 20
+    ) -> list[CatalogHit]:
+        mask = _to_bytes(self._mask(region, account_format, spam_block))
+        tokens = tokenize(query or '')
+        if not tokens:
+            return self._cheapest(mask, min_price, max_price, limit)
+
+        scores = self._scores(tokens)
+        hits = (
+            (score, slot) for slot, score in scores.items()
+            if _has(mask, slot)
+            and self._in_price_range(self._documents[slot], min_price, max_price)
+        )
+        return [
+            self._hit(slot, score)
+            for score, slot in heapq.nlargest(limit, hits)
+        ]
+
+    def facets(
+        self,
+        query: str | None = None,
+        region: Region | None = None,
+        account_format: AccountFormat | None = None,
+        spam_block: bool | None = None
+    ) -> dict[str, dict]:
+        mask = self._mask(region, account_format, spam_block)
+        tokens = tokenize(query or '')
+        if tokens:
+            matched = Bitset()
+            for slot in self._scores(tokens):
+                matched.add(slot)
+            mask &= matched.to_int()
+
+        facets = {'region': {}, 'account_format': {}, 'spam_block': {}}
+        for (name, value), bitset in self._facets.items():
+            count = (mask & bitset.to_int()).bit_count()
+            if count:
+                facets[name][value] = count
+
+        return facets
+
+    def _scores(self, tokens: list[str]) -> dict[int, float]:
+        expansions = [
+            [self._postings[term] for term in self._expand(token)]
+            for token in tokens
+        ]
+        expansions.sort(key=lambda postings: sum(map(len, postings)))
+        if not expansions or not expansions[0]:
+            return {}
+
+        document_count = len(self._slots)
+        k1, b = self._k1, self._b
+        lengths = self._lengths
+        norm = k1 * b / (self._total_length / document_count)
+        base = k1 * (1 - b)
+
+        scores: dict[int, float] = {}
+        for position, postings in enumerate(expansions):
+            token_scores: dict[int, float] = {}
+            for term_postings in postings:
+                idf = math.log(
+                    1 + (document_count - len(term_postings) + 0.5) 
+                    / (len(term_postings) + 0.5)
+                ) * (k1 + 1)
+                candidates = (
+                    term_postings.items() if position == 0
+                    else (
+                        (slot, term_postings[slot]) 
+                        for slot in scores if slot in term_postings
+                    )
+                )
+                for slot, frequency in candidates:
+                    score = idf * frequency / (
+                        frequency + base + norm * lengths[slot]
+                    )
+                    if score > token_scores.get(slot, 0.0):
+                        token_scores[slot] = score
+
+            if position == 0:
+                scores = token_scores
+            else:
+                scores = {
+                    slot: score + scores[slot] 
+                    for slot, score in token_scores.items()
+                }
+            if not scores:
+                break
+
+        return scores
+
+    def _expand(self, token: str) -> list[str]:
+        sorted_terms = self._sorted_terms()
+        position = bisect_left(sorted_terms, token)
+        terms = []
+        while (
+            position < len(sorted_terms)
+            and sorted_terms[position].startswith(token)
+            and len(terms) < MAX_PREFIX_EXPANSIONS
+        ):
+            terms.append(sorted_terms[position])
+            position += 1
+
+        return terms
+
+    def _sorted_terms(self) -> list[str]:
+        if not self._terms_sorted:
+            self._terms.sort()
+            self._terms_sorted = True
+
+        return self._terms
+
+    def _mask(
+        self,
+        region: Region | None,
+        account_format: AccountFormat | None,
+        spam_block: bool | None
+    ) -> int:
+        mask = self._alive.to_int()
+        for facet in (
+            ('region', region),
+            ('account_format', account_format),
+            ('spam_block', spam_block)
+        ):
+            if facet[1] is None:
+                continue
+
+            bitset = self._facets.get(facet)
+            mask &= bitset.to_int() if bitset is not None else 0
+
+        return mask
+
+    def _cheapest(
+        self,
+        mask: bytes,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+        limit: int
+    ) -> list[CatalogHit]:
+        position = 0
+        if min_price is not None:
+            position = bisect_left(self._by_price, (min_price,))
+
+        hits = []
+        while position < len(self._by_price) and len(hits) < limit:
+            price, _, slot = self._by_price[position]
+            if max_price is not None and price > max_price:
+                break
+            if _has(mask, slot):
+                hits.append(self._hit(slot, 0.0))
+
+            position += 1
+
+        return hits
+
+    def _hit(self, slot: int, score: float) -> CatalogHit:
+        document = self._documents[slot]
+
+        return CatalogHit(document.card_id, document.title, document.price, score)
+
+    def _in_price_range(
+        self,
+        document: CatalogDocument,
+        min_price: Decimal | None,
+        max_price: Decimal | None
+    ) -> bool:
+        if min_price is not None and document.price < min_price:
+            return False
+        if max_price is not None and document.price > max_price:
+            return False
+
+        return True
+
+    def _facet_keys(self, document: CatalogDocument) -> list[tuple[str, object]]:
+        return [
+            ('region', document.region),
+            ('account_format', document.account_format),
+            ('spam_block', document.spam_block)
+        ]
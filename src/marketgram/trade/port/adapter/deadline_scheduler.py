@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.rule.agreement.service_agreement import (
+    ServiceAgreement
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.deals_repository import (
+    SQLAlchemyDealsRepository
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeadlineSchedulerMetrics:
+    cancelled: int = 0
+    received: int = 0
+    confirmed: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    quarantined: int = 0
+    backlog: dict[StatusDeal, int] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def processed(self) -> int:
+        return self.cancelled + self.received + self.confirmed
+
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        if elapsed <= 0:
+            return 0.0
+
+        return self.processed / elapsed
+
+
+class DeadlineSchedulerWorker:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        agreement: ServiceAgreement,
+        batch_size: int = 100,
+        idle_interval: float = 5.0,
+        max_backoff: float = 60.0,
+        quarantine_ttl: float = 300.0,
+        max_quarantined: int = 1000,
+        metrics: DeadlineSchedulerMetrics = None
+    ) -> None:
+        self._session_factory = session_factory
+        self._agreement = agreement
+        self._batch_size = batch_size
+        self._idle_interval = idle_interval
+        self._max_backoff = max_backoff
+        self._quarantine_ttl = quarantine_ttl
+        self._max_quarantined = max_quarantined
+        self._metrics = metrics or DeadlineSchedulerMetrics()
+        self._quarantined: dict[int, float] = {}
+        self._stopped = asyncio.Event()
+
+    @property
+    def metrics(self) -> DeadlineSchedulerMetrics:
+        return self._metrics
+
+    async def run(self) -> None:
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                processed = await self.run_once()
+                if processed:
+                    failures = 0
+                    continue
+
+                await self.refresh_backlog()
+                failures = 0
+                delay = self._idle_interval
+            except Exception:
+                logger.exception('Deadline scheduler batch failed')
+                failures += 1
+                delay = min(
+                    self._idle_interval * 2 ** failures, 
+                    self._max_backoff
+                )
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run_once(self) -> int:
+        cancelled = await self._batch(self._cancel_unshipped)
+        received = await self._batch(self._receive_unreceived)
+        confirmed = await self._batch(self._confirm_unconfirmed)
+
+        self._metrics.cancelled += cancelled
+        self._metrics.received += received
+        self._metrics.confirmed += confirmed
+
+        return cancelled + received + confirmed
+
+    async def refresh_backlog(self) -> dict[StatusDeal, int]:
+        async with self._session_factory() as session:
+            backlog = await self._repository(session) \
+                .overdue_count(datetime.now(UTC))
+
+        self._metrics.backlog = backlog
+
+        return backlog
+
+    async def _batch(self, process) -> int:
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    processed = await process(session, datetime.now(UTC))
+        except Exception:
+            self._metrics.failed_batches += 1
+            raise
+
+        self._metrics.batches += 1
+
+        return processed
+
+    async def _cancel_unshipped(
+        self,
+        session: AsyncSession,
+        current_date: datetime
+    ) -> int:
+        deals = await self._repository(session).overdue_unshipped(
+            current_date,
+            self._batch_size,
+            self._active_quarantine()
+        )
+        return await self._apply(
+            session, 
+            deals, 
+            lambda deal: deal.cancel(current_date)
+        )
+
+    async def _receive_unreceived(
+        self,
+        session: AsyncSession,
+        current_date: datetime
+    ) -> int:
+        deals = await self._repository(session).overdue_unreceived(
+            current_date,
+            self._batch_size,
+            self._active_quarantine()
+        )
+        return await self._apply(
+            session, 
+            deals, 
+            lambda deal: deal.receive_by_deadline(current_date)
+        )
+
+    async def _confirm_unconfirmed(
+        self,
+        session: AsyncSession,
+        current_date: datetime
+    ) -> int:
+        deals = await self._repository(session).overdue_unconfirmed(
+            current_date,
+            self._batch_size,
+            self._active_quarantine()
+        )
+        for deal in deals:
+            deal.accept_agreement(self._agreement)
+
+        return await self._apply(
+            session, 
+            deals, 
+            lambda deal: deal.confirm_by_deadline(current_date)
+        )
+
+    async def _apply(self, session: AsyncSession, deals: list, transition) -> int:
+        applied = 0
+        for deal in deals:
+            try:
+                async with session.begin_nested():
+                    transition(deal)
+                    await session.flush()
+            except Exception:
+                logger.exception(
+                    'Deal %s failed its deadline transition and is quarantined', 
+                    deal._deal_id
+                )
+                self._quarantine(deal._deal_id)
+                continue
+
+            applied += 1
+
+        return applied
+
+    def _quarantine(self, deal_id: int) -> None:
+        self._quarantined.pop(deal_id, None)
+        self._quarantined[deal_id] = time.monotonic() + self._quarantine_ttl
+        while len(self._quarantined) > self._max_quarantined:
+            del self._quarantined[next(iter(self._quarantined))]
+
+        self._metrics.quarantined += 1
+
+    def _active_quarantine(self) -> list[int]:
+        now = time.monotonic()
+        for deal_id, until in list(self._quarantined.items()):
+            if until <= now:
+                del self._quarantined[deal_id]
+
+        return list(self._quarantined)
+
+    def _repository(self, session: AsyncSession) -> SQLAlchemyDealsRepository:
+        return SQLAlchemyDealsRepository(session)
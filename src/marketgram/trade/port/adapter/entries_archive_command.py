@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import os
+from datetime import date, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.entries_archive import (
+    SQLAlchemyEntriesArchive
+)
+
+
+def month_start(today: date, months_back: int) -> datetime:
+    year, index = divmod(today.month - 1 - months_back, 12)
+
+    return datetime(today.year + year, index + 1, 1)
+
+
+async def run(
+    database_url: str,
+    keep_months: int,
+    ahead: int,
+    detach: bool
+) -> int:
+    today = date.today()
+    cutoff = month_start(today, keep_months)
+
+    engine = create_async_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            async with session.begin():
+                archive = SQLAlchemyEntriesArchive(session)
+
+                partitions = await archive.create_partitions(today, ahead)
+                print(f'Partitions ensured: {", ".join(partitions)}')
+
+                result = await archive.archive(cutoff)
+                print(
+                    f'Entries archived before {cutoff:%Y-%m-%d}: {result.archived} '
+                    f'(checkpoints updated: {result.checkpoints})'
+                )
+
+                if detach:
+                    detached = await archive.detach_archived(cutoff)
+                    print(f'Partitions detached: {len(detached)}')
+
+                return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Roll settled entries into balance checkpoints and maintain entries partitions.'
+    )
+    parser.add_argument(
+        '--keep-months',
+        type=int,
+        default=3,
+        help='number of recent months whose entries stay live'
+    )
+    parser.add_argument(
+        '--ahead',
+        type=int,
+        default=2,
+        help='number of upcoming monthly partitions to create'
+    )
+    parser.add_argument(
+        '--detach',
+        action='store_true',
+        help='detach partitions that only hold archived entries'
+    )
+    parser.add_argument(
+        '--database-url',
+        default=os.environ.get('DATABASE_URL')
+    )
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(
+        run(args.database_url, args.keep_months, args.ahead, args.detach)
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+class InfrastructureError(Exception):
+    pass
+
+
+class ConcurrencyConflictError(InfrastructureError):
+    pass
+
+CONCURRENT_PURCHASE = 'Товар уже купил другой покупатель или он был изменен. Повторите попытку!'
+
+
+class AuthorisationError(InfrastructureError):
+    pass
+
+ACCESS_DENIED = 'Требуется авторизация. Пожалуйста, войдите в свою учетную запись!'
+
+
+class StatementPeriodError(InfrastructureError):
+    pass
+
+DETACHED_PERIOD = 'Выписка за этот период больше недоступна. Выберите более позднюю дату начала!'
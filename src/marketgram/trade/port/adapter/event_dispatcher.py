@@ -0,0 +1,55 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from marketgram.trade.domain.model.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    event_id: int
+    aggregate_type: str
+    aggregate_id: str
+    event_type: str
+    payload: dict
+    occurred_at: datetime
+
+
+Subscriber = Callable[[OutboxMessage], Awaitable[None]]
+
+
+class EventDispatcher:
+    def __init__(self) -> None:
+        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+
+    def subscribe(
+        self, 
+        event_type: type[DomainEvent] | str, 
+        subscriber: Subscriber
+    ) -> None:
+        if not isinstance(event_type, str):
+            event_type = event_type.__name__
+
+        self._subscribers[event_type].append(subscriber)
+
+    async def dispatch(self, messages: list[OutboxMessage]) -> None:
+        streams: dict[tuple[str, str], list[OutboxMessage]] = defaultdict(list)
+        for message in messages:
+            if message.event_type in self._subscribers:
+                streams[(message.aggregate_type, message.aggregate_id)] \
+                    .append(message)
+
+        results = await asyncio.gather(
+            *[self._dispatch_stream(stream) for stream in streams.values()],
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _dispatch_stream(self, stream: list[OutboxMessage]) -> None:
+        for message in stream:
+            for subscriber in self._subscribers[message.event_type]:
+                await subscriber(message)
@@ -1,35 +1,95 @@
+import time
+from collections import OrderedDict
 from uuid import UUID
-from aiohttp import ClientSession
 
-from fastapi import Request, Response
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from fastapi import Request
+
+from marketgram.trade.port.adapter.errors import (
+    ACCESS_DENIED,
+    AuthorisationError
+)
+
+
+def identity_client_session(
+    base_url: str,
+    pool_size: int = 100,
+    keepalive_timeout: float = 30.0,
+    timeout: float = 2.0
+) -> ClientSession:
+    return ClientSession(
+        base_url,
+        connector=TCPConnector(
+            limit=pool_size,
+            keepalive_timeout=keepalive_timeout
+        ),
+        timeout=ClientTimeout(total=timeout)
+    )
+
+
+class UserIdMemo:
+    def __init__(self, ttl: float = 5.0, max_size: int = 10_000) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[UUID, float]] = OrderedDict()
+
+    def get(self, session_id: str) -> UUID | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+
+        user_id, cached_at = entry
+        if time.monotonic() - cached_at >= self._ttl:
+            del self._entries[session_id]
+            return None
+
+        return user_id
+
+    def put(self, session_id: str, user_id: UUID) -> None:
+        self._entries[session_id] = (user_id, time.monotonic())
+        self._entries.move_to_end(session_id)
+
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
 
 
 class AiohttpIdentityProvider:
     def __init__(
         self,
         request: Request,
-        response: Response,
-        client_session: ClientSession
+        client_session: ClientSession,
+        memo: UserIdMemo
     ):
         self._request = request
-        self._response = response
         self._client_session = client_session
+        self._memo = memo
+        self._provided_id = None
 
     def provided_id(self) -> UUID:
+        if self._provided_id is None:
+            raise AuthorisationError(ACCESS_DENIED)
+
         return self._provided_id
     
     async def get_user_id(self) -> None:
         session_id = self._request.cookies.get('s_id')
         if session_id is None:
-            raise 
-        
+            raise AuthorisationError(ACCESS_DENIED)
+
+        user_id = self._memo.get(session_id)
+        if user_id is None:
+            user_id = await self._fetch_user_id(session_id)
+            self._memo.put(session_id, user_id)
+
+        self._provided_id = user_id
+
+    async def _fetch_user_id(self, session_id: str) -> UUID:
         async with self._client_session.get(
-            f'http://localhost/user/', 
-            params={'session_id': session_id}
+            f'/identity/user/{session_id}'
         ) as response:
+            if response.status != 200:
+                raise AuthorisationError(ACCESS_DENIED)
+
             json = await response.json()
 
-            if response.start == 200:
-                self._provided_id = ...
-            else:
-                raise
\ No newline at end of file
+            return UUID(json['user_id'])
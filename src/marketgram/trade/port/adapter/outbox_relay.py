@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.port.adapter.event_dispatcher import (
+    EventDispatcher,
+    OutboxMessage
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+
+OUTBOX_RELAY_LOCK = 0x6F7574626F78
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxRelayMetrics:
+    published: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    lag: float = 0.0
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        dispatcher: EventDispatcher,
+        batch_size: int = 500,
+        idle_interval: float = 0.5,
+        max_backoff: float = 30.0,
+        metrics: OutboxRelayMetrics = None
+    ) -> None:
+        self._session_factory = session_factory
+        self._dispatcher = dispatcher
+        self._batch_size = batch_size
+        self._idle_interval = idle_interval
+        self._max_backoff = max_backoff
+        self._metrics = metrics or OutboxRelayMetrics()
+        self._stopped = asyncio.Event()
+
+    @property
+    def metrics(self) -> OutboxRelayMetrics:
+        return self._metrics
+
+    async def run(self) -> None:
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if await self.run_once():
+                    failures = 0
+                    continue
+
+                failures = 0
+                delay = self._idle_interval
+            except Exception:
+                logger.exception('Outbox relay batch failed')
+                failures += 1
+                delay = min(
+                    self._idle_interval * 2 ** failures, 
+                    self._max_backoff
+                )
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run_once(self) -> int:
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    published = await self._publish_batch(session)
+        except Exception:
+            self._metrics.failed_batches += 1
+            raise
+
+        if published:
+            self._metrics.batches += 1
+            self._metrics.published += published
+
+        return published
+
+    async def _publish_batch(self, session: AsyncSession) -> int:
+        is_leader = await session.scalar(
+            select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK))
+        )
+        if not is_leader:
+            return 0
+
+        result = await session.execute(
+            select(
+                outbox_table.c.event_id,
+                outbox_table.c.aggregate_type,
+                outbox_table.c.aggregate_id,
+                outbox_table.c.event_type,
+                outbox_table.c.payload,
+                outbox_table.c.occurred_at
+            )
+            .where(outbox_table.c.published_at.is_(None))
+            .order_by(outbox_table.c.event_id)
+            .limit(self._batch_size)
+        )
+        messages = [OutboxMessage(*row) for row in result]
+        if not messages:
+            self._metrics.lag = 0.0
+            return 0
+
+        await self._dispatcher.dispatch(messages)
+
+        current_date = datetime.now(UTC)
+        await session.execute(
+            update(outbox_table)
+            .where(outbox_table.c.event_id.in_(
+                [message.event_id for message in messages]
+            ))
+            .values(published_at=current_date)
+        )
+        self._metrics.lag = (
+            current_date - messages[0].occurred_at
+        ).total_seconds()
+
+        return len(messages)
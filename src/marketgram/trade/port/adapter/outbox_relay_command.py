@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import os
+import signal
+
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+from marketgram.trade.port.adapter.event_dispatcher import EventDispatcher
+from marketgram.trade.port.adapter.outbox_relay import OutboxRelay
+from marketgram.trade.port.adapter.sqlalchemy_resources.deal_views import (
+    SQLAlchemyDealViewsProjection
+)
+
+
+def event_dispatcher(
+    session_factory: async_sessionmaker[AsyncSession]
+) -> EventDispatcher:
+    dispatcher = EventDispatcher()
+    SQLAlchemyDealViewsProjection(session_factory).subscribe(dispatcher)
+
+    return dispatcher
+
+
+async def run(database_url: str, batch_size: int) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    relay = OutboxRelay(
+        session_factory,
+        event_dispatcher(session_factory),
+        batch_size=batch_size
+    )
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, relay.stop)
+
+    try:
+        await relay.run()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Publish trade domain events from the outbox table.'
+    )
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument(
+        '--database-url',
+        default=os.environ.get('DATABASE_URL')
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.database_url, args.batch_size))
+
+
+if __name__ == '__main__':
+    main()
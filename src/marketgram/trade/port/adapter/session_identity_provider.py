@@ -0,0 +1,55 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
+    IAMContext
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.web_sessions_repository import (
+    WebSessionsRepository
+)
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
+from marketgram.trade.port.adapter.errors import (
+    ACCESS_DENIED,
+    AuthorisationError
+)
+
+
+class SessionIdentityProvider:
+    def __init__(
+        self,
+        request: Request,
+        async_session: AsyncSession,
+        cache: WebSessionsCache
+    ) -> None:
+        self._request = request
+        self._web_sessions_repository = WebSessionsRepository(
+            IAMContext(async_session),
+            cache
+        )
+        self._provided_id = None
+
+    def provided_id(self) -> UUID:
+        if self._provided_id is None:
+            raise AuthorisationError(ACCESS_DENIED)
+
+        return self._provided_id
+
+    async def get_user_id(self) -> None:
+        web_session = await self._web_sessions_repository.lively_with_id(
+            self._session_id(), datetime.now(UTC)
+        )
+        if web_session is None:
+            raise AuthorisationError(ACCESS_DENIED)
+
+        self._provided_id = web_session.user_id
+
+    def _session_id(self) -> UUID:
+        try:
+            return UUID(self._request.cookies['s_id'])
+        except (KeyError, ValueError):
+            raise AuthorisationError(ACCESS_DENIED)
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balance_checkpoints_table import (
+    balance_checkpoints_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balances_table import (
+    balances_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+
+
+@dataclass(frozen=True)
+class BalanceMismatch:
+    user_id: UUID
+    account_type: str
+    stored: Decimal
+    expected: Decimal
+
+
+class SQLAlchemyBalancesRebuild:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def rebuild(self) -> int:
+        await self._async_session.execute(
+            text('LOCK TABLE entries, balance_checkpoints IN SHARE MODE')
+        )
+        await self._async_session.execute(delete(balances_table))
+
+        expected = self._expected_query()
+        result = await self._async_session.execute(
+            insert(balances_table)
+            .from_select(
+                ['user_id', 'account_type', 'amount'],
+                select(
+                    expected.c.user_id,
+                    expected.c.account_type,
+                    expected.c.amount
+                )
+            )
+        )
+        return result.rowcount
+
+    async def verify(self) -> list[BalanceMismatch]:
+        expected = self._expected_query()
+        stored_amount = func.coalesce(balances_table.c.amount, literal(0))
+        expected_amount = func.coalesce(expected.c.amount, literal(0))
+
+        stmt = (
+            select(
+                func.coalesce(balances_table.c.user_id, expected.c.user_id),
+                func.coalesce(balances_table.c.account_type, expected.c.account_type),
+                stored_amount,
+                expected_amount
+            )
+            .select_from(
+                balances_table.outerjoin(
+                    expected,
+                    and_(
+                        balances_table.c.user_id == expected.c.user_id,
+                        balances_table.c.account_type == expected.c.account_type
+                    ),
+                    full=True
+                )
+            )
+            .where(stored_amount != expected_amount)
+        )
+        result = await self._async_session.execute(stmt)
+
+        return [BalanceMismatch(*row) for row in result]
+
+    def _expected_query(self):
+        amounts = union_all(
+            select(
+                balance_checkpoints_table.c.user_id,
+                balance_checkpoints_table.c.account_type,
+                balance_checkpoints_table.c.amount
+            ),
+            select(
+                entries_table.c.user_id,
+                entries_table.c.account_type,
+                entries_table.c.amount
+            )
+            .where(and_(
+                entries_table.c.entry_status == EntryStatus.ACCEPTED,
+                entries_table.c.is_archived.is_(False)
+            ))
+        ).subquery('amounts')
+
+        return (
+            select(
+                amounts.c.user_id,
+                amounts.c.account_type,
+                func.sum(amounts.c.amount).label('amount')
+            )
+            .group_by(
+                amounts.c.user_id,
+                amounts.c.account_type
+            )
+            .subquery('expected')
+        )
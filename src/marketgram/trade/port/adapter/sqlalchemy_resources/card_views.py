@@ -0,0 +1,57 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.port.adapter.card_views_cache import CardViewsCache
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+
+
+class SQLAlchemyCardViews:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: CardViewsCache
+    ) -> None:
+        self._session_factory = session_factory
+        self._cache = cache
+
+    async def with_id(self, card_id: int) -> dict | None:
+        return await self._cache.get(card_id, self._load)
+
+    async def _load(self, card_id: int) -> dict | None:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(
+                    cards_table.c.card_id,
+                    cards_table.c.owner_id,
+                    cards_table.c.price,
+                    cards_table.c.dirty_price,
+                    cards_table.c.title,
+                    cards_table.c.text_description,
+                    cards_table.c.account_format,
+                    cards_table.c.region,
+                    cards_table.c.spam_block,
+                    cards_table.c.format,
+                    cards_table.c.method,
+                    cards_table.c.shipping_hours,
+                    cards_table.c.receipt_hours,
+                    cards_table.c.check_hours,
+                    cards_table.c.created_at,
+                    cards_table.c.is_archived,
+                    cards_table.c.is_purchased
+                )
+                .where(cards_table.c.card_id == card_id)
+            )
+            row = result.one_or_none()
+
+        if row is None:
+            return None
+
+        view = row._asdict()
+        view['owner_id'] = str(row.owner_id)
+        view['price'] = str(row.price)
+        view['dirty_price'] = None if row.dirty_price is None else str(row.dirty_price)
+        view['created_at'] = row.created_at.isoformat()
+
+        return view
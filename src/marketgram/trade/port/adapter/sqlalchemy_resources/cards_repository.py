@@ -1,21 +1,92 @@
+from datetime import UTC, datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    update
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm.exc import StaleDataError
 
+from marketgram.trade.domain.model.events import CardEvent, CardPriceChanged
 from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.bulk_discount import (
+    BulkDiscount,
+    BulkDiscountReport,
+    CardsFilter,
+    RejectedCard
+)
 from marketgram.trade.domain.model.trade_item.card import Card
+from marketgram.trade.domain.model.trade_item.exceptions import (
+    DISCOUNT_ERROR,
+    UNACCEPTABLE_DISCOUNT_RANGE
+)
 from marketgram.trade.domain.model.trade_item.sell_card import SellCard
+from marketgram.trade.port.adapter.errors import (
+    CONCURRENT_PURCHASE,
+    ConcurrencyConflictError
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.outbox_writer import (
+    outbox_row
+)
+
+LOCK_NOT_AVAILABLE = '55P03'
+DISCOUNT_REJECTED = 'discount_error'
+RANGE_REJECTED = 'unacceptable_range'
 
 
 class SQLAlchemyCardsRepository:
     def __init__(
         self,
-        async_session: AsyncSession
+        async_session: AsyncSession,
+        lock_timeout_ms: int = 500
     ) -> None:
         self._async_session = async_session
+        self._lock_timeout_ms = lock_timeout_ms
 
     def add(self, card: Card) -> None:
         self._async_session.add(card)
+
+    async def add_many(self, cards: list[Card]) -> list[int]:
+        if not cards:
+            return []
+
+        result = await self._async_session.execute(
+            insert(cards_table).returning(
+                cards_table.c.card_id, 
+                sort_by_parameter_order=True
+            ),
+            [self._card_row(card) for card in cards]
+        )
+        card_ids = list(result.scalars())
+        for card, card_id in zip(cards, card_ids):
+            card._card_id = card_id
+
+        await self._async_session.execute(
+            insert(outbox_table),
+            [
+                outbox_row(domain_event) 
+                for card in cards 
+                for domain_event in card.release_events()
+            ]
+        )
+        return card_ids
     
     async def for_sale_with_price_and_id(
         self,
@@ -26,14 +97,45 @@ class SQLAlchemyCardsRepository:
             select(SellCard)
             .where(and_(
                 SellCard._price == price,
-                SellCard._card_id == card_id
+                SellCard._card_id == card_id,
+                SellCard._is_purchased == False,
+                SellCard._is_archived == False
             ))
-            .with_for_update()
         )
         result = await self._async_session.execute(stmt)
 
         return result.scalar_one_or_none()
     
+    async def save_purchased(self, card: SellCard) -> None:
+        await self._async_session.execute(
+            text(f"SET LOCAL lock_timeout = '{int(self._lock_timeout_ms)}ms'")
+        )
+        try:
+            await self._async_session.flush()
+        except StaleDataError as error:
+            raise ConcurrencyConflictError(CONCURRENT_PURCHASE) from error
+        except OperationalError as error:
+            if getattr(error.orig, 'sqlstate', None) != LOCK_NOT_AVAILABLE:
+                raise
+            
+            raise ConcurrencyConflictError(CONCURRENT_PURCHASE) from error
+    
+    async def with_owner_and_card_id(
+        self,
+        owner_id: UUID,
+        card_id: int
+    ) -> Card | None:
+        stmt = (
+            select(Card)
+            .where(and_(
+                Card._owner_id == owner_id,
+                Card._card_id == card_id
+            ))
+        )
+        result = await self._async_session.execute(stmt)
+
+        return result.scalar_one_or_none()
+
     async def for_edit_with_owner_and_card_id(
         self,
         owner_id: UUID,
@@ -49,4 +151,170 @@ class SQLAlchemyCardsRepository:
         )
         result = await self._async_session.execute(stmt)
 
-        return result.scalar_one_or_none()
\ No newline at end of file
+        return result.scalar_one_or_none()
+    
+    async def set_discounted_prices(
+        self,
+        owner_id: UUID,
+        cards_filter: CardsFilter,
+        discount: BulkDiscount
+    ) -> BulkDiscountReport:
+        initial_price = func.coalesce(
+            cards_table.c.dirty_price, 
+            cards_table.c.price
+        )
+        if discount.percent is not None:
+            new_price = func.round_half_even(
+                initial_price * (100 - discount.percent) / 100, 2
+            )
+        else:
+            new_price = literal(discount.price.number, cards_table.c.price.type)
+
+        candidates = (
+            select(
+                cards_table.c.card_id,
+                cards_table.c.min_price,
+                initial_price.label('initial_price'),
+                new_price.label('new_price'),
+                (
+                    cards_table.c.min_price + func.round_half_even(
+                        cards_table.c.min_price * cards_table.c.min_discount, 2
+                    )
+                ).label('discount_floor'),
+                (
+                    initial_price - func.round_half_even(
+                        initial_price * cards_table.c.min_discount, 2
+                    )
+                ).label('max_limit')
+            )
+            .where(and_(
+                cards_table.c.owner_id == owner_id,
+                cards_table.c.is_purchased.is_(False),
+                *self._filters(cards_filter)
+            ))
+            .with_for_update()
+            .cte('candidates')
+        )
+        decided = select(
+            candidates,
+            case(
+                (
+                    candidates.c.initial_price < candidates.c.discount_floor, 
+                    DISCOUNT_REJECTED
+                ),
+                (
+                    or_(
+                        candidates.c.new_price < candidates.c.min_price,
+                        candidates.c.new_price > func.round(candidates.c.max_limit)
+                    ), 
+                    RANGE_REJECTED
+                ),
+                else_=None
+            ).label('rejection')
+        ).cte('decided')
+        discounted = (
+            update(cards_table)
+            .where(and_(
+                cards_table.c.card_id == decided.c.card_id,
+                decided.c.rejection.is_(None)
+            ))
+            .values(
+                price=decided.c.new_price,
+                dirty_price=func.coalesce(
+                    cards_table.c.dirty_price, 
+                    cards_table.c.price
+                ),
+                version_id=cards_table.c.version_id + 1
+            )
+            .returning(cards_table.c.card_id, cards_table.c.price)
+            .cte('discounted')
+        )
+        occurred_at = datetime.now(UTC)
+        events = (
+            insert(outbox_table)
+            .from_select(
+                ['aggregate_type', 'aggregate_id', 'event_type', 'payload', 'occurred_at'],
+                select(
+                    literal(CardEvent.aggregate_type, String),
+                    cast(discounted.c.card_id, String),
+                    literal(CardPriceChanged.__name__, String),
+                    func.jsonb_build_object(
+                        cast(literal('card_id'), String), discounted.c.card_id,
+                        cast(literal('occurred_at'), String), 
+                        cast(literal(occurred_at.isoformat()), String),
+                        cast(literal('price'), String), 
+                        cast(discounted.c.price, String)
+                    ),
+                    literal(occurred_at, DateTime(timezone=True))
+                )
+                .select_from(discounted)
+            )
+            .cte('events')
+        )
+        result = await self._async_session.execute(
+            select(
+                decided.c.card_id,
+                decided.c.rejection,
+                decided.c.min_price,
+                decided.c.max_limit
+            )
+            .add_cte(events)
+            .order_by(decided.c.card_id)
+        )
+
+        report = BulkDiscountReport()
+        for card_id, rejection, min_price, max_limit in result:
+            if rejection is None:
+                report.discounted.append(card_id)
+            elif rejection == DISCOUNT_REJECTED:
+                report.rejected.append(RejectedCard(card_id, DISCOUNT_ERROR))
+            else:
+                report.rejected.append(RejectedCard(
+                    card_id, 
+                    UNACCEPTABLE_DISCOUNT_RANGE.format(
+                        Money(min_price), 
+                        Money(max_limit)
+                    )
+                ))
+
+        return report
+
+    def _filters(self, cards_filter: CardsFilter) -> list:
+        filters = []
+        if cards_filter.card_ids is not None:
+            filters.append(cards_table.c.card_id.in_(cards_filter.card_ids))
+        if cards_filter.region is not None:
+            filters.append(cards_table.c.region == cards_filter.region)
+        if cards_filter.account_format is not None:
+            filters.append(
+                cards_table.c.account_format == cards_filter.account_format
+            )
+        if cards_filter.min_price is not None:
+            filters.append(cards_table.c.price >= cards_filter.min_price.number)
+        if cards_filter.max_price is not None:
+            filters.append(cards_table.c.price <= cards_filter.max_price.number)
+
+        return filters
+
+    def _card_row(self, card: Card) -> dict:
+        return {
+            'owner_id': card._owner_id,
+            'price': card._price.number,
+            'title': card._description.title,
+            'text_description': card._description.text_description,
+            'account_format': card._description.account_format,
+            'region': card._description.region,
+            'spam_block': card._description.spam_block,
+            'format': card._delivery.format,
+            'method': card._delivery.method,
+            'min_price': card._min_price.number,
+            'min_discount': card._min_discount,
+            'shipping_hours': card._deadlines.shipping_hours,
+            'receipt_hours': card._deadlines.receipt_hours,
+            'check_hours': card._deadlines.inspection_hours,
+            'created_at': card._created_at,
+            'dirty_price': None,
+            'is_archived': False,
+            'is_purchased': False,
+            'version_id': 1
+        }
\ No newline at end of file
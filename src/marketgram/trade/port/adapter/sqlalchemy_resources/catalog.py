@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from sqlalchemy import Row, and_, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+
+SEARCH_CONFIG = 'simple'
+FACETS = ('region', 'account_format', 'spam_block')
+
+
+@dataclass(frozen=True)
+class CatalogFilter:
+    query: str | None = None
+    region: Region | None = None
+    account_format: AccountFormat | None = None
+    spam_block: bool | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+
+
+class SQLAlchemyCatalog:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def cards(
+        self,
+        catalog_filter: CatalogFilter,
+        after: tuple[Decimal, int] | None = None,
+        limit: int = 20
+    ) -> list[Row]:
+        stmt = (
+            select(
+                cards_table.c.card_id,
+                cards_table.c.owner_id,
+                cards_table.c.title,
+                cards_table.c.price,
+                cards_table.c.account_format,
+                cards_table.c.region,
+                cards_table.c.spam_block,
+                cards_table.c.created_at
+            )
+            .where(self._conditions(catalog_filter))
+            .order_by(cards_table.c.price, cards_table.c.card_id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(cards_table.c.price, cards_table.c.card_id) 
+                > tuple_(*after)
+            )
+
+        result = await self._async_session.execute(stmt)
+
+        return result.all()
+
+    async def facets(self, catalog_filter: CatalogFilter) -> dict[str, dict]:
+        columns = [cards_table.c[name] for name in FACETS]
+        stmt = (
+            select(
+                *columns,
+                *[func.grouping(column) for column in columns],
+                func.count()
+            )
+            .where(self._conditions(catalog_filter))
+            .group_by(func.grouping_sets(*columns))
+        )
+        result = await self._async_session.execute(stmt)
+
+        facets = {name: {} for name in FACETS}
+        for row in result:
+            values, groupings, count = (
+                row[:len(FACETS)], 
+                row[len(FACETS):-1], 
+                row[-1]
+            )
+            for name, value, grouping in zip(FACETS, values, groupings):
+                if grouping == 0:
+                    facets[name][value] = count
+
+        return facets
+
+    def _conditions(self, catalog_filter: CatalogFilter):
+        conditions = [
+            cards_table.c.is_archived == False,
+            cards_table.c.is_purchased == False
+        ]
+        if catalog_filter.query:
+            conditions.append(cards_table.c.search_vector.bool_op('@@')(
+                func.websearch_to_tsquery(SEARCH_CONFIG, catalog_filter.query)
+            ))
+        if catalog_filter.region is not None:
+            conditions.append(cards_table.c.region == catalog_filter.region)
+        if catalog_filter.account_format is not None:
+            conditions.append(
+                cards_table.c.account_format == catalog_filter.account_format
+            )
+        if catalog_filter.spam_block is not None:
+            conditions.append(
+                cards_table.c.spam_block == catalog_filter.spam_block
+            )
+        if catalog_filter.min_price is not None:
+            conditions.append(cards_table.c.price >= catalog_filter.min_price)
+        if catalog_filter.max_price is not None:
+            conditions.append(cards_table.c.price <= catalog_filter.max_price)
+
+        return and_(*conditions)
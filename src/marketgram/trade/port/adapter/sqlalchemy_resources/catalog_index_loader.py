@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import Row, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.events import CardEvent
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.catalog_index import (
+    CatalogDocument,
+    CatalogIndex
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _document(row: Row) -> CatalogDocument:
+    return CatalogDocument(
+        row.card_id,
+        row.title,
+        row.text_description,
+        AccountFormat(row.account_format),
+        Region(row.region),
+        row.spam_block,
+        row.price
+    )
+
+
+@dataclass
+class CatalogIndexMetrics:
+    loaded: int = 0
+    refreshed: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    gaps: int = 0
+
+
+class SQLAlchemyCatalogIndexLoader:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        index: CatalogIndex,
+        batch_size: int = 5000,
+        idle_interval: float = 1.0,
+        max_backoff: float = 30.0,
+        trailing_window: int = 1000,
+        gap_timeout: float = 60.0,
+        metrics: CatalogIndexMetrics = None
+    ) -> None:
+        self._session_factory = session_factory
+        self._index = index
+        self._batch_size = batch_size
+        self._idle_interval = idle_interval
+        self._max_backoff = max_backoff
+        self._trailing_window = trailing_window
+        self._gap_timeout = gap_timeout
+        self._metrics = metrics or CatalogIndexMetrics()
+        self._last_event_id = 0
+        self._gaps: dict[int, float] = {}
+        self._stopped = asyncio.Event()
+
+    @property
+    def metrics(self) -> CatalogIndexMetrics:
+        return self._metrics
+
+    async def load(self) -> int:
+        async with self._session_factory() as session:
+            async with session.begin():
+                last_event_id = await session.scalar(
+                    select(func.coalesce(func.max(outbox_table.c.event_id), 0))
+                )
+                self._last_event_id = max(
+                    0, last_event_id - self._trailing_window
+                )
+                result = await session.stream(
+                    self._documents_query()
+                    .order_by(cards_table.c.price, cards_table.c.card_id)
+                    .execution_options(yield_per=self._batch_size)
+                )
+                async for row in result:
+                    if not self._index.upsert(_document(row)):
+                        break
+
+                    self._metrics.loaded += 1
+
+        return self._metrics.loaded
+
+    async def run(self) -> None:
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if await self.run_once():
+                    failures = 0
+                    continue
+
+                failures = 0
+                delay = self._idle_interval
+            except Exception:
+                logger.exception('Catalog index refresh failed')
+                failures += 1
+                delay = min(
+                    self._idle_interval * 2 ** failures, 
+                    self._max_backoff
+                )
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run_once(self) -> int:
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    refreshed = await self._refresh_batch(session)
+        except Exception:
+            self._metrics.failed_batches += 1
+            raise
+
+        if refreshed:
+            self._metrics.batches += 1
+
+        return refreshed
+
+    async def _refresh_batch(self, session: AsyncSession) -> int:
+        self._expire_gaps()
+
+        result = await session.execute(
+            select(
+                outbox_table.c.event_id,
+                outbox_table.c.aggregate_type,
+                outbox_table.c.aggregate_id
+            )
+            .where(or_(
+                outbox_table.c.event_id > self._last_event_id,
+                outbox_table.c.event_id.in_(list(self._gaps))
+            ))
+            .order_by(outbox_table.c.event_id)
+            .limit(self._batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            return 0
+
+        for row in rows:
+            if self._gaps.pop(row.event_id, None) is not None:
+                continue
+
+            if row.event_id > self._last_event_id + 1:
+                self._track_gap(self._last_event_id + 1, row.event_id)
+            self._last_event_id = max(self._last_event_id, row.event_id)
+
+        card_ids = {
+            int(row.aggregate_id) for row in rows
+            if row.aggregate_type == CardEvent.aggregate_type
+        }
+
+        result = await session.execute(
+            self._documents_query()
+            .where(cards_table.c.card_id.in_(card_ids))
+        )
+        buyable = {row.card_id: _document(row) for row in result}
+        for card_id in card_ids:
+            if card_id in buyable:
+                self._index.upsert(buyable[card_id])
+            else:
+                self._index.remove(card_id)
+
+        self._metrics.refreshed += len(card_ids)
+
+        return len(rows)
+
+    def _track_gap(self, start: int, stop: int) -> None:
+        start = max(start, stop - self._trailing_window)
+        seen_at = time.monotonic()
+        for event_id in range(start, stop):
+            self._gaps[event_id] = seen_at
+
+        self._metrics.gaps += stop - start
+
+    def _expire_gaps(self) -> None:
+        expired_at = time.monotonic() - self._gap_timeout
+        self._gaps = {
+            event_id: seen_at
+            for event_id, seen_at in self._gaps.items()
+            if seen_at > expired_at
+        }
+
+    def _documents_query(self):
+        return (
+            select(
+                cards_table.c.card_id,
+                cards_table.c.title,
+                cards_table.c.text_description,
+                cards_table.c.account_format,
+                cards_table.c.region,
+                cards_table.c.spam_block,
+                cards_table.c.price
+            )
+            .where(and_(
+                cards_table.c.is_archived == False,
+                cards_table.c.is_purchased == False
+            ))
+        )
@@ -0,0 +1,181 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Row, false, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.events import (
+    DealCancelled,
+    DealClosed,
+    DealOpened,
+    DealReceived,
+    DealShipped,
+    DisputeOpened,
+    DisputeSettledForBuyer,
+    DisputeSettledForSeller
+)
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.port.adapter.event_dispatcher import (
+    EventDispatcher,
+    OutboxMessage
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deal_views_table import (
+    deal_views_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
+    deals_members_table,
+    deals_table
+)
+
+DEAL_EVENTS = (
+    DealOpened,
+    DealShipped,
+    DealReceived,
+    DealClosed,
+    DealCancelled,
+    DisputeOpened,
+    DisputeSettledForSeller,
+    DisputeSettledForBuyer
+)
+
+
+class SQLAlchemyDealViewsProjection:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        self._session_factory = session_factory
+
+    def subscribe(self, dispatcher: EventDispatcher) -> None:
+        for event_type in DEAL_EVENTS:
+            dispatcher.subscribe(event_type, self)
+
+    async def __call__(self, message: OutboxMessage) -> None:
+        async with self._session_factory() as session:
+            async with session.begin():
+                await self.project(session, [int(message.aggregate_id)])
+
+    async def project(self, session: AsyncSession, deal_ids: list[int]) -> int:
+        stmt = insert(deal_views_table).from_select(
+            [
+                'deal_id', 'user_id', 'role', 'counterparty_id', 'card_id', 
+                'card_title', 'price', 'qty_purchased', 'status', 
+                'is_disputed', 'created_at', 'ship_due_at', 'receipt_due_at', 
+                'check_due_at', 'closed_at'
+            ],
+            union_all(
+                self._side(
+                    deal_ids, 
+                    'seller', 
+                    deals_members_table.c.seller_id, 
+                    deals_members_table.c.buyer_id
+                ),
+                self._side(
+                    deal_ids, 
+                    'buyer', 
+                    deals_members_table.c.buyer_id, 
+                    deals_members_table.c.seller_id
+                )
+            )
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['deal_id', 'user_id'],
+            set_={
+                'status': stmt.excluded.status,
+                'is_disputed': stmt.excluded.is_disputed,
+                'price': stmt.excluded.price,
+                'ship_due_at': stmt.excluded.ship_due_at,
+                'receipt_due_at': stmt.excluded.receipt_due_at,
+                'check_due_at': stmt.excluded.check_due_at,
+                'closed_at': stmt.excluded.closed_at,
+                'updated_at': func.now()
+            }
+        )
+        result = await session.execute(stmt)
+
+        return result.rowcount
+
+    def _side(self, deal_ids: list[int], role: str, user_id, counterparty_id):
+        return (
+            select(
+                deals_table.c.deal_id,
+                user_id,
+                literal(role),
+                counterparty_id,
+                deals_table.c.card_id,
+                cards_table.c.title,
+                deals_table.c.price,
+                deals_table.c.qty_purchased,
+                deals_table.c.status,
+                func.coalesce(deals_table.c.is_disputed, false()),
+                deals_table.c.created_at,
+                deals_table.c.ship_due_at,
+                deals_table.c.receipt_due_at,
+                deals_table.c.check_due_at,
+                deals_table.c.closed_at
+            )
+            .join(
+                deals_members_table, 
+                deals_members_table.c.deal_id == deals_table.c.deal_id
+            )
+            .join(cards_table, cards_table.c.card_id == deals_table.c.card_id)
+            .where(deals_table.c.deal_id.in_(deal_ids))
+        )
+
+
+class SQLAlchemyDealViews:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def for_user(
+        self,
+        user_id: UUID,
+        status: StatusDeal | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 20
+    ) -> list[Row]:
+        stmt = (
+            select(
+                deal_views_table.c.deal_id,
+                deal_views_table.c.role,
+                deal_views_table.c.counterparty_id,
+                deal_views_table.c.card_id,
+                deal_views_table.c.card_title,
+                deal_views_table.c.price,
+                deal_views_table.c.qty_purchased,
+                deal_views_table.c.status,
+                deal_views_table.c.is_disputed,
+                deal_views_table.c.created_at,
+                deal_views_table.c.ship_due_at,
+                deal_views_table.c.receipt_due_at,
+                deal_views_table.c.check_due_at,
+                deal_views_table.c.closed_at
+            )
+            .where(deal_views_table.c.user_id == user_id)
+            .order_by(
+                deal_views_table.c.created_at.desc(),
+                deal_views_table.c.deal_id.desc()
+            )
+            .limit(limit)
+        )
+        if status is not None:
+            stmt = stmt.where(deal_views_table.c.status == status)
+
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(
+                    deal_views_table.c.created_at, 
+                    deal_views_table.c.deal_id
+                ) < tuple_(*after)
+            )
+
+        result = await self._async_session.execute(stmt)
+
+        return result.all()
@@ -1,10 +1,13 @@
+from datetime import datetime
+from typing import Collection
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select
-from sqlalchemy.orm import with_polymorphic
+from sqlalchemy import ColumnElement, and_, func, literal, select, true
+from sqlalchemy.orm import aliased, contains_eager, noload, with_polymorphic
 
 from marketgram.trade.domain.model.p2p.members import Members
+from marketgram.trade.domain.model.p2p.payout import Payout
 from marketgram.trade.domain.model.p2p.deal.cancellation_deal import CancellationDeal
 from marketgram.trade.domain.model.p2p.deal.confirmation_deal import ConfirmationDeal
 from marketgram.trade.domain.model.p2p.deal.dispute_deal import DisputeDeal
@@ -12,21 +15,20 @@ from marketgram.trade.domain.model.p2p.deal.receipt_deal import ReceiptDeal
 from marketgram.trade.domain.model.p2p.deal.ship_deal import ShipDeal
 from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
-    deals_table
+    deals_table,
+    deals_members_table
 )
-from marketgram.trade.port.adapter.sqlalchemy_resources.operations_mapper import (
-    SQLAlchemyOperationsMapper
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_table import (
+    operations_table
 )
 
 
 class SQLAlchemyDealsRepository:
     def __init__(
         self, 
-        async_session: AsyncSession,
-        operations_mapper: SQLAlchemyOperationsMapper
+        async_session: AsyncSession
     ) -> None:
         self._async_session = async_session
-        self._operations_mapper = operations_mapper
 
     def add(self, deal: ShipDeal) -> None:
         self._async_session.add(deal)
@@ -73,9 +75,13 @@ class SQLAlchemyDealsRepository:
     ) -> ConfirmationDeal | None:
         stmt = (
             select(ConfirmationDeal)
-            .join(Members, Members.buyer_id == buyer_id)
+            .join(
+                deals_members_table, 
+                deals_members_table.c.deal_id == deals_table.c.deal_id
+            )
             .where(and_(
                 deals_table.c.deal_id == deal_id,
+                deals_members_table.c.buyer_id == buyer_id,
                 deals_table.c.status == StatusDeal.CHECK,
             ))
         )
@@ -108,52 +114,197 @@ class SQLAlchemyDealsRepository:
         buyer_id: UUID,
         deal_id: int,
     ) -> DisputeDeal | None:
+        return await self._dispute_deal_with_payout(
+            deal_id,
+            Members.buyer_id == buyer_id,
+            deals_table.c.status.not_in([
+                StatusDeal.DISPUTE,
+                StatusDeal.CLOSED,
+                StatusDeal.CANCELLED
+            ])
+        )
+
+    async def disputed_with_id(
+        self,
+        deal_id: int,
+    ) -> DisputeDeal | None:
+        return await self._dispute_deal_with_payout(
+            deal_id,
+            deals_table.c.status == StatusDeal.DISPUTE
+        )
+    
+    async def overdue_unshipped(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[CancellationDeal]:
+        deal_ids = await self._claim_overdue(
+            StatusDeal.NOT_SHIPPED, 
+            current_date, 
+            limit,
+            exclude
+        )
+        if not deal_ids:
+            return []
+        
         stmt = (
-            select(DisputeDeal)
-            .join(Members, Members.buyer_id == buyer_id)
-            .where(and_(
-                deals_table.c.deal_id == deal_id,
-                deals_table.c.status.not_in([
-                    StatusDeal.DISPUTE,
-                    StatusDeal.CLOSED,
-                    StatusDeal.CANCELLED
-                ]),
-            ))
+            select(CancellationDeal)
+            .join(
+                deals_members_table, 
+                deals_members_table.c.deal_id == deals_table.c.deal_id
+            )
+            .where(deals_table.c.deal_id.in_(deal_ids))
         )
         result = await self._async_session.execute(stmt)
 
-        deal = result.scalar()
-        if deal is None:
-            return None
+        return list(result.unique().scalars())
+    
+    async def overdue_unreceived(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[ReceiptDeal]:
+        deal_ids = await self._claim_overdue(
+            StatusDeal.AWAITING, 
+            current_date, 
+            limit,
+            exclude
+        )
+        if not deal_ids:
+            return []
         
-        payout = await self._operations_mapper \
-            .payout_with_seller_id(deal.seller_id)
+        stmt = (
+            select(ReceiptDeal)
+            .where(deals_table.c.deal_id.in_(deal_ids))
+        )
+        result = await self._async_session.execute(stmt)
+
+        return list(result.scalars())
+    
+    async def overdue_unconfirmed(
+        self,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[ConfirmationDeal]:
+        deal_ids = await self._claim_overdue(
+            StatusDeal.CHECK, 
+            current_date, 
+            limit,
+            exclude
+        )
+        if not deal_ids:
+            return []
         
-        deal.add_payout(payout)
+        stmt = (
+            select(ConfirmationDeal)
+            .join(
+                deals_members_table, 
+                deals_members_table.c.deal_id == deals_table.c.deal_id
+            )
+            .where(deals_table.c.deal_id.in_(deal_ids))
+        )
+        result = await self._async_session.execute(stmt)
 
-        return deal
+        return list(result.scalars())
+    
+    async def overdue_count(
+        self, 
+        current_date: datetime
+    ) -> dict[StatusDeal, int]:
+        statuses = [
+            StatusDeal.NOT_SHIPPED, 
+            StatusDeal.AWAITING, 
+            StatusDeal.CHECK
+        ]
+        stmt = select(*[
+            func.count().filter(self._overdue_condition(status, current_date))
+            for status in statuses
+        ])
+        result = await self._async_session.execute(stmt)
 
-    async def disputed_with_id(
+        return dict(zip(statuses, result.one()))
+    
+    async def _claim_overdue(
+        self,
+        status: StatusDeal,
+        current_date: datetime,
+        limit: int,
+        exclude: Collection[int] = ()
+    ) -> list[int]:
+        stmt = (
+            select(deals_table.c.deal_id)
+            .where(self._overdue_condition(status, current_date))
+            .order_by(self._deadline(status))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if exclude:
+            stmt = stmt.where(deals_table.c.deal_id.not_in(exclude))
+
+        result = await self._async_session.execute(stmt)
+
+        return list(result.scalars())
+    
+    def _overdue_condition(
+        self, 
+        status: StatusDeal, 
+        current_date: datetime
+    ) -> ColumnElement[bool]:
+        return and_(
+            deals_table.c.status == literal(status.value, literal_execute=True),
+            self._deadline(status) <= current_date
+        )
+    
+    def _deadline(self, status: StatusDeal) -> ColumnElement[datetime]:
+        return {
+            StatusDeal.NOT_SHIPPED: deals_table.c.ship_due_at,
+            StatusDeal.AWAITING: deals_table.c.receipt_due_at,
+            StatusDeal.CHECK: deals_table.c.check_due_at,
+        }[status]
+    
+    async def _dispute_deal_with_payout(
         self,
         deal_id: int,
+        *conditions: ColumnElement[bool]
     ) -> DisputeDeal | None:
+        pending_payout = (
+            select(operations_table)
+            .join(
+                deals_members_table, 
+                deals_members_table.c.seller_id == operations_table.c.user_id
+            )
+            .where(and_(
+                deals_members_table.c.deal_id == deal_id,
+                operations_table.c.type == 'payout',
+                operations_table.c.is_processed == False
+            ))
+            .with_for_update(of=operations_table)
+            .cte('pending_payout')
+        )
+        payout = aliased(Payout, pending_payout)
         stmt = (
-            select(DisputeDeal)
-            .join(Members)
+            select(DisputeDeal, payout)
+            .join(DisputeDeal._members)
+            .outerjoin(payout, true())
+            .options(
+                contains_eager(DisputeDeal._members),
+                noload(payout._entries)
+            )
             .where(and_(
                 deals_table.c.deal_id == deal_id,
-                deals_table.c.status == StatusDeal.DISPUTE,
+                *conditions
             ))
         )
         result = await self._async_session.execute(stmt)
 
-        deal = result.scalar()
-        if deal is None:
+        row = result.unique().one_or_none()
+        if row is None:
             return None
         
-        payout = await self._operations_mapper \
-            .payout_with_seller_id(deal.seller_id)
-        
+        deal, payout = row
         deal.add_payout(payout)
 
-        return deal
\ No newline at end of file
+        return deal
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import and_, func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balance_checkpoints_table import (
+    balance_checkpoints_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+
+SETTLED_STATUSES = (EntryStatus.ACCEPTED, EntryStatus.CANCELLED)
+PARTITION_FORMAT = 'entries_%Y_%m'
+
+
+def next_month(starts_at: datetime) -> datetime:
+    year, index = divmod(starts_at.month, 12)
+
+    return datetime(starts_at.year + year, index + 1, 1)
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    checkpoints: int
+    archived: int
+
+
+class SQLAlchemyEntriesArchive:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def create_partitions(self, month: date, ahead: int) -> list[str]:
+        partitions = []
+        for offset in range(ahead + 1):
+            year, index = divmod(month.month - 1 + offset, 12)
+            partition = await self._async_session.scalar(
+                select(func.entries_create_partition(
+                    date(month.year + year, index + 1, 1)
+                ))
+            )
+            partitions.append(partition)
+
+        return partitions
+
+    async def archive(self, cutoff: datetime) -> ArchiveResult:
+        archived = (
+            update(entries_table)
+            .where(and_(
+                entries_table.c.posted_in < cutoff,
+                entries_table.c.is_archived.is_(False),
+                entries_table.c.entry_status.in_(SETTLED_STATUSES)
+            ))
+            .values(is_archived=True)
+            .returning(
+                entries_table.c.user_id,
+                entries_table.c.account_type,
+                entries_table.c.amount,
+                entries_table.c.entry_status
+            )
+            .cte('archived')
+        )
+        stmt = insert(balance_checkpoints_table).from_select(
+            ['user_id', 'account_type', 'amount', 'checkpoint_at'],
+            select(
+                archived.c.user_id,
+                archived.c.account_type,
+                func.sum(archived.c.amount),
+                literal(cutoff, entries_table.c.posted_in.type)
+            )
+            .where(archived.c.entry_status == EntryStatus.ACCEPTED)
+            .group_by(
+                archived.c.user_id,
+                archived.c.account_type
+            )
+        )
+        checkpoints = (
+            stmt.on_conflict_do_update(
+                index_elements=['user_id', 'account_type'],
+                set_={
+                    'amount': balance_checkpoints_table.c.amount + stmt.excluded.amount,
+                    'checkpoint_at': func.greatest(
+                        balance_checkpoints_table.c.checkpoint_at,
+                        stmt.excluded.checkpoint_at
+                    )
+                }
+            )
+            .returning(balance_checkpoints_table.c.user_id)
+            .cte('checkpoints')
+        )
+        result = await self._async_session.execute(
+            select(
+                select(func.count()).select_from(checkpoints).scalar_subquery(),
+                select(func.count()).select_from(archived).scalar_subquery()
+            )
+        )
+
+        return ArchiveResult(*result.one())
+
+    async def detach_archived(self, cutoff: datetime) -> list[str]:
+        result = await self._async_session.execute(text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            "WHERE parent.relname = 'entries' ORDER BY child.relname"
+        ))
+        detached = []
+        for partition in result.scalars().all():
+            try:
+                starts_at = datetime.strptime(partition, PARTITION_FORMAT)
+            except ValueError:
+                continue
+
+            if next_month(starts_at) > cutoff:
+                continue
+
+            live = await self._async_session.scalar(text(
+                f'SELECT EXISTS (SELECT 1 FROM "{partition}" WHERE NOT is_archived)'
+            ))
+            if live:
+                continue
+
+            await self._async_session.execute(text(
+                f'ALTER TABLE entries DETACH PARTITION "{partition}"'
+            ))
+            detached.append(partition)
+
+        return detached
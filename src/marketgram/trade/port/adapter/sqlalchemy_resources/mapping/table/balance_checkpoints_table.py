@@ -0,0 +1,23 @@
+from sqlalchemy import (
+    DECIMAL,
+    UUID,
+    Column,
+    DateTime,
+    ForeignKey,
+    String,
+    Table
+)
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+balance_checkpoints_table = Table(
+    'balance_checkpoints',
+    sqlalchemy_metadata,
+    Column('user_id', UUID, ForeignKey('members.user_id'), primary_key=True, nullable=False),
+    Column('account_type', String, primary_key=True, nullable=False),
+    Column('amount', DECIMAL(20, 2), default=0, nullable=False),
+    Column('checkpoint_at', DateTime, nullable=False)
+)
@@ -0,0 +1,53 @@
+from sqlalchemy import (
+    DDL,
+    DECIMAL,
+    UUID,
+    Column,
+    ForeignKey,
+    String,
+    Table,
+    event
+)
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+balances_table = Table(
+    'balances',
+    sqlalchemy_metadata,
+    Column('user_id', UUID, ForeignKey('members.user_id'), primary_key=True, nullable=False),
+    Column('account_type', String, primary_key=True, nullable=False),
+    Column('amount', DECIMAL(20, 2), default=0, nullable=False)
+)
+
+
+balances_func = DDL(
+    """
+    CREATE OR REPLACE FUNCTION entries_balances_refresh() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.entry_status = 'accepted' THEN
+            INSERT INTO balances (user_id, account_type, amount)
+            VALUES (OLD.user_id, OLD.account_type, -OLD.amount)
+            ON CONFLICT (user_id, account_type)
+            DO UPDATE SET amount = balances.amount + EXCLUDED.amount;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.entry_status = 'accepted' THEN
+            INSERT INTO balances (user_id, account_type, amount)
+            VALUES (NEW.user_id, NEW.account_type, NEW.amount)
+            ON CONFLICT (user_id, account_type)
+            DO UPDATE SET amount = balances.amount + EXCLUDED.amount;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+balances_trigger = DDL(
+    "CREATE TRIGGER entries_balances_refresh "
+    "AFTER INSERT OR DELETE OR UPDATE OF user_id, account_type, amount, entry_status "
+    "ON entries FOR EACH ROW EXECUTE FUNCTION entries_balances_refresh()"
+)
+event.listen(sqlalchemy_metadata, 'after_create', balances_func.execute_if(dialect="postgresql"))
+event.listen(sqlalchemy_metadata, 'after_create', balances_trigger.execute_if(dialect="postgresql"))
@@ -6,6 +6,9 @@ from marketgram.trade.domain.model.p2p.deadlines import Deadlines
 from marketgram.trade.domain.model.p2p.delivery import Delivery
 from marketgram.trade.domain.model.rule.agreement.money import Money
 from marketgram.trade.domain.model.trade_item.sell_card import SellCard
+from marketgram.trade.port.adapter.sqlalchemy_resources.outbox_writer import (
+    register_outbox_writer
+)
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
     cards_table
 )
@@ -15,6 +18,8 @@ def cards_registry_mapper(mapper: registry) -> None:
     mapper.map_imperatively(
         Card,
         cards_table,
+        version_id_col=cards_table.c.version_id,
+        exclude_properties=['search_vector'],
         properties={
             '_card_id': cards_table.c.card_id,
             '_owner_id': cards_table.c.owner_id,
@@ -55,6 +60,8 @@ def cards_registry_mapper(mapper: registry) -> None:
     mapper.map_imperatively(
         SellCard,
         cards_table,
+        version_id_col=cards_table.c.version_id,
+        exclude_properties=['search_vector'],
         properties={
             '_card_id': cards_table.c.card_id,
             '_owner_id': cards_table.c.owner_id,
@@ -62,6 +69,7 @@ def cards_registry_mapper(mapper: registry) -> None:
                 Money,
                 cards_table.c.price
             ),
+            '_is_archived': cards_table.c.is_archived,
             '_is_purchased': cards_table.c.is_purchased,
             '_created_at': cards_table.c.created_at,
             '_delivery': composite(
@@ -76,4 +84,6 @@ def cards_registry_mapper(mapper: registry) -> None:
                 cards_table.c.check_hours,
             )
         }
-    )
\ No newline at end of file
+    )
+
+    register_outbox_writer()
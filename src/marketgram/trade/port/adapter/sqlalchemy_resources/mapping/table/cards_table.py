@@ -1,14 +1,21 @@
 from uuid import uuid4
 from sqlalchemy import (
+    DDL,
     DECIMAL, 
     UUID,
     Boolean,
     DateTime,
+    Integer,
     String, 
     Table, 
     Column, 
+    Computed,
     ForeignKey,
+    Index,
+    event,
+    text
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.types import BIGSERIAL
 from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import sqlalchemy_metadata
@@ -29,8 +36,59 @@ cards_table = Table(
     Column('method', String, nullable=False),
     Column('min_price', DECIMAL(20, 2), nullable=False),
     Column('min_discount', DECIMAL(20, 2), nullable=False),
+    Column('shipping_hours', Integer, nullable=True),
+    Column('receipt_hours', Integer, nullable=True),
+    Column('check_hours', Integer, nullable=True),
     Column('created_at', DateTime, nullable=False),
     Column('dirty_price', DECIMAL(20, 2), nullable=True),
     Column('is_archived', Boolean, default=False, nullable=False),
-    Column('is_purchased', Boolean, default=False, nullable=False)
+    Column('is_purchased', Boolean, default=False, nullable=False),
+    Column('version_id', Integer, nullable=False),
+    Column(
+        'search_vector', 
+        TSVECTOR, 
+        Computed(
+            "to_tsvector('simple', title || ' ' || text_description)", 
+            persisted=True
+        )
+    ),
+    Index(
+        'ix_cards_buyable_search_vector',
+        'search_vector',
+        postgresql_using='gin',
+        postgresql_where=text('NOT is_archived AND NOT is_purchased')
+    ),
+    Index(
+        'ix_cards_buyable_region_account_format_price',
+        'region',
+        'account_format',
+        'price',
+        'card_id',
+        postgresql_where=text('NOT is_archived AND NOT is_purchased')
+    ),
+    Index(
+        'ix_cards_buyable_price',
+        'price',
+        'card_id',
+        postgresql_where=text('NOT is_archived AND NOT is_purchased')
+    )
 )
+
+
+round_half_even_func = DDL(
+    """
+    CREATE OR REPLACE FUNCTION round_half_even(value numeric, places integer) 
+    RETURNS numeric AS $$
+    DECLARE
+        scaled numeric := value * power(10::numeric, places);
+        rounded numeric := floor(scaled);
+    BEGIN
+        IF scaled - rounded > 0.5 OR (scaled - rounded = 0.5 AND mod(rounded, 2) <> 0) THEN
+            rounded := rounded + 1;
+        END IF;
+        RETURN round(rounded / power(10::numeric, places), places);
+    END;
+    $$ LANGUAGE plpgsql IMMUTABLE
+    """
+)
+event.listen(cards_table, 'before_create', round_half_even_func.execute_if(dialect="postgresql"))
@@ -0,0 +1,52 @@
+from sqlalchemy import (
+    DECIMAL,
+    UUID,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    func
+)
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+deal_views_table = Table(
+    'deal_views',
+    sqlalchemy_metadata,
+    Column('deal_id', BigInteger, primary_key=True, nullable=False),
+    Column('user_id', UUID, primary_key=True, nullable=False),
+    Column('role', String, nullable=False),
+    Column('counterparty_id', UUID, nullable=False),
+    Column('card_id', BigInteger, nullable=False),
+    Column('card_title', String, nullable=False),
+    Column('price', DECIMAL(20, 2), nullable=False),
+    Column('qty_purchased', Integer, nullable=False),
+    Column('status', String, nullable=False),
+    Column('is_disputed', Boolean, nullable=False),
+    Column('created_at', DateTime(timezone=True), nullable=False),
+    Column('ship_due_at', DateTime(timezone=True), nullable=True),
+    Column('receipt_due_at', DateTime(timezone=True), nullable=True),
+    Column('check_due_at', DateTime(timezone=True), nullable=True),
+    Column('closed_at', DateTime(timezone=True), nullable=True),
+    Column('updated_at', DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Index(
+        'ix_deal_views_user_status_created_at',
+        'user_id',
+        'status',
+        'created_at',
+        'deal_id'
+    ),
+    Index(
+        'ix_deal_views_user_created_at',
+        'user_id',
+        'created_at',
+        'deal_id'
+    )
+)
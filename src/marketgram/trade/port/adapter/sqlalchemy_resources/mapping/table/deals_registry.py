@@ -1,4 +1,13 @@
-from sqlalchemy.orm import registry, composite, relationship, column_property
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import (
+    registry, 
+    composite, 
+    relationship, 
+    column_property, 
+    foreign
+)
 
 from marketgram.trade.domain.model.p2p.members import Members
 from marketgram.trade.domain.model.p2p.deal.cancellation_deal import CancellationDeal
@@ -14,11 +23,17 @@ from marketgram.trade.domain.model.p2p.deal.ship_deal import (
 from marketgram.trade.domain.model.p2p.time_tags import TimeTags
 from marketgram.trade.domain.model.p2p.type_deal import TypeDeal
 from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.port.adapter.sqlalchemy_resources.outbox_writer import (
+    register_outbox_writer
+)
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
     deals_table, 
     deals_entries_table,
     deals_members_table
 )
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
 
 
 def deals_registry_mapper(mapper: registry) -> None:
@@ -60,6 +75,9 @@ def deals_registry_mapper(mapper: registry) -> None:
                 deals_table.c.receipt_hours,
                 deals_table.c.check_hours,
             ),
+            '_ship_due_at': deals_table.c.ship_due_at,
+            '_receipt_due_at': deals_table.c.receipt_due_at,
+            '_check_due_at': deals_table.c.check_due_at,
             '_status': deals_table.c.status,
         }
     )
@@ -80,6 +98,8 @@ def deals_registry_mapper(mapper: registry) -> None:
         deals_table,
         properties={
             '_deal_id': deals_table.c.deal_id,
+            '_seller_id': column_property(deals_members_table.c.seller_id),
+            '_price': composite(Money, deals_table.c.price),
             '_card_created_at': deals_table.c.card_created_at,
             '_time_tags': composite(
                 TimeTags,
@@ -94,10 +114,16 @@ def deals_registry_mapper(mapper: registry) -> None:
                 deals_table.c.receipt_hours,
                 deals_table.c.check_hours,
             ),
+            '_ship_due_at': deals_table.c.ship_due_at,
+            '_receipt_due_at': deals_table.c.receipt_due_at,
+            '_check_due_at': deals_table.c.check_due_at,
             '_status': deals_table.c.status,
             '_entries': relationship(
                 'PostingEntry', 
                 secondary=deals_entries_table,
+                secondaryjoin=(
+                    entries_table.c.entry_id == foreign(deals_entries_table.c.entry_id)
+                ),
                 uselist=True,
                 default_factory=list,
                 lazy='noload',
@@ -123,6 +149,9 @@ def deals_registry_mapper(mapper: registry) -> None:
                 deals_table.c.receipt_hours,
                 deals_table.c.check_hours,
             ),
+            '_ship_due_at': deals_table.c.ship_due_at,
+            '_receipt_due_at': deals_table.c.receipt_due_at,
+            '_check_due_at': deals_table.c.check_due_at,
             '_status': deals_table.c.status,
         }
     )
@@ -144,6 +173,9 @@ def deals_registry_mapper(mapper: registry) -> None:
             '_entries': relationship(
                 'PostingEntry', 
                 secondary=deals_entries_table,
+                secondaryjoin=(
+                    entries_table.c.entry_id == foreign(deals_entries_table.c.entry_id)
+                ),
                 uselist=True,
                 default_factory=list,
                 lazy='joined',
@@ -177,14 +209,50 @@ def deals_registry_mapper(mapper: registry) -> None:
                 deals_table.c.receipt_hours,
                 deals_table.c.check_hours,
             ),
+            '_ship_due_at': deals_table.c.ship_due_at,
+            '_receipt_due_at': deals_table.c.receipt_due_at,
+            '_check_due_at': deals_table.c.check_due_at,
             '_status': deals_table.c.status,
             '_deal_entries': relationship(
                 'PostingEntry',
                 secondary=deals_entries_table,
+                secondaryjoin=(
+                    entries_table.c.entry_id == foreign(deals_entries_table.c.entry_id)
+                ),
                 uselist=True,
                 default_factory=list,
                 lazy='joined',
                 overlaps='_entries,_entries'
             ),
         }
-    )
\ No newline at end of file
+    )
+    for deal_class in (ShipDeal, ConfirmationDeal, ReceiptDeal, DisputeDeal):
+        event.listen(deal_class, 'before_insert', _set_due_dates, propagate=True)
+        event.listen(deal_class, 'before_update', _set_due_dates, propagate=True)
+
+    register_outbox_writer()
+
+
+def _set_due_dates(mapper, connection, target) -> None:
+    time_tags: TimeTags = target._time_tags
+    deadlines: Deadlines = target._deadlines
+
+    target._ship_due_at = _due_date(
+        time_tags.created_at, 
+        deadlines.shipping_hours
+    )
+    target._receipt_due_at = _due_date(
+        time_tags.shipped_at, 
+        deadlines.receipt_hours
+    )
+    target._check_due_at = _due_date(
+        time_tags.received_at, 
+        deadlines.inspection_hours
+    )
+
+
+def _due_date(started_at: datetime | None, hours: int | None) -> datetime | None:
+    if started_at is None or hours is None:
+        return None
+    
+    return started_at + timedelta(hours=hours)
@@ -8,6 +8,8 @@ from sqlalchemy import (
     Table, 
     Column, 
     ForeignKey,
+    Index,
+    text
 )
 
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.types import (
@@ -34,8 +36,26 @@ deals_table = Table(
     Column('shipping_hours', Integer, nullable=True),
     Column('receipt_hours', Integer, nullable=True),
     Column('check_hours', Integer, nullable=True),
+    Column('ship_due_at', DateTime(timezone=True), nullable=True),
+    Column('receipt_due_at', DateTime(timezone=True), nullable=True),
+    Column('check_due_at', DateTime(timezone=True), nullable=True),
     Column('status', String, nullable=True),
-    Column('is_disputed', Boolean, default=False, nullable=True)
+    Column('is_disputed', Boolean, default=False, nullable=True),
+    Index(
+        'ix_deals_not_shipped_ship_due_at', 
+        'ship_due_at', 
+        postgresql_where=text("status = 'not_shipped'")
+    ),
+    Index(
+        'ix_deals_awaiting_receipt_due_at', 
+        'receipt_due_at', 
+        postgresql_where=text("status = 'awaiting'")
+    ),
+    Index(
+        'ix_deals_check_check_due_at', 
+        'check_due_at', 
+        postgresql_where=text("status = 'check'")
+    )
 )
 
 
@@ -43,8 +63,10 @@ deals_members_table = Table(
     'deals_members',
     sqlalchemy_metadata,
     Column('deal_id', BIGSERIAL, ForeignKey('deals.deal_id'), primary_key=True, nullable=False),
-    Column('seller_id', BIGSERIAL, ForeignKey('members.user_id'), primary_key=True, nullable=False),
-    Column('buyer_id', BIGSERIAL, ForeignKey('members.user_id'), primary_key=True, nullable=False),
+    Column('seller_id', UUID, ForeignKey('members.user_id'), primary_key=True, nullable=False),
+    Column('buyer_id', UUID, ForeignKey('members.user_id'), primary_key=True, nullable=False),
+    Index('ix_deals_members_seller_id', 'seller_id', 'deal_id'),
+    Index('ix_deals_members_buyer_id', 'buyer_id', 'deal_id')
 )
 
 
@@ -52,5 +74,5 @@ deals_entries_table = Table(
     'deals_entries',
     sqlalchemy_metadata,
     Column('deal_id', BIGSERIAL, ForeignKey('deals.deal_id'), primary_key=True, nullable=False),
-    Column('entry_id', UUID, ForeignKey('entries.entry_id'), primary_key=True, nullable=False),
+    Column('entry_id', UUID, primary_key=True, nullable=False),
 )
\ No newline at end of file
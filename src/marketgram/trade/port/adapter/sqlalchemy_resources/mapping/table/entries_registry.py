@@ -11,6 +11,7 @@ def entries_registry_mapper(mapper: registry) -> None:
     mapper.map_imperatively(
         PostingEntry,
         entries_table,
+        primary_key=[entries_table.c.entry_id],
         properties={
             '_user_id': entries_table.c.user_id,
             '_amount': composite(Money, entries_table.c.amount),
@@ -1,13 +1,18 @@
 from uuid import uuid4
 from sqlalchemy import (
+    DDL,
     DECIMAL, 
     UUID, 
     Boolean, 
     DateTime, 
     ForeignKey, 
+    Index,
+    PrimaryKeyConstraint,
     String, 
     Table, 
     Column, 
+    event,
+    text
 )
 
 from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
@@ -18,12 +23,57 @@ from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
 entries_table = Table(
     'entries',
     sqlalchemy_metadata,
-    Column('entry_id', UUID, primary_key=True, default=uuid4, nullable=False),
+    Column('entry_id', UUID, default=uuid4, nullable=False),
     Column('user_id', UUID, ForeignKey('members.user_id'), nullable=False),
     Column('amount', DECIMAL(20, 2), nullable=False),
     Column('posted_in', DateTime, nullable=False),
     Column('account_type', String, nullable=False),
     Column('operation', String, nullable=False),
     Column('entry_status', String, nullable=False),
-    Column('is_archived', Boolean, nullable=False)
-)
\ No newline at end of file
+    Column('is_archived', Boolean, nullable=False),
+    PrimaryKeyConstraint('entry_id', 'posted_in'),
+    Index('ix_entries_entry_id', 'entry_id'),
+    Index(
+        'ix_entries_user_id_posted_in',
+        'user_id',
+        'account_type',
+        'posted_in',
+        'entry_id'
+    ),
+    Index(
+        'ix_entries_live_user_id',
+        'user_id',
+        'account_type',
+        postgresql_where=text('NOT is_archived')
+    ),
+    postgresql_partition_by='RANGE (posted_in)'
+)
+
+
+entries_partition_func = DDL(
+    """
+    CREATE OR REPLACE FUNCTION entries_create_partition(month date) RETURNS text AS $$
+    DECLARE
+        starts_at date := date_trunc('month', month);
+        partition_name text := format('entries_%s', to_char(starts_at, 'YYYY_MM'));
+    BEGIN
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF entries '
+            'FOR VALUES FROM (%L) TO (%L)',
+            partition_name, starts_at, starts_at + interval '1 month'
+        );
+        RETURN partition_name;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+entries_default_partition = DDL(
+    "CREATE TABLE IF NOT EXISTS entries_default PARTITION OF entries DEFAULT"
+)
+entries_upcoming_partitions = DDL(
+    "SELECT entries_create_partition((now() + make_interval(months => month))::date) "
+    "FROM generate_series(0, 2) AS month"
+)
+event.listen(sqlalchemy_metadata, 'after_create', entries_partition_func.execute_if(dialect="postgresql"))
+event.listen(sqlalchemy_metadata, 'after_create', entries_default_partition.execute_if(dialect="postgresql"))
+event.listen(sqlalchemy_metadata, 'after_create', entries_upcoming_partitions.execute_if(dialect="postgresql"))
@@ -1,12 +1,18 @@
-from sqlalchemy.orm import registry, relationship, composite
+from sqlalchemy.orm import registry, relationship, composite, foreign
 
 from marketgram.trade.domain.model.p2p.payment import Payment
 from marketgram.trade.domain.model.p2p.payout import Payout
 from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.port.adapter.sqlalchemy_resources.outbox_writer import (
+    register_outbox_writer
+)
 from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_table import (
     operations_table,
     operations_entries_table
 )
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
 
 
 
@@ -28,6 +34,9 @@ def operations_registry_mapper(mapper: registry) -> None:
             '_entries': relationship(
                 'PostingEntry',
                 secondary=operations_entries_table,
+                secondaryjoin=(
+                    entries_table.c.entry_id == foreign(operations_entries_table.c.entry_id)
+                ),
                 default_factory=list,
                 lazy='subquery',
                 overlaps='_entries'
@@ -49,9 +58,14 @@ def operations_registry_mapper(mapper: registry) -> None:
             '_entries': relationship(
                 'PostingEntry',
                 secondary=operations_entries_table,
+                secondaryjoin=(
+                    entries_table.c.entry_id == foreign(operations_entries_table.c.entry_id)
+                ),
                 default_factory=list,
                 lazy='noload',
                 overlaps='_entries'
             )
         },
-    )
\ No newline at end of file
+    )
+
+    register_outbox_writer()
@@ -42,5 +42,5 @@ operations_entries_table = Table(
     'operations_entries',
     sqlalchemy_metadata,
     Column('operation_id', UUID, ForeignKey('operations.operation_id'), nullable=False),
-    Column('entry_id', UUID, ForeignKey('entries.entry_id'), nullable=False)
+    Column('entry_id', UUID, nullable=False)
 )
\ No newline at end of file
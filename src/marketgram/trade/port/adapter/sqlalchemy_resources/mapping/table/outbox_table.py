@@ -0,0 +1,59 @@
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Index,
+    String,
+    Table,
+    event,
+    func,
+    text
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.types import (
+    BIGSERIAL
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+outbox_table = Table(
+    'outbox',
+    sqlalchemy_metadata,
+    Column('event_id', BIGSERIAL, primary_key=True, nullable=False, autoincrement=True),
+    Column('aggregate_type', String, nullable=False),
+    Column('aggregate_id', String, nullable=False),
+    Column('event_type', String, nullable=False),
+    Column('payload', JSONB, nullable=False),
+    Column('occurred_at', DateTime(timezone=True), nullable=False),
+    Column('created_at', DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Column('published_at', DateTime(timezone=True), nullable=True),
+    Index(
+        'ix_outbox_unpublished',
+        'event_id',
+        postgresql_where=text('published_at IS NULL')
+    ),
+    Index('ix_outbox_aggregate_type_event_id', 'aggregate_type', 'event_id')
+)
+
+
+card_view_invalidate_func = DDL(
+    """
+    CREATE OR REPLACE FUNCTION outbox_card_view_invalidate() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('card_view_invalidated', NEW.aggregate_id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+card_view_invalidate_trigger = DDL(
+    "CREATE TRIGGER outbox_card_view_invalidate "
+    "AFTER INSERT ON outbox FOR EACH ROW "
+    "WHEN (NEW.aggregate_type = 'card') "
+    "EXECUTE FUNCTION outbox_card_view_invalidate()"
+)
+event.listen(outbox_table, 'after_create', card_view_invalidate_func.execute_if(dialect="postgresql"))
+event.listen(outbox_table, 'after_create', card_view_invalidate_trigger.execute_if(dialect="postgresql"))
@@ -0,0 +1,14 @@
+from sqlalchemy import UUID, Column, DateTime, String, Table, func
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+processed_events_table = Table(
+    'processed_events',
+    sqlalchemy_metadata,
+    Column('consumer', String, primary_key=True, nullable=False),
+    Column('event_id', UUID, primary_key=True, nullable=False),
+    Column('processed_at', DateTime(timezone=True), server_default=func.now(), nullable=False)
+)
@@ -0,0 +1,36 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    func,
+    text
+)
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.types import (
+    BIGSERIAL
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+stock_items_table = Table(
+    'stock_items',
+    sqlalchemy_metadata,
+    Column('item_id', BIGSERIAL, primary_key=True, nullable=False, autoincrement=True),
+    Column('card_id', BigInteger, ForeignKey('cards.card_id'), nullable=False),
+    Column('payload', String, nullable=False),
+    Column('deal_id', BigInteger, ForeignKey('deals.deal_id'), nullable=True),
+    Column('created_at', DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Index(
+        'ix_stock_items_available', 
+        'card_id', 
+        'item_id', 
+        postgresql_where=text('deal_id IS NULL')
+    ),
+    Index('ix_stock_items_deal_id', 'deal_id')
+)
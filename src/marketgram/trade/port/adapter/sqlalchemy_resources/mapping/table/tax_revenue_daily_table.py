@@ -0,0 +1,25 @@
+from sqlalchemy import (
+    DECIMAL,
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    func
+)
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.metadata import (
+    sqlalchemy_metadata
+)
+
+
+tax_revenue_daily_table = Table(
+    'tax_revenue_daily',
+    sqlalchemy_metadata,
+    Column('day', Date, primary_key=True, nullable=False),
+    Column('operation', String, primary_key=True, nullable=False),
+    Column('amount', DECIMAL(20, 2), nullable=False),
+    Column('entries', Integer, nullable=False),
+    Column('updated_at', DateTime(timezone=True), server_default=func.now(), nullable=False)
+)
@@ -1,15 +1,18 @@
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select, func
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import with_expression
 
 from marketgram.trade.domain.model.p2p.seller import Seller
 from marketgram.trade.domain.model.p2p.user import User
-from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
 from marketgram.trade.domain.model.rule.agreement.types import AccountType
-from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
-    entries_table
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balances_table import (
+    balances_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
 )
 
 
@@ -22,6 +25,22 @@ class SQLAlchemyMembersRepository:
 
     def add(self, user: User) -> None:
         self._async_session.add(user)
+
+    async def add_many_new(self, user_ids: list[UUID]) -> int:
+        if not user_ids:
+            return 0
+
+        stmt = (
+            insert(members_table)
+            .values([
+                {'user_id': user_id, 'is_blocked': False} 
+                for user_id in user_ids
+            ])
+            .on_conflict_do_nothing(index_elements=['user_id'])
+        )
+        result = await self._async_session.execute(stmt)
+
+        return result.rowcount
     
     async def seller_with_id(self, user_id: UUID) -> Seller:
         stmt = select(Seller).where(and_(
@@ -39,7 +58,7 @@ class SQLAlchemyMembersRepository:
             ))
             .options(with_expression(
                 Seller._balance, 
-                self._sum_query(user_id, AccountType.SELLER)
+                self._balance_query(user_id, AccountType.SELLER)
             ))
             .with_for_update()
         )
@@ -57,7 +76,7 @@ class SQLAlchemyMembersRepository:
         stmt = (
             select(User)
             .where(User._user_id == user_id)
-            .options(with_expression(User._balance, self._sum_query(
+            .options(with_expression(User._balance, self._balance_query(
                 user_id, AccountType.USER
             )))
             .with_for_update()
@@ -66,13 +85,12 @@ class SQLAlchemyMembersRepository:
         
         return result.scalar()
     
-    def _sum_query(self, user_id: UUID, account_type: AccountType):
+    def _balance_query(self, user_id: UUID, account_type: AccountType):
         return (
-            select(func.sum(entries_table.c.amount))
+            select(balances_table.c.amount)
             .where(and_(
-                entries_table.c.user_id == user_id,
-                entries_table.c.entry_status == EntryStatus.ACCEPTED,
-                entries_table.c.account_type == account_type
+                balances_table.c.user_id == user_id,
+                balances_table.c.account_type == account_type
             ))
             .scalar_subquery()
         )
\ No newline at end of file
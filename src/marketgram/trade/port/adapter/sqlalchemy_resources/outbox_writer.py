@@ -0,0 +1,68 @@
+from dataclasses import fields
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from marketgram.trade.domain.model.events import AggregateRoot, DomainEvent
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+
+
+def _plain(value: object) -> object:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Money):
+        return str(value.number)
+
+    return value
+
+
+def outbox_row(domain_event: DomainEvent) -> dict:
+    return {
+        'aggregate_type': domain_event.aggregate_type,
+        'aggregate_id': domain_event.aggregate_id,
+        'event_type': domain_event.event_type,
+        'payload': {
+            field.name: _plain(getattr(domain_event, field.name))
+            for field in fields(domain_event)
+        },
+        'occurred_at': domain_event.occurred_at
+    }
+
+
+def _write_released_events(session: Session) -> None:
+    rows = [
+        outbox_row(domain_event)
+        for instance in list(session.identity_map.values())
+        if isinstance(instance, AggregateRoot)
+        for domain_event in instance.release_events()
+    ]
+    if rows:
+        session.connection().execute(insert(outbox_table), rows)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    _write_released_events(session)
+
+
+def _before_commit(session: Session) -> None:
+    session.flush()
+    _write_released_events(session)
+
+
+def register_outbox_writer(session_class: type[Session] = Session) -> None:
+    if not event.contains(session_class, 'after_flush', _after_flush):
+        event.listen(session_class, 'after_flush', _after_flush)
+
+    if not event.contains(session_class, 'before_commit', _before_commit):
+        event.listen(session_class, 'before_commit', _before_commit)
@@ -0,0 +1,37 @@
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.processed_events_table import (
+    processed_events_table
+)
+
+
+class SQLAlchemyProcessedEvents:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def mark_processed(
+        self, 
+        consumer: str, 
+        event_ids: list[UUID]
+    ) -> set[UUID]:
+        if not event_ids:
+            return set()
+
+        stmt = (
+            insert(processed_events_table)
+            .values([
+                {'consumer': consumer, 'event_id': event_id}
+                for event_id in event_ids
+            ])
+            .on_conflict_do_nothing(index_elements=['consumer', 'event_id'])
+            .returning(processed_events_table.c.event_id)
+        )
+        result = await self._async_session.execute(stmt)
+
+        return set(result.scalars())
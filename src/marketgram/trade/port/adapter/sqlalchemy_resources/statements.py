@@ -0,0 +1,161 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import Row, and_, case, func, literal, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.domain.model.rule.agreement.types import AccountType
+from marketgram.trade.port.adapter.errors import (
+    DETACHED_PERIOD,
+    StatementPeriodError
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.entries_archive import (
+    PARTITION_FORMAT,
+    next_month
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balance_checkpoints_table import (
+    balance_checkpoints_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+
+
+class SQLAlchemyStatements:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def available_since(self) -> datetime | None:
+        result = await self._async_session.execute(text(
+            'SELECT relname FROM pg_class '
+            "WHERE relkind = 'r' AND NOT relispartition "
+            "AND relname ~ '^entries_[0-9]{4}_[0-9]{2}$'"
+        ))
+        detached = [
+            datetime.strptime(partition, PARTITION_FORMAT)
+            for partition in result.scalars().all()
+        ]
+        if not detached:
+            return None
+
+        return next_month(max(detached))
+
+    async def opening_balance(
+        self,
+        user_id: UUID,
+        account_type: AccountType,
+        since: datetime
+    ) -> Decimal:
+        since = _naive_utc(since)
+        await self._ensure_available(since)
+
+        checkpoint = (
+            select(balance_checkpoints_table.c.amount)
+            .where(and_(
+                balance_checkpoints_table.c.user_id == user_id,
+                balance_checkpoints_table.c.account_type == account_type
+            ))
+            .scalar_subquery()
+        )
+        adjustment = (
+            select(func.sum(case(
+                (
+                    and_(
+                        entries_table.c.is_archived.is_(False),
+                        entries_table.c.posted_in < since
+                    ),
+                    entries_table.c.amount
+                ),
+                (
+                    and_(
+                        entries_table.c.is_archived.is_(True),
+                        entries_table.c.posted_in >= since
+                    ),
+                    -entries_table.c.amount
+                ),
+                else_=literal(0)
+            )))
+            .where(and_(
+                entries_table.c.user_id == user_id,
+                entries_table.c.account_type == account_type,
+                entries_table.c.entry_status == EntryStatus.ACCEPTED
+            ))
+            .scalar_subquery()
+        )
+        amount = await self._async_session.scalar(select(
+            func.coalesce(checkpoint, literal(0)) 
+            + func.coalesce(adjustment, literal(0))
+        ))
+
+        return Decimal(amount)
+
+    async def lines(
+        self,
+        user_id: UUID,
+        account_type: AccountType,
+        since: datetime,
+        until: datetime,
+        after: tuple[datetime, UUID] | None = None,
+        page_size: int = 5000
+    ) -> AsyncIterator[Row]:
+        since, until = _naive_utc(since), _naive_utc(until)
+        await self._ensure_available(since)
+
+        while True:
+            stmt = (
+                select(
+                    entries_table.c.entry_id,
+                    entries_table.c.posted_in,
+                    entries_table.c.operation,
+                    entries_table.c.amount,
+                    entries_table.c.entry_status
+                )
+                .where(and_(
+                    entries_table.c.user_id == user_id,
+                    entries_table.c.account_type == account_type,
+                    entries_table.c.posted_in >= since,
+                    entries_table.c.posted_in < until
+                ))
+                .order_by(
+                    entries_table.c.posted_in,
+                    entries_table.c.entry_id
+                )
+                .limit(page_size)
+                .execution_options(yield_per=500)
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(
+                        entries_table.c.posted_in, 
+                        entries_table.c.entry_id
+                    ) > tuple_(*after)
+                )
+
+            fetched = 0
+            result = await self._async_session.stream(stmt)
+            async for row in result:
+                fetched += 1
+                after = (row.posted_in, row.entry_id)
+                yield row
+
+            if fetched < page_size:
+                return
+
+    async def _ensure_available(self, since: datetime) -> None:
+        available_since = await self.available_since()
+        if available_since is not None and since < available_since:
+            raise StatementPeriodError(DETACHED_PERIOD)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone(UTC).replace(tzinfo=None)
+
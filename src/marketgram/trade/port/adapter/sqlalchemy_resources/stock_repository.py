@@ -0,0 +1,56 @@
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.stock_items_table import (
+    stock_items_table
+)
+
+
+class SQLAlchemyStockRepository:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def allocate(
+        self, 
+        card_id: int, 
+        deal_id: int, 
+        qty: int
+    ) -> list[int]:
+        available = (
+            select(stock_items_table.c.item_id)
+            .where(and_(
+                stock_items_table.c.card_id == card_id,
+                stock_items_table.c.deal_id.is_(None)
+            ))
+            .order_by(stock_items_table.c.item_id)
+            .limit(qty)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(stock_items_table)
+            .where(stock_items_table.c.item_id.in_(available))
+            .values(deal_id=deal_id)
+            .returning(stock_items_table.c.item_id)
+        )
+        result = await self._async_session.execute(stmt)
+
+        return list(result.scalars())
+    
+    async def add_many(
+        self, 
+        card_id: int, 
+        payloads: list[str]
+    ) -> int:
+        if not payloads:
+            return 0
+        
+        await self._async_session.execute(
+            insert(stock_items_table),
+            [{'card_id': card_id, 'payload': payload} for payload in payloads]
+        )
+        return len(payloads)
+
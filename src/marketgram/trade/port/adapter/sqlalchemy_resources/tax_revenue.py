@@ -0,0 +1,80 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, Row, and_, cast, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
+from marketgram.trade.domain.model.rule.agreement.types import AccountType
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.tax_revenue_daily_table import (
+    tax_revenue_daily_table
+)
+
+
+class SQLAlchemyTaxRevenue:
+    def __init__(
+        self,
+        async_session: AsyncSession
+    ) -> None:
+        self._async_session = async_session
+
+    async def rollup(
+        self, 
+        tax_accounts: TaxAccounts, 
+        since: date, 
+        until: date
+    ) -> int:
+        starts_at = datetime.combine(since, time.min)
+        ends_at = datetime.combine(until + timedelta(days=1), time.min)
+        day = cast(func.date_trunc('day', entries_table.c.posted_in), Date)
+
+        await self._async_session.execute(
+            text('LOCK TABLE tax_revenue_daily IN EXCLUSIVE MODE')
+        )
+        await self._async_session.execute(
+            delete(tax_revenue_daily_table)
+            .where(tax_revenue_daily_table.c.day.between(since, until))
+        )
+        stmt = insert(tax_revenue_daily_table).from_select(
+            ['day', 'operation', 'amount', 'entries'],
+            select(
+                day,
+                entries_table.c.operation,
+                func.sum(entries_table.c.amount),
+                func.count()
+            )
+            .where(and_(
+                entries_table.c.user_id.in_(tax_accounts.account_ids),
+                entries_table.c.account_type == AccountType.TAX,
+                entries_table.c.entry_status == EntryStatus.ACCEPTED,
+                entries_table.c.posted_in >= starts_at,
+                entries_table.c.posted_in < ends_at
+            ))
+            .group_by(day, entries_table.c.operation)
+        )
+        result = await self._async_session.execute(stmt)
+
+        return result.rowcount
+
+    async def daily(self, since: date, until: date) -> list[Row]:
+        result = await self._async_session.execute(
+            select(
+                tax_revenue_daily_table.c.day,
+                tax_revenue_daily_table.c.operation,
+                tax_revenue_daily_table.c.amount,
+                tax_revenue_daily_table.c.entries
+            )
+            .where(tax_revenue_daily_table.c.day.between(since, until))
+            .order_by(
+                tax_revenue_daily_table.c.day,
+                tax_revenue_daily_table.c.operation
+            )
+        )
+
+        return result.all()
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import os
+from datetime import date, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.members_repository import (
+    SQLAlchemyMembersRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.tax_revenue import (
+    SQLAlchemyTaxRevenue
+)
+
+
+async def run(
+    database_url: str, 
+    superuser_id: UUID, 
+    shards: int, 
+    days: int
+) -> int:
+    tax_accounts = TaxAccounts(superuser_id, shards)
+    until = date.today()
+    since = until - timedelta(days=days - 1)
+
+    engine = create_async_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            async with session.begin():
+                created = await SQLAlchemyMembersRepository(session) \
+                    .add_many_new(tax_accounts.account_ids)
+                if created:
+                    print(f'Tax accounts created: {created}')
+
+                rows = await SQLAlchemyTaxRevenue(session) \
+                    .rollup(tax_accounts, since, until)
+                print(f'Tax revenue rolled up for {since}..{until}: {rows} rows')
+
+                return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Roll tax account entries up into daily revenue aggregates.'
+    )
+    parser.add_argument(
+        '--superuser-id',
+        type=UUID,
+        default=os.environ.get('TRADE_SUPERUSER_ID')
+    )
+    parser.add_argument(
+        '--shards',
+        type=int,
+        default=int(os.environ.get('TRADE_TAX_SHARDS', 1)),
+        help='number of tax sub-accounts commission entries are spread over'
+    )
+    parser.add_argument(
+        '--days',
+        type=int,
+        default=2,
+        help='number of recent days to recompute, including today'
+    )
+    parser.add_argument(
+        '--database-url',
+        default=os.environ.get('DATABASE_URL')
+    )
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(
+        run(args.database_url, args.superuser_id, args.shards, args.days)
+    ))
+
+
+if __name__ == '__main__':
+    main()
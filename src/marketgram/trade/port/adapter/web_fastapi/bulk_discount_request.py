@@ -0,0 +1,53 @@
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.application.commands.bulk_discount import (
+    BulkDiscountCommand,
+    BulkDiscountHandler
+)
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+class BulkDiscountRequest(BaseModel):
+    percent: str | None = None
+    amount: str | None = None
+    card_ids: list[int] | None = None
+    region: Region | None = None
+    account_format: AccountFormat | None = None
+    min_price: str | None = None
+    max_price: str | None = None
+
+
+@router.post('/discount_setting/bulk')
+async def bulk_discount_controller(
+    field: BulkDiscountRequest,
+    req: Request,
+    res: Response
+) -> dict:
+    async with Container(req, res) as container:
+        command = BulkDiscountCommand(
+            field.percent,
+            field.amount,
+            field.card_ids,
+            field.region,
+            field.account_format,
+            field.min_price,
+            field.max_price
+        )
+        handler = await container.get(
+            BulkDiscountHandler
+        )
+        report = await handler.handle(command)
+
+        return {
+            'discounted': report.discounted,
+            'rejected': [
+                {'card_id': card.card_id, 'reason': card.reason}
+                for card in report.rejected
+            ]
+        }
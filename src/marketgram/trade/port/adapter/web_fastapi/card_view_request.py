@@ -0,0 +1,23 @@
+from fastapi import HTTPException, Request, Response, status
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.port.adapter.sqlalchemy_resources.card_views import (
+    SQLAlchemyCardViews
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+@router.get('/cards/{card_id}')
+async def card_view_controller(
+    card_id: int,
+    req: Request, 
+    res: Response
+) -> dict:
+    async with Container(req, res) as container:
+        card_views = await container.get(SQLAlchemyCardViews)
+
+        view = await card_views.with_id(card_id)
+        if view is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+        return view
@@ -0,0 +1,114 @@
+import csv
+import json
+from collections import deque
+from typing import AsyncIterator, Literal
+
+from fastapi import Request, Response
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.application.commands.cards_bulk_create import (
+    CardsBulkCreateCommand,
+    CardsBulkCreateHandler
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+from marketgram.trade.port.adapter.web_fastapi.stock_upload_request import (
+    payload_lines,
+    payload_text
+)
+
+
+class RecordBuffer:
+    def __init__(self) -> None:
+        self._records: deque[str] = deque()
+        self._pending = ''
+
+    def __iter__(self) -> 'RecordBuffer':
+        return self
+
+    def __next__(self) -> str:
+        if not self._records:
+            raise StopIteration
+
+        return self._records.popleft()
+
+    def feed(self, text: str) -> int:
+        self._pending += text
+        start = position = quotes = 0
+        while (end := self._pending.find('\n', position)) != -1:
+            quotes += self._pending.count('"', position, end)
+            position = end + 1
+            if quotes % 2 == 0:
+                self._records.append(self._pending[start:position])
+                start = position
+                quotes = 0
+
+        self._pending = self._pending[start:]
+
+        return len(self._records)
+
+    def close(self) -> int:
+        if self._pending:
+            self._records.append(self._pending)
+            self._pending = ''
+
+        return len(self._records)
+
+
+async def csv_rows(text: AsyncIterator[str]) -> AsyncIterator[dict]:
+    buffer = RecordBuffer()
+    reader = csv.reader(buffer)
+    header = None
+
+    async def records() -> AsyncIterator[list[str]]:
+        async for chunk in text:
+            for _ in range(buffer.feed(chunk)):
+                yield next(reader)
+
+        for _ in range(buffer.close()):
+            yield next(reader)
+
+    async for values in records():
+        if not values:
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        yield dict(zip(header, values))
+
+
+async def jsonl_rows(lines: AsyncIterator[str]) -> AsyncIterator[dict | None]:
+    async for line in lines:
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+@router.post('/cards/bulk')
+async def cards_bulk_create_controller(
+    req: Request,
+    res: Response,
+    format: Literal['csv', 'jsonl'] = 'jsonl'
+) -> dict:
+    if format == 'csv':
+        rows = csv_rows(payload_text(req))
+    else:
+        rows = jsonl_rows(payload_lines(req))
+
+    async with Container(req, res) as container:
+        command = CardsBulkCreateCommand(rows)
+        handler = await container.get(
+            CardsBulkCreateHandler
+        )
+        result = await handler.handle(command)
+
+        return {
+            'created': result.created,
+            'failed': result.failed,
+            'errors': [
+                {'row': error.row, 'error': error.error}
+                for error in result.errors
+            ]
+        }
@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+from fastapi import Query, Request, Response
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    CatalogFilter,
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+@router.get('/catalog')
+async def catalog_controller(
+    req: Request,
+    res: Response,
+    q: str | None = None,
+    region: Region | None = None,
+    account_format: AccountFormat | None = None,
+    spam_block: bool | None = None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+    after_price: Decimal | None = None,
+    after_card_id: int | None = None,
+    limit: int = Query(20, ge=1, le=100)
+) -> dict:
+    async with Container(req, res) as container:
+        catalog = await container.get(SQLAlchemyCatalog)
+
+        catalog_filter = CatalogFilter(
+            q,
+            region,
+            account_format,
+            spam_block,
+            min_price,
+            max_price
+        )
+        after = None
+        if after_price is not None and after_card_id is not None:
+            after = (after_price, after_card_id)
+
+        rows = await catalog.cards(catalog_filter, after, limit)
+        facets = await catalog.facets(catalog_filter) if after is None else None
+
+        next_page = None
+        if len(rows) == limit:
+            next_page = {
+                'after_price': rows[-1].price,
+                'after_card_id': rows[-1].card_id
+            }
+
+        return {
+            'cards': [row._asdict() for row in rows],
+            'facets': facets,
+            'next': next_page
+        }
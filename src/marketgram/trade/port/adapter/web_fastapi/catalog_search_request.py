@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from fastapi import Query, Request, Response
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.catalog_index import CatalogIndex
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    CatalogFilter,
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+@router.get('/catalog/search')
+async def catalog_search_controller(
+    req: Request,
+    res: Response,
+    q: str | None = None,
+    region: Region | None = None,
+    account_format: AccountFormat | None = None,
+    spam_block: bool | None = None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+    limit: int = Query(20, ge=1, le=100)
+) -> dict:
+    async with Container(req, res) as container:
+        index = await container.get(CatalogIndex)
+
+        if index.is_complete:
+            hits = index.search(
+                q, 
+                region, 
+                account_format, 
+                spam_block, 
+                min_price, 
+                max_price, 
+                limit
+            )
+            return {
+                'cards': [
+                    {'card_id': hit.card_id, 'title': hit.title, 'price': hit.price}
+                    for hit in hits
+                ],
+                'facets': index.facets(q, region, account_format, spam_block)
+            }
+
+        catalog = await container.get(SQLAlchemyCatalog)
+        catalog_filter = CatalogFilter(
+            q,
+            region,
+            account_format,
+            spam_block,
+            min_price,
+            max_price
+        )
+        rows = await catalog.cards(catalog_filter, limit=limit)
+
+        return {
+            'cards': [
+                {'card_id': row.card_id, 'title': row.title, 'price': row.price}
+                for row in rows
+            ],
+            'facets': await catalog.facets(catalog_filter)
+        }
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from fastapi import Query, Request, Response
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.port.adapter.sqlalchemy_resources.deal_views import (
+    SQLAlchemyDealViews
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+@router.get('/deals')
+async def deals_list_controller(
+    req: Request, 
+    res: Response,
+    status: StatusDeal | None = None,
+    after_created_at: datetime | None = None,
+    after_deal_id: int | None = None,
+    limit: int = Query(20, ge=1, le=100)
+) -> dict:
+    async with Container(req, res) as container:
+        id_provider = await container.get(IdProvider)
+        deal_views = await container.get(SQLAlchemyDealViews)
+
+        after = None
+        if after_created_at is not None and after_deal_id is not None:
+            after = (after_created_at, after_deal_id)
+
+        rows = await deal_views.for_user(
+            id_provider.provided_id(),
+            status,
+            after,
+            limit
+        )
+        next_page = None
+        if len(rows) == limit:
+            next_page = {
+                'after_created_at': rows[-1].created_at,
+                'after_deal_id': rows[-1].deal_id
+            }
+
+        return {
+            'deals': [row._asdict() for row in rows],
+            'next': next_page
+        }
@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import StrEnum, auto
+from typing import AsyncIterator
+from uuid import UUID
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from marketgram.common.application.id_provider import IdProvider
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.domain.model.rule.agreement.types import AccountType
+from marketgram.trade.port.adapter.errors import StatementPeriodError
+from marketgram.trade.port.adapter.sqlalchemy_resources.statements import (
+    SQLAlchemyStatements
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+COLUMNS = ['entry_id', 'posted_in', 'operation', 'amount', 'entry_status', 'balance']
+
+
+class StatementFormat(StrEnum):
+    CSV = auto()
+    JSONL = auto()
+
+
+@router.get('/statement')
+async def statement_export_controller(
+    req: Request,
+    res: Response,
+    account_type: AccountType,
+    since: datetime,
+    until: datetime,
+    format: StatementFormat = StatementFormat.CSV
+) -> StreamingResponse:
+    async with Container(req, res) as container:
+        id_provider = await container.get(IdProvider)
+        user_id = id_provider.provided_id()
+        statements = await container.get(SQLAlchemyStatements)
+        try:
+            balance = await statements.opening_balance(
+                user_id, account_type, since
+            )
+        except StatementPeriodError as error:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, str(error))
+
+    media_type = 'text/csv' if format == StatementFormat.CSV else 'application/x-ndjson'
+    filename = f'statement_{since:%Y%m%d}_{until:%Y%m%d}.{format}'
+
+    return StreamingResponse(
+        _statement_lines(
+            req, res, user_id, account_type, since, until, balance, format
+        ),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+
+async def _statement_lines(
+    req: Request,
+    res: Response,
+    user_id: UUID,
+    account_type: AccountType,
+    since: datetime,
+    until: datetime,
+    balance: Decimal,
+    format: StatementFormat
+) -> AsyncIterator[str]:
+    async with Container(req, res) as container:
+        statements = await container.get(SQLAlchemyStatements)
+
+        if format == StatementFormat.CSV:
+            yield _csv_line(COLUMNS)
+
+        async for row in statements.lines(user_id, account_type, since, until):
+            if row.entry_status == EntryStatus.ACCEPTED:
+                balance += row.amount
+
+            line = [
+                str(row.entry_id),
+                row.posted_in.isoformat(),
+                row.operation,
+                str(row.amount),
+                row.entry_status,
+                str(balance)
+            ]
+            if format == StatementFormat.CSV:
+                yield _csv_line(line)
+            else:
+                yield json.dumps(dict(zip(COLUMNS, line))) + '\n'
+
+
+def _csv_line(values: list[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+
+    return buffer.getvalue()
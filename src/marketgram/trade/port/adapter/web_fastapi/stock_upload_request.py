@@ -0,0 +1,53 @@
+import codecs
+from typing import AsyncIterator
+
+from fastapi import Request, Response
+
+from marketgram.common.port.adapter.container import Container
+from marketgram.trade.application.commands.stock_upload import (
+    StockUploadCommand,
+    StockUploadHandler
+)
+from marketgram.trade.port.adapter.web_fastapi.routing import router
+
+
+async def payload_text(req: Request) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    async for chunk in req.stream():
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(b'', final=True)
+
+
+async def payload_lines(req: Request) -> AsyncIterator[str]:
+    tail = ''
+    async for text in payload_text(req):
+        lines = (tail + text).split('\n')
+        tail = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+
+    line = tail.strip()
+    if line:
+        yield line
+
+
+@router.post('/cards/{card_id}/stock')
+async def stock_upload_controller(
+    card_id: int,
+    req: Request, 
+    res: Response
+) -> dict:
+    async with Container(req, res) as container:
+        command = StockUploadCommand(
+            card_id,
+            payload_lines(req)
+        )
+        handler = await container.get(
+            StockUploadHandler
+        )
+        uploaded = await handler.handle(command)
+
+        return {'uploaded': uploaded}
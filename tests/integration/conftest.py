@@ -17,6 +17,9 @@ from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.roles_registry import (
     roles_registry_mapper
 )
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.email_outbox_table import (
+    email_outbox_table
+)
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.roles_table import (
     role_table
 )
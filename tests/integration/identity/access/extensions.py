@@ -55,10 +55,10 @@ class UserExtensions:
         assert self._user.is_active
         return self
     
-    def with_hashed_password(
+    async def with_hashed_password(
         self, 
         password: str, 
         password_hasher: PasswordHasher
     ) -> Self:
-        assert password_hasher.verify(self._user.password, password)
+        assert await password_hasher.verify(self._user.password, password)
         return self
\ No newline at end of file
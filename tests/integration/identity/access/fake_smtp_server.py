@@ -0,0 +1,65 @@
+import asyncio
+
+HOST = '127.0.0.1'
+
+
+class FakeSMTPServer:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        replies: dict[str, bytes] = None,
+        refused: dict[str, bytes] = None
+    ) -> None:
+        self._latency = latency
+        self._replies = replies or {}
+        self._refused = refused or {}
+        self._server: asyncio.Server = None
+        self.delivered: list[str] = []
+        self.connections = 0
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self.handle, HOST, 0)
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        recipient = None
+        writer.write(b'220 localhost ESMTP\r\n')
+        await writer.drain()
+
+        while line := await reader.readline():
+            command = line[:4].upper()
+            await asyncio.sleep(self._latency)
+
+            if command == b'EHLO':
+                writer.write(b'250-localhost\r\n250 8BITMIME\r\n')
+            elif command == b'RCPT':
+                recipient = line.decode().partition('<')[2].partition('>')[0]
+                writer.write(self._refused.get(recipient, b'250 OK') + b'\r\n')
+            elif command == b'DATA':
+                writer.write(b'354 End data with <CR><LF>.<CR><LF>\r\n')
+                await writer.drain()
+                await reader.readuntil(b'\r\n.\r\n')
+                reply = self._replies.get(recipient, b'250 OK')
+                if reply.startswith(b'250'):
+                    self.delivered.append(recipient)
+                writer.write(reply + b'\r\n')
+            elif command == b'QUIT':
+                writer.write(b'221 Bye\r\n')
+                await writer.drain()
+                break
+            else:
+                writer.write(b'250 OK\r\n')
+
+            await writer.drain()
+
+        writer.close()
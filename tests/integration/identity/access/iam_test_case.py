@@ -45,7 +45,7 @@ class IAMTestCase(IntegrationTest):
     ) -> User:
         async with AsyncSession(self.engine) as session:
             await session.begin()
-            user = UserFactory(Argon2PasswordHasher()).create(
+            user = await UserFactory(Argon2PasswordHasher()).create(
                 email, password
             )
             if is_active:
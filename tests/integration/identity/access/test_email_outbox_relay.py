@@ -0,0 +1,250 @@
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from email.message import EmailMessage
+
+from aiosmtplib import SMTP
+from sqlalchemy import Row, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.identity.access.port.adapter.email_outbox_relay import (
+    EmailOutboxRelay,
+    SMTPConnectionPool,
+    TokenBucket
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
+    IAMContext
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.mapping.table.email_outbox_table import (
+    email_outbox_table
+)
+from marketgram.identity.access.port.adapter.sqlalchemy_resources.outbox_email_sender import (
+    OutboxEmailSender
+)
+from tests.integration.identity.access.fake_smtp_server import (
+    HOST,
+    FakeSMTPServer
+)
+from tests.integration.identity.access.iam_test_case import IAMTestCase
+
+
+class TestEmailOutboxRelay(IAMTestCase):
+    async def test_pending_messages_are_delivered_over_pooled_connections(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer()
+        port = await smtp_server.start()
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sender = OutboxEmailSender(IAMContext(session))
+            for number in range(3):
+                await sender.send_message(self.message(f'user{number}@mail.ru'))
+            await session.commit()
+
+        sut = self.relay(port)
+
+        # Act
+        processed = await sut.run_once()
+        connections = smtp_server.connections
+        await self.enqueue('user3@mail.ru')
+        await sut.run_once()
+
+        # Assert
+        assert processed == 3
+        assert sut.metrics.sent == 4
+        assert sorted(smtp_server.delivered) == [
+            'user0@mail.ru', 'user1@mail.ru', 'user2@mail.ru', 'user3@mail.ru'
+        ]
+        assert smtp_server.connections == connections
+        rows = await self.outbox()
+        assert all(row.sent_at is not None for row in rows)
+        assert await sut.run_once() == 0
+
+        await self.close(sut, smtp_server)
+
+    async def test_message_with_expired_lease_is_claimed_again(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer()
+        port = await smtp_server.start()
+        await self.enqueue('test@mail.ru')
+
+        crashed = self.relay(port)
+        await crashed._claim()
+        sut = self.relay(port)
+
+        # Act
+        while_leased = await sut.run_once()
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                update(email_outbox_table)
+                .values(next_attempt_at=datetime.now(UTC) - timedelta(seconds=1))
+            )
+            await session.commit()
+        after_expiry = await sut.run_once()
+
+        # Assert
+        assert while_leased == 0
+        assert after_expiry == 1
+        assert smtp_server.delivered == ['test@mail.ru']
+        [row] = await self.outbox()
+        assert row.attempts == 2
+        assert row.sent_at is not None
+
+        await self.close(sut, smtp_server)
+
+    async def test_transient_rejection_is_retried_with_backoff(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer(replies={'test@mail.ru': b'451 Try later'})
+        port = await smtp_server.start()
+        await self.enqueue('test@mail.ru')
+
+        sut = self.relay(port, base_backoff=60.0)
+
+        # Act
+        started_at = datetime.now(UTC)
+        await sut.run_once()
+
+        # Assert
+        assert sut.metrics.retried == 1
+        assert smtp_server.delivered == []
+        [row] = await self.outbox()
+        assert row.sent_at is None
+        assert row.failed_at is None
+        assert row.attempts == 1
+        assert '451' in row.last_error
+        assert started_at + timedelta(seconds=30) \
+            <= row.next_attempt_at \
+            <= datetime.now(UTC) + timedelta(seconds=60)
+        assert await sut.run_once() == 0
+
+        await self.close(sut, smtp_server)
+
+    async def test_permanent_rejection_is_marked_failed(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer(
+            replies={'rejected@mail.ru': b'554 Rejected'},
+            refused={'unknown@mail.ru': b'550 No such user'}
+        )
+        port = await smtp_server.start()
+        await self.enqueue('rejected@mail.ru')
+        await self.enqueue('unknown@mail.ru')
+
+        sut = self.relay(port)
+
+        # Act
+        await sut.run_once()
+
+        # Assert
+        assert sut.metrics.failed == 2
+        assert sut.metrics.retried == 0
+        rows = await self.outbox()
+        assert all(row.failed_at is not None for row in rows)
+        assert all(row.attempts == 1 for row in rows)
+        assert await sut.run_once() == 0
+
+        await self.close(sut, smtp_server)
+
+    async def test_sending_is_throttled_by_rate_limit(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer()
+        port = await smtp_server.start()
+        for number in range(5):
+            await self.enqueue(f'user{number}@mail.ru')
+
+        sut = self.relay(port, TokenBucket(rate=20, capacity=1))
+
+        # Act
+        started_at = time.monotonic()
+        await sut.run_once()
+        elapsed = time.monotonic() - started_at
+
+        # Assert
+        assert len(smtp_server.delivered) == 5
+        assert elapsed >= 0.15
+
+        await self.close(sut, smtp_server)
+
+    async def test_relay_keeps_running_after_a_failed_claim(self) -> None:
+        # Arrange
+        smtp_server = FakeSMTPServer()
+        port = await smtp_server.start()
+        await self.enqueue('test@mail.ru')
+
+        sut = self.relay(port, idle_interval=0.05)
+        claim = sut._claim
+        calls = []
+
+        async def flaky_claim() -> list[Row]:
+            calls.append(True)
+            if len(calls) == 1:
+                raise ConnectionError('Database is unavailable')
+
+            return await claim()
+
+        sut._claim = flaky_claim
+
+        # Act
+        task = asyncio.create_task(sut.run())
+        await asyncio.sleep(0.5)
+        sut.stop()
+        await task
+
+        # Assert
+        assert sut.metrics.failed_batches == 1
+        assert sut.metrics.sent == 1
+        assert smtp_server.delivered == ['test@mail.ru']
+
+        await self.close(sut, smtp_server)
+
+    def relay(
+        self,
+        port: int,
+        rate_limit: TokenBucket = None,
+        **kwargs
+    ) -> EmailOutboxRelay:
+        return EmailOutboxRelay(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            SMTPConnectionPool(
+                lambda: SMTP(
+                    hostname=HOST, port=port, use_tls=False, start_tls=False
+                ),
+                4
+            ),
+            rate_limit or TokenBucket(rate=1000),
+            **kwargs
+        )
+
+    def message(self, recipient: str) -> EmailMessage:
+        message = EmailMessage()
+        message['From'] = 'noreply@marketgram.ru'
+        message['To'] = recipient
+        message['Subject'] = 'Активация аккаунта'
+        message.set_content('link')
+
+        return message
+
+    async def enqueue(self, recipient: str) -> None:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(email_outbox_table)
+                .values(message=self.message(recipient).as_bytes())
+            )
+            await session.commit()
+
+    async def outbox(self) -> list[Row]:
+        async with AsyncSession(self.engine) as session:
+            result = await session.execute(
+                select(email_outbox_table)
+                .order_by(email_outbox_table.c.message_id)
+            )
+
+            return result.all()
+
+    async def close(
+        self,
+        relay: EmailOutboxRelay,
+        smtp_server: FakeSMTPServer
+    ) -> None:
+        await relay._connection_pool.close()
+        await smtp_server.close()
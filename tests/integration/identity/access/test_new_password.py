@@ -15,6 +15,9 @@ from marketgram.identity.access.port.adapter.jwt_token_manager import (
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
     IAMContext
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 from tests.integration.identity.access.iam_test_case import IAMTestCase
 
 
@@ -40,7 +43,7 @@ class TestNewPasswordHandler(IAMTestCase):
 
         # Assert
         user_from_db = await self.query_user_with_id(user.user_id)
-        user_from_db \
+        await user_from_db \
             .should_exist() \
             .with_hashed_password('new_protected', password_hasher)
 
@@ -58,6 +61,7 @@ class TestNewPasswordHandler(IAMTestCase):
             handler = NewPasswordHandler(
                 IAMContext(session),
                 token_manager,
-                password_hasher
+                password_hasher,
+                WebSessionsCache()
             )
             return await handler.execute(command)
\ No newline at end of file
@@ -11,6 +11,9 @@ from marketgram.identity.access.port.adapter.argon2_password_hasher import (
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
     IAMContext
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 from tests.integration.identity.access.iam_test_case import IAMTestCase
 
 
@@ -34,7 +37,7 @@ class TestPasswordChangeHandler(IAMTestCase):
 
         # Assert
         user_from_db = await self.query_user_with_id(user.user_id)
-        user_from_db \
+        await user_from_db \
             .should_exist() \
             .with_hashed_password('new_protected', password_hasher)
 
@@ -50,6 +53,7 @@ class TestPasswordChangeHandler(IAMTestCase):
             await session.begin()
             handler = PasswordChangeHandler(
                 IAMContext(session),
-                password_hasher
+                password_hasher,
+                WebSessionsCache()
             )
             return await handler.execute(command)
@@ -1,3 +1,4 @@
+from unittest.mock import Mock
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +14,9 @@ from marketgram.identity.access.port.adapter.argon2_password_hasher import (
 from marketgram.identity.access.port.adapter.sqlalchemy_resources.context import (
     IAMContext
 )
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache
+)
 from tests.integration.identity.access.iam_test_case import IAMTestCase
                 
 
@@ -47,6 +51,8 @@ class TestUserLoginHandler(IAMTestCase):
             await session.begin()
             handler = UserLoginHandler(
                 IAMContext(session),
-                password_hasher
+                password_hasher,
+                WebSessionsCache(),
+                Mock()
             )
             return await handler.execute(command)
\ No newline at end of file
@@ -45,7 +45,7 @@ class TestUserRegistrationHandler(IAMTestCase):
         email_sender.send_message.assert_called_once()
 
         user_from_db = await self.query_user_with_email('test@mail.ru')
-        user_from_db \
+        await user_from_db \
             .should_exist() \
             .with_email('test@mail.ru') \
             .not_activated() \
@@ -0,0 +1,175 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.p2p.deadlines import Deadlines
+from marketgram.trade.domain.model.p2p.delivery import Delivery
+from marketgram.trade.domain.model.p2p.format import Format
+from marketgram.trade.domain.model.p2p.transfer_method import TransferMethod
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.bulk_discount import (
+    BulkDiscount,
+    BulkDiscountReport,
+    CardsFilter
+)
+from marketgram.trade.domain.model.trade_item.card import Card
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Description,
+    Region
+)
+from marketgram.trade.domain.model.trade_item.exceptions import (
+    DISCOUNT_ERROR,
+    DomainError
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.cards_repository import (
+    SQLAlchemyCardsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestBulkDiscount(TradeTestCase):
+    async def test_discount_applies_card_rules_and_reports_rejections(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        discounted_id, cheap_id, untouched_id = [
+            await self.create_card(owner_id) for _ in range(3)
+        ]
+        await self.set_price(cheap_id, Decimal('105'))
+
+        # Act
+        first = await self.discount(
+            owner_id,
+            CardsFilter(card_ids=(discounted_id, cheap_id)),
+            BulkDiscount(percent=Decimal('15'))
+        )
+        second = await self.discount(
+            owner_id,
+            CardsFilter(card_ids=(discounted_id,)),
+            BulkDiscount(price=Money(190))
+        )
+
+        # Assert
+        assert first.discounted == [discounted_id]
+        assert [(card.card_id, card.reason) for card in first.rejected] == [
+            (cheap_id, DISCOUNT_ERROR)
+        ]
+        assert second.discounted == []
+        assert [card.card_id for card in second.rejected] == [discounted_id]
+        async with AsyncSession(self.engine) as session:
+            rows = (await session.execute(
+                select(
+                    cards_table.c.card_id,
+                    cards_table.c.price,
+                    cards_table.c.dirty_price,
+                    cards_table.c.version_id
+                )
+                .where(cards_table.c.card_id.in_(
+                    [discounted_id, untouched_id]
+                ))
+                .order_by(cards_table.c.card_id)
+            )).all()
+            events = (await session.execute(
+                select(outbox_table.c.payload)
+                .where(
+                    outbox_table.c.aggregate_id == str(discounted_id),
+                    outbox_table.c.event_type == 'CardPriceChanged'
+                )
+            )).scalars().all()
+        assert rows == [
+            (discounted_id, Decimal('170.00'), Decimal('200.00'), 2),
+            (untouched_id, Decimal('200.00'), None, 1)
+        ]
+        assert [event['price'] for event in events] == ['170.00']
+
+    async def test_percent_discount_matches_card_rounding(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        prices = [Decimal(price) for price in (
+            '105.00', '111.10', '123.45', '150.05', 
+            '199.99', '201.50', '333.33', '999.95'
+        )]
+        card_ids = [await self.create_card(owner_id) for _ in prices]
+        for card_id, price in zip(card_ids, prices):
+            await self.set_price(card_id, price)
+
+        percent = Decimal('12.5')
+        expected = {}
+        for card_id, price in zip(card_ids, prices):
+            card = self.make_card(Money(price))
+            try:
+                card.set_discounted_price(Money(price * (100 - percent) / 100))
+            except DomainError:
+                continue
+            expected[card_id] = card.price.number
+
+        # Act
+        report = await self.discount(
+            owner_id,
+            CardsFilter(card_ids=tuple(card_ids)),
+            BulkDiscount(percent=percent)
+        )
+
+        # Assert
+        assert report.discounted == sorted(expected)
+        async with AsyncSession(self.engine) as session:
+            prices = dict((await session.execute(
+                select(cards_table.c.card_id, cards_table.c.price)
+                .where(cards_table.c.card_id.in_(report.discounted))
+            )).all())
+        assert prices == expected
+
+    async def discount(
+        self,
+        owner_id: UUID,
+        cards_filter: CardsFilter,
+        discount: BulkDiscount
+    ) -> BulkDiscountReport:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = SQLAlchemyCardsRepository(session)
+            report = await sut.set_discounted_prices(
+                owner_id,
+                cards_filter,
+                discount
+            )
+            await session.commit()
+
+        return report
+
+    async def set_price(self, card_id: int, price: Decimal) -> None:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                update(cards_table)
+                .where(cards_table.c.card_id == card_id)
+                .values(price=price)
+            )
+            await session.commit()
+
+    def make_card(self, price: Money) -> Card:
+        return Card(
+            None,
+            price,
+            Description(
+                'Test card',
+                'Test description',
+                AccountFormat.Autoreg,
+                Region.Random,
+                False
+            ),
+            Delivery(Format.LOGIN_CODE, TransferMethod.PROVIDES_SELLER),
+            Deadlines(1, 1, 1),
+            Money(100),
+            Decimal('0.1'),
+            datetime.now()
+        )
@@ -0,0 +1,34 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from marketgram.trade.port.adapter.card_views_cache import CardViewsCache
+from marketgram.trade.port.adapter.sqlalchemy_resources.card_views import (
+    SQLAlchemyCardViews
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestCardViews(TradeTestCase):
+    async def test_concurrent_requests_share_one_load(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        card_id = await self.create_card(owner_id)
+
+        cache = CardViewsCache()
+        sut = SQLAlchemyCardViews(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            cache
+        )
+
+        # Act
+        with self.count_statements() as statements:
+            views = await asyncio.gather(
+                *[sut.with_id(card_id) for _ in range(5)]
+            )
+
+        # Assert
+        assert len(statements) == 1
+        assert [view['card_id'] for view in views] == [card_id] * 5
+        assert views[0]['owner_id'] == str(owner_id)
+        assert (cache.misses, cache.coalesced) == (1, 4)
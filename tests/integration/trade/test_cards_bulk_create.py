@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.application.commands.cards_bulk_create import (
+    CardsBulkCreateCommand,
+    CardsBulkCreateHandler,
+    CardsBulkCreateResult
+)
+from marketgram.trade.domain.model.p2p.deadlines import Deadlines
+from marketgram.trade.domain.model.rule.agreement.limits import Limits
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.rule.agreement.service_agreement import (
+    ServiceAgreement
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.cards_repository import (
+    SQLAlchemyCardsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.members_repository import (
+    SQLAlchemyMembersRepository
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class FixedIdProvider:
+    def __init__(self, user_id: UUID) -> None:
+        self._user_id = user_id
+
+    def provided_id(self) -> UUID:
+        return self._user_id
+
+
+class TestCardsBulkCreateHandler(TradeTestCase):
+    async def test_valid_rows_are_inserted_and_invalid_rows_reported(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        rows = [self.make_row(f'Card {number}') for number in range(1200)]
+        rows[10]['amount'] = '50'
+        rows[700]['region'] = 'mars'
+        del rows[1100]['title']
+
+        # Act
+        result = await self.handle(owner_id, rows)
+
+        # Assert
+        assert result.created == 1197
+        assert result.failed == 3
+        assert [error.row for error in result.errors] == [11, 701, 1101]
+        async with AsyncSession(self.engine) as session:
+            cards = await session.scalar(
+                select(func.count())
+                .select_from(cards_table)
+                .where(cards_table.c.owner_id == owner_id)
+            )
+            events = await session.scalar(
+                select(func.count())
+                .select_from(outbox_table)
+                .where(
+                    outbox_table.c.event_type == 'CardCreated',
+                    outbox_table.c.payload['owner_id'].astext == str(owner_id)
+                )
+            )
+        assert cards == 1197
+        assert events == 1197
+
+    async def handle(
+        self,
+        owner_id: UUID,
+        rows: list[dict]
+    ) -> CardsBulkCreateResult:
+        async def stream() -> AsyncIterator[dict]:
+            for row in rows:
+                yield row
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = CardsBulkCreateHandler(
+                FixedIdProvider(owner_id),
+                SQLAlchemyMembersRepository(session),
+                SQLAlchemyCardsRepository(session),
+                self.make_agreement()
+            )
+            result = await sut.handle(CardsBulkCreateCommand(stream()))
+            await session.commit()
+
+        return result
+
+    def make_agreement(self) -> ServiceAgreement:
+        agreement = ServiceAgreement(Deadlines(1, 1, 1))
+        agreement.new_limits(
+            Limits(
+                Money(100),
+                Money(100),
+                Money(100),
+                Decimal('0.1'),
+                Decimal('0.1'),
+                Decimal('0.1'),
+                datetime.now() - timedelta(days=1)
+            )
+        )
+        return agreement
+
+    def make_row(self, title: str) -> dict:
+        return {
+            'amount': '200',
+            'title': title,
+            'text_description': 'Bulk description',
+            'account_format': 'autoreg',
+            'region': 'random',
+            'spam_block': 'false',
+            'format': 'login_code',
+            'method': 'provides_seller',
+            'shipping_hours': '',
+            'receipt_hours': '',
+            'check_hours': '1'
+        }
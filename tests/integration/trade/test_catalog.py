@@ -0,0 +1,51 @@
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.trade_item.description import Region
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog import (
+    CatalogFilter,
+    SQLAlchemyCatalog
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestCatalog(TradeTestCase):
+    async def test_search_returns_buyable_cards_with_facets(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        card_ids = [await self.create_card(owner_id) for _ in range(4)]
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                update(cards_table)
+                .where(cards_table.c.card_id.in_(card_ids[:3]))
+                .values(title='Catalogsearch premium', region=Region.Europe)
+            )
+            await session.execute(
+                update(cards_table)
+                .where(cards_table.c.card_id == card_ids[2])
+                .values(is_purchased=True)
+            )
+            await session.commit()
+
+        catalog_filter = CatalogFilter('catalogsearch')
+
+        async with AsyncSession(self.engine) as session:
+            sut = SQLAlchemyCatalog(session)
+
+            # Act
+            first_page = await sut.cards(catalog_filter, limit=1)
+            second_page = await sut.cards(
+                catalog_filter, 
+                (first_page[-1].price, first_page[-1].card_id), 
+                limit=1
+            )
+            facets = await sut.facets(catalog_filter)
+
+        # Assert
+        assert [row.card_id for row in first_page + second_page] == card_ids[:2]
+        assert facets['region'] == {Region.Europe: 2}
+        assert facets['spam_block'] == {False: 2}
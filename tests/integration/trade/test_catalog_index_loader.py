@@ -0,0 +1,76 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.port.adapter.catalog_index import CatalogIndex
+from marketgram.trade.port.adapter.sqlalchemy_resources.catalog_index_loader import (
+    SQLAlchemyCatalogIndexLoader
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestCatalogIndexLoader(TradeTestCase):
+    async def test_event_committed_after_a_newer_one_is_not_skipped(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        late_card_id = await self.create_card(owner_id)
+        card_id = await self.create_card(owner_id)
+
+        index = CatalogIndex()
+        sut = SQLAlchemyCatalogIndexLoader(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            index
+        )
+        await sut.load()
+        while await sut.run_once():
+            pass
+
+        # Act
+        async with AsyncSession(self.engine) as late_session:
+            await late_session.begin()
+            await self.archive(late_session, late_card_id)
+
+            async with AsyncSession(self.engine) as session:
+                await session.begin()
+                await self.archive(session, card_id)
+                await session.commit()
+
+            await sut.run_once()
+            before_late_commit = self.indexed(index)
+            await late_session.commit()
+
+        while await sut.run_once():
+            pass
+
+        # Assert
+        assert late_card_id in before_late_commit
+        assert card_id not in before_late_commit
+        assert late_card_id not in self.indexed(index)
+        assert sut.metrics.gaps >= 1
+
+    async def archive(self, session: AsyncSession, card_id: int) -> None:
+        await session.execute(
+            update(cards_table)
+            .where(cards_table.c.card_id == card_id)
+            .values(is_archived=True)
+        )
+        await session.execute(
+            insert(outbox_table)
+            .values(
+                aggregate_type='card',
+                aggregate_id=str(card_id),
+                event_type='CardArchived',
+                payload={'card_id': card_id},
+                occurred_at=datetime.now(UTC)
+            )
+        )
+
+    def indexed(self, index: CatalogIndex) -> set[int]:
+        return {hit.card_id for hit in index.search(limit=index.size)}
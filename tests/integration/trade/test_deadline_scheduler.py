@@ -0,0 +1,87 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.p2p.deadlines import Deadlines
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.rule.agreement.service_agreement import (
+    ServiceAgreement
+)
+from marketgram.trade.port.adapter.deadline_scheduler import DeadlineSchedulerWorker
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
+    deals_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestDeadlineSchedulerWorker(TradeTestCase):
+    async def test_failing_deal_is_quarantined_and_worker_keeps_running(self) -> None:
+        # Arrange
+        deal_ids = await self.create_overdue_checks(2)
+
+        sut = DeadlineSchedulerWorker(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            ServiceAgreement(Deadlines(1, 1, 1)),
+            idle_interval=0.05
+        )
+
+        # Act
+        task = asyncio.create_task(sut.run())
+        await asyncio.sleep(0.3)
+        sut.stop()
+        await task
+
+        # Assert
+        assert sut.metrics.quarantined >= 2
+        assert sut.metrics.confirmed == 0
+        async with AsyncSession(self.engine) as session:
+            statuses = (await session.execute(
+                select(deals_table.c.status)
+                .where(deals_table.c.deal_id.in_(deal_ids))
+            )).scalars().all()
+        assert statuses == [StatusDeal.CHECK, StatusDeal.CHECK]
+
+    async def test_quarantine_expires_and_is_capped(self) -> None:
+        # Arrange
+        await self.create_overdue_checks(2)
+
+        sut = DeadlineSchedulerWorker(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            ServiceAgreement(Deadlines(1, 1, 1)),
+            quarantine_ttl=0.2,
+            max_quarantined=1
+        )
+
+        # Act
+        await sut.run_once()
+        first_pass = sut.metrics.quarantined
+        await sut.run_once()
+        while_quarantined = sut.metrics.quarantined
+        await asyncio.sleep(0.25)
+        await sut.run_once()
+
+        # Assert
+        assert first_pass == 2
+        assert while_quarantined == 3
+        assert sut.metrics.quarantined == 5
+        assert len(sut._quarantined) == 1
+
+    async def create_overdue_checks(self, count: int) -> list[int]:
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_ids = [
+            await self.create_deal(seller_id, buyer_id, StatusDeal.CHECK)
+            for _ in range(count)
+        ]
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                update(deals_table)
+                .where(deals_table.c.deal_id.in_(deal_ids))
+                .values(check_due_at=datetime.now(UTC) - timedelta(hours=1))
+            )
+            await session.commit()
+
+        return deal_ids
@@ -0,0 +1,93 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.port.adapter.event_dispatcher import OutboxMessage
+from marketgram.trade.port.adapter.outbox_relay_command import (
+    event_dispatcher
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.deal_views import (
+    SQLAlchemyDealViews,
+    SQLAlchemyDealViewsProjection
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestDealViews(TradeTestCase):
+    async def test_deal_is_listed_for_both_members(self) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_id = await self.create_deal(seller_id, buyer_id)
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await SQLAlchemyDealViewsProjection(None) \
+                .project(session, [deal_id])
+            await session.commit()
+
+            sut = SQLAlchemyDealViews(session)
+
+            # Act
+            seller_deals = await sut.for_user(seller_id, StatusDeal.CHECK)
+            buyer_deals = await sut.for_user(buyer_id)
+
+        # Assert
+        assert [(row.deal_id, row.role, row.counterparty_id) for row in seller_deals] == [
+            (deal_id, 'seller', buyer_id)
+        ]
+        assert [(row.deal_id, row.role, row.counterparty_id) for row in buyer_deals] == [
+            (deal_id, 'buyer', seller_id)
+        ]
+
+    async def test_keyset_pagination_returns_each_deal_once(self) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_ids = [
+            await self.create_deal(seller_id, buyer_id) for _ in range(5)
+        ]
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await SQLAlchemyDealViewsProjection(None) \
+                .project(session, deal_ids)
+            await session.commit()
+
+            sut = SQLAlchemyDealViews(session)
+
+            # Act
+            pages = []
+            after = None
+            while rows := await sut.for_user(buyer_id, after=after, limit=2):
+                pages.append([row.deal_id for row in rows])
+                after = (rows[-1].created_at, rows[-1].deal_id)
+
+        # Assert
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert sorted(sum(pages, [])) == sorted(deal_ids)
+
+    async def test_relay_dispatcher_projects_deal_events(self) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_id = await self.create_deal(seller_id, buyer_id)
+
+        sut = event_dispatcher(
+            async_sessionmaker(self.engine, expire_on_commit=False)
+        )
+
+        # Act
+        await sut.dispatch([
+            OutboxMessage(
+                1, 'deal', str(deal_id), 'DealReceived', {}, datetime.now(UTC)
+            )
+        ])
+
+        # Assert
+        async with AsyncSession(self.engine) as session:
+            rows = await SQLAlchemyDealViews(session).for_user(seller_id)
+        assert [(row.deal_id, row.status) for row in rows] == [
+            (deal_id, StatusDeal.CHECK)
+        ]
@@ -0,0 +1,79 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.port.adapter.sqlalchemy_resources.deals_repository import (
+    SQLAlchemyDealsRepository
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestDealsRepository(TradeTestCase):
+    async def test_not_disputed_deal_is_loaded_in_one_statement(self) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_id = await self.create_deal(seller_id, buyer_id)
+        await self.create_payout(seller_id)
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = SQLAlchemyDealsRepository(session)
+
+            # Act
+            with self.count_statements() as statements:
+                deal = await sut.not_disputed_with_id(buyer_id, deal_id)
+                deal.open_dispute(datetime.now(UTC))
+
+            # Assert
+            assert len(statements) == 1
+            assert deal.seller_id == seller_id
+            assert deal._payout is not None
+            assert deal._payout.is_blocked == True
+
+    async def test_disputed_deal_without_payout_is_loaded_in_one_statement(
+        self
+    ) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        deal_id = await self.create_deal(
+            seller_id, 
+            buyer_id, 
+            StatusDeal.DISPUTE
+        )
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = SQLAlchemyDealsRepository(session)
+
+            # Act
+            with self.count_statements() as statements:
+                deal = await sut.disputed_with_id(deal_id)
+
+            # Assert
+            assert len(statements) == 1
+            assert deal.status == StatusDeal.DISPUTE
+            assert deal._payout is None
+
+    async def test_unconfirmed_deal_is_loaded_with_its_own_seller(self) -> None:
+        # Arrange
+        buyer_id = await self.create_member()
+        other_seller_id = await self.create_member()
+        seller_id = await self.create_member()
+        await self.create_deal(other_seller_id, buyer_id)
+        deal_id = await self.create_deal(seller_id, buyer_id)
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = SQLAlchemyDealsRepository(session)
+
+            # Act
+            deal = await sut.unconfirmed_with_id(buyer_id, deal_id)
+            foreign = await sut.unconfirmed_with_id(other_seller_id, deal_id)
+
+            # Assert
+            assert deal._deal_id == deal_id
+            assert deal._seller_id == seller_id
+            assert foreign is None
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.domain.model.rule.agreement.types import AccountType, Operation
+from marketgram.trade.port.adapter.sqlalchemy_resources.balances_rebuild import (
+    SQLAlchemyBalancesRebuild
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.entries_archive import (
+    SQLAlchemyEntriesArchive
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.balance_checkpoints_table import (
+    balance_checkpoints_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestEntriesArchive(TradeTestCase):
+    async def test_settled_entries_are_rolled_into_checkpoint(self) -> None:
+        # Arrange
+        user_id = await self.create_member()
+        cutoff = datetime.now() - timedelta(days=90)
+        await self.post_entries(user_id, [
+            (100, cutoff - timedelta(days=10), EntryStatus.ACCEPTED),
+            (-30, cutoff - timedelta(days=5), EntryStatus.ACCEPTED),
+            (50, cutoff - timedelta(days=5), EntryStatus.CANCELLED),
+            (70, cutoff - timedelta(days=1), EntryStatus.FREEZ),
+            (20, cutoff + timedelta(days=1), EntryStatus.ACCEPTED),
+        ])
+
+        # Act
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            result = await SQLAlchemyEntriesArchive(session).archive(cutoff)
+            await session.commit()
+
+        # Assert
+        assert result.archived == 3
+        assert result.checkpoints == 1
+        async with AsyncSession(self.engine) as session:
+            checkpoint = await session.scalar(
+                select(balance_checkpoints_table.c.amount)
+                .where(balance_checkpoints_table.c.user_id == user_id)
+            )
+            mismatches = await SQLAlchemyBalancesRebuild(session).verify()
+
+        assert checkpoint == 70
+        assert [m for m in mismatches if m.user_id == user_id] == []
+
+    async def post_entries(
+        self,
+        user_id: UUID,
+        entries: list[tuple[int, datetime, EntryStatus]]
+    ) -> None:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(entries_table),
+                [
+                    {
+                        'user_id': user_id,
+                        'amount': amount,
+                        'posted_in': posted_in,
+                        'account_type': AccountType.USER,
+                        'operation': Operation.PAYMENT,
+                        'entry_status': entry_status,
+                        'is_archived': False
+                    }
+                    for amount, posted_in, entry_status in entries
+                ]
+            )
+            await session.commit()
@@ -0,0 +1,62 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.application.commands.member_created_event import (
+    MemberCreatedEvent,
+    MemberCreatedEventHandler
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.members_repository import (
+    SQLAlchemyMembersRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.processed_events import (
+    SQLAlchemyProcessedEvents
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestMemberCreatedEventHandler(TradeTestCase):
+    async def test_replayed_batch_is_provisioned_once(self) -> None:
+        # Arrange
+        existing_member_id = await self.create_member()
+        events = [
+            MemberCreatedEvent(uuid4(), uuid4(), datetime.now(UTC))
+            for _ in range(3)
+        ]
+        events.append(
+            MemberCreatedEvent(existing_member_id, uuid4(), datetime.now(UTC))
+        )
+
+        # Act
+        first = await self.handle_many(events)
+        replayed = await self.handle_many([*events, events[0]])
+
+        # Assert
+        assert first == 3
+        assert replayed == 0
+        async with AsyncSession(self.engine) as session:
+            members = await session.scalar(
+                select(func.count())
+                .select_from(members_table)
+                .where(members_table.c.user_id.in_(
+                    [event.member_id for event in events]
+                ))
+            )
+        assert members == 4
+
+    async def handle_many(self, events: list[MemberCreatedEvent]) -> int:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            sut = MemberCreatedEventHandler(
+                SQLAlchemyMembersRepository(session),
+                SQLAlchemyProcessedEvents(session)
+            )
+            inserted = await sut.handle_many(events)
+            await session.commit()
+
+        return inserted
@@ -0,0 +1,135 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from marketgram.trade.domain.model.events import CardArchived
+from marketgram.trade.port.adapter.event_dispatcher import (
+    EventDispatcher,
+    OutboxMessage
+)
+from marketgram.trade.port.adapter.outbox_relay import OutboxRelay
+from marketgram.trade.port.adapter.sqlalchemy_resources.cards_repository import (
+    SQLAlchemyCardsRepository
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.outbox_table import (
+    outbox_table
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestOutbox(TradeTestCase):
+    async def test_events_are_committed_with_aggregate(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        card_id = await self.create_card(owner_id)
+
+        # Act
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await self.archive(session, owner_id, card_id)
+            await session.commit()
+
+        # Assert
+        events = await self.outbox(card_id)
+        assert [event.event_type for event in events] == ['CardArchived']
+        assert events[0].payload['card_id'] == card_id
+        assert events[0].published_at is None
+        assert await self.is_archived(card_id)
+
+    async def test_flushed_events_disappear_on_rollback(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        card_id = await self.create_card(owner_id)
+
+        # Act
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await self.archive(session, owner_id, card_id)
+            await session.flush()
+            await session.rollback()
+
+        # Assert
+        assert await self.outbox(card_id) == []
+        assert not await self.is_archived(card_id)
+
+    async def test_event_is_redelivered_after_subscriber_failure(self) -> None:
+        # Arrange
+        owner_id = await self.create_member()
+        card_id = await self.create_card(owner_id)
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await self.archive(session, owner_id, card_id)
+            await session.commit()
+
+        deliveries = []
+
+        async def subscriber(message: OutboxMessage) -> None:
+            if message.aggregate_id != str(card_id):
+                return
+
+            deliveries.append(message.event_id)
+            if len(deliveries) == 1:
+                raise ConnectionError('Consumer is unavailable')
+
+        dispatcher = EventDispatcher()
+        dispatcher.subscribe(CardArchived, subscriber)
+        sut = OutboxRelay(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            dispatcher
+        )
+
+        # Act
+        with pytest.raises(ConnectionError):
+            while await sut.run_once():
+                pass
+        after_failure = await self.outbox(card_id)
+
+        while await sut.run_once():
+            pass
+
+        # Assert
+        assert after_failure[0].published_at is None
+        assert sut.metrics.failed_batches == 1
+        assert deliveries == [after_failure[0].event_id] * 2
+        [event] = await self.outbox(card_id)
+        assert event.published_at is not None
+
+    async def archive(
+        self,
+        session: AsyncSession,
+        owner_id: UUID,
+        card_id: int
+    ) -> None:
+        card = await SQLAlchemyCardsRepository(session) \
+            .with_owner_and_card_id(owner_id, card_id)
+        card.archive()
+
+    async def outbox(self, card_id: int) -> list[Row]:
+        async with AsyncSession(self.engine) as session:
+            result = await session.execute(
+                select(
+                    outbox_table.c.event_id,
+                    outbox_table.c.event_type,
+                    outbox_table.c.payload,
+                    outbox_table.c.published_at
+                )
+                .where(
+                    outbox_table.c.aggregate_type == 'card',
+                    outbox_table.c.aggregate_id == str(card_id)
+                )
+                .order_by(outbox_table.c.event_id)
+            )
+
+            return result.all()
+
+    async def is_archived(self, card_id: int) -> bool:
+        async with AsyncSession(self.engine) as session:
+            return await session.scalar(
+                select(cards_table.c.is_archived)
+                .where(cards_table.c.card_id == card_id)
+            )
@@ -0,0 +1,152 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.rule.agreement.entry_status import EntryStatus
+from marketgram.trade.domain.model.rule.agreement.types import AccountType, Operation
+from marketgram.trade.port.adapter.errors import StatementPeriodError
+from marketgram.trade.port.adapter.sqlalchemy_resources.entries_archive import (
+    SQLAlchemyEntriesArchive
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.entries_table import (
+    entries_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.statements import (
+    SQLAlchemyStatements
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestStatements(TradeTestCase):
+    async def test_lines_are_streamed_in_order_across_pages(self) -> None:
+        # Arrange
+        user_id = await self.create_member()
+        since = datetime.now() - timedelta(days=120)
+        posted_in = [since + timedelta(days=day) for day in range(7)]
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(entries_table),
+                [
+                    {
+                        'user_id': user_id,
+                        'amount': 10,
+                        'posted_in': posted,
+                        'account_type': AccountType.USER,
+                        'operation': Operation.DEPOSIT,
+                        'entry_status': EntryStatus.ACCEPTED,
+                        'is_archived': False
+                    }
+                    for posted in [since - timedelta(days=1), *posted_in]
+                ]
+            )
+            await SQLAlchemyEntriesArchive(session) \
+                .archive(since + timedelta(days=3))
+            await session.commit()
+
+        async with AsyncSession(self.engine) as session:
+            sut = SQLAlchemyStatements(session)
+
+            # Act
+            opening = await sut.opening_balance(user_id, AccountType.USER, since)
+            lines = [
+                row async for row in sut.lines(
+                    user_id, 
+                    AccountType.USER, 
+                    since, 
+                    since + timedelta(days=30), 
+                    page_size=3
+                )
+            ]
+
+        # Assert
+        assert opening == 10
+        assert [line.posted_in for line in lines] == posted_in
+
+    async def test_timezone_aware_period_is_compared_in_utc(self) -> None:
+        # Arrange
+        user_id = await self.create_member()
+        posted_at = datetime.now() - timedelta(days=10)
+        posted_in = [posted_at + timedelta(days=day) for day in range(3)]
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(entries_table),
+                [
+                    {
+                        'user_id': user_id,
+                        'amount': 10,
+                        'posted_in': posted,
+                        'account_type': AccountType.USER,
+                        'operation': Operation.DEPOSIT,
+                        'entry_status': EntryStatus.ACCEPTED,
+                        'is_archived': False
+                    }
+                    for posted in posted_in
+                ]
+            )
+            await session.commit()
+
+        moscow = timezone(timedelta(hours=3))
+        since = (posted_in[1] + timedelta(hours=3)).replace(tzinfo=moscow)
+
+        async with AsyncSession(self.engine) as session:
+            sut = SQLAlchemyStatements(session)
+
+            # Act
+            opening = await sut.opening_balance(user_id, AccountType.USER, since)
+            lines = [
+                row async for row in sut.lines(
+                    user_id, 
+                    AccountType.USER, 
+                    since, 
+                    since + timedelta(days=30)
+                )
+            ]
+
+        # Assert
+        assert opening == 10
+        assert [line.posted_in for line in lines] == posted_in[1:]
+
+    async def test_period_of_detached_partition_is_rejected(self) -> None:
+        # Arrange
+        user_id = await self.create_member()
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            archive = SQLAlchemyEntriesArchive(session)
+            await archive.create_partitions(date(2001, 1, 1), 0)
+            await archive.detach_archived(datetime(2001, 2, 1))
+            await session.commit()
+
+        try:
+            async with AsyncSession(self.engine) as session:
+                sut = SQLAlchemyStatements(session)
+
+                # Act
+                available_since = await sut.available_since()
+                with pytest.raises(StatementPeriodError):
+                    await sut.opening_balance(
+                        user_id, AccountType.USER, datetime(2001, 1, 15)
+                    )
+                with pytest.raises(StatementPeriodError):
+                    await anext(sut.lines(
+                        user_id, 
+                        AccountType.USER, 
+                        datetime(2001, 1, 15), 
+                        datetime(2001, 3, 1)
+                    ))
+                opening = await sut.opening_balance(
+                    user_id, AccountType.USER, available_since
+                )
+        finally:
+            async with AsyncSession(self.engine) as session:
+                await session.begin()
+                await session.execute(text('DROP TABLE entries_2001_01'))
+                await session.commit()
+
+        # Assert
+        assert available_since == datetime(2001, 2, 1)
+        assert opening == 0
@@ -0,0 +1,48 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.port.adapter.sqlalchemy_resources.stock_repository import (
+    SQLAlchemyStockRepository
+)
+from tests.integration.trade.trade_test_case import TradeTestCase
+
+
+class TestStockRepository(TradeTestCase):
+    async def test_concurrent_allocations_skip_locked_items(self) -> None:
+        # Arrange
+        seller_id = await self.create_member()
+        buyer_id = await self.create_member()
+        card_id = await self.create_card(seller_id)
+        first_deal, second_deal, third_deal = [
+            await self.create_deal(seller_id, buyer_id) for _ in range(3)
+        ]
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await SQLAlchemyStockRepository(session) \
+                .add_many(card_id, ['item-1', 'item-2', 'item-3'])
+            await session.commit()
+
+        # Act
+        async with AsyncSession(self.engine) as first_session:
+            await first_session.begin()
+            first = await SQLAlchemyStockRepository(first_session) \
+                .allocate(card_id, first_deal, 2)
+
+            async with AsyncSession(self.engine) as second_session:
+                await second_session.begin()
+                second = await SQLAlchemyStockRepository(second_session) \
+                    .allocate(card_id, second_deal, 2)
+                await second_session.commit()
+
+            await first_session.commit()
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            third = await SQLAlchemyStockRepository(session) \
+                .allocate(card_id, third_deal, 1)
+            await session.commit()
+
+        # Assert
+        assert len(first) == 2
+        assert len(second) == 1
+        assert set(first).isdisjoint(second)
+        assert third == []
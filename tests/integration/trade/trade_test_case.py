@@ -0,0 +1,149 @@
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Iterator
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.p2p.type_deal import TypeDeal
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.cards_table import (
+    cards_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.deals_table import (
+    deals_members_table,
+    deals_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.members_table import (
+    members_table
+)
+from marketgram.trade.port.adapter.sqlalchemy_resources.mapping.table.operations_table import (
+    operations_table
+)
+from tests.integration.conftest import IntegrationTest
+
+
+class TradeTestCase(IntegrationTest):
+    async def create_member(self) -> UUID:
+        user_id = uuid4()
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(members_table)
+                .values(user_id=user_id, is_blocked=False)
+            )
+            await session.commit()
+
+        return user_id
+
+    async def create_card(self, owner_id: UUID) -> int:
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            card_id = await session.scalar(
+                insert(cards_table)
+                .values(
+                    owner_id=owner_id,
+                    price=200,
+                    title='Test card',
+                    text_description='Test description',
+                    account_format='autoreg',
+                    region='random',
+                    spam_block=False,
+                    format='login_code',
+                    method='provides_seller',
+                    min_price=100,
+                    min_discount=0.1,
+                    created_at=datetime.now(),
+                    is_archived=False,
+                    is_purchased=False,
+                    version_id=1
+                )
+                .returning(cards_table.c.card_id)
+            )
+            await session.commit()
+
+        return card_id
+
+    async def create_deal(
+        self,
+        seller_id: UUID,
+        buyer_id: UUID,
+        status: StatusDeal = StatusDeal.CHECK
+    ) -> int:
+        card_id = await self.create_card(seller_id)
+        created_at = datetime.now(UTC) - timedelta(hours=2)
+
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            deal_id = await session.scalar(
+                insert(deals_table)
+                .values(
+                    card_id=card_id,
+                    qty_purchased=1,
+                    type=TypeDeal.PROVIDING_CODE,
+                    card_created_at=datetime.now(),
+                    price=200,
+                    created_at=created_at,
+                    shipped_at=created_at,
+                    received_at=created_at,
+                    shipping_hours=1,
+                    receipt_hours=1,
+                    check_hours=24,
+                    status=status,
+                    is_disputed=False
+                )
+                .returning(deals_table.c.deal_id)
+            )
+            await session.execute(
+                insert(deals_members_table)
+                .values(deal_id=deal_id, seller_id=seller_id, buyer_id=buyer_id)
+            )
+            await session.commit()
+
+        return deal_id
+
+    async def create_payout(self, seller_id: UUID) -> UUID:
+        payout_id = uuid4()
+        async with AsyncSession(self.engine) as session:
+            await session.begin()
+            await session.execute(
+                insert(operations_table)
+                .values(
+                    operation_id=payout_id,
+                    user_id=seller_id,
+                    amount=150,
+                    created_at=datetime.now() - timedelta(hours=1),
+                    is_processed=False,
+                    is_blocked=False,
+                    count_block=0,
+                    paycard_synonym='test',
+                    type='payout'
+                )
+            )
+            await session.commit()
+
+        return payout_id
+
+    @contextmanager
+    def count_statements(self) -> Iterator[list[str]]:
+        statements = []
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ) -> None:
+            statements.append(statement)
+
+        event.listen(
+            self.engine.sync_engine, 
+            'before_cursor_execute', 
+            before_cursor_execute
+        )
+        try:
+            yield statements
+        finally:
+            event.remove(
+                self.engine.sync_engine, 
+                'before_cursor_execute', 
+                before_cursor_execute
+            )
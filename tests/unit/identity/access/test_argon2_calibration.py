@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from marketgram.identity.access.port.adapter.argon2_calibration_command import (
+    MIN_MEMORY_COST,
+    Argon2Parameters,
+    calibrate,
+    update_env_file
+)
+
+
+class TestArgon2Calibration:
+    def test_picks_largest_time_cost_within_target(self) -> None:
+        # Arrange
+        def measure(parameters: Argon2Parameters) -> float:
+            return parameters.time_cost * parameters.memory_cost / 1_000_000
+
+        # Act
+        parameters = calibrate(measure, 0.2, 64 * 1024 * 8, 8)
+
+        # Assert
+        assert parameters == Argon2Parameters(3, 64 * 1024, 1)
+
+    def test_shrinks_memory_when_one_pass_is_too_slow(self) -> None:
+        # Arrange
+        def measure(parameters: Argon2Parameters) -> float:
+            return parameters.time_cost * parameters.memory_cost / 100_000
+
+        # Act
+        parameters = calibrate(measure, 0.2, 64 * 1024, 1)
+
+        # Assert
+        assert parameters == Argon2Parameters(1, 16 * 1024, 1)
+
+    def test_never_goes_below_minimum_memory(self) -> None:
+        # Arrange
+        def measure(parameters: Argon2Parameters) -> float:
+            return 10.0
+
+        # Act
+        parameters = calibrate(measure, 0.2, 1024, 4)
+
+        # Assert
+        assert parameters == Argon2Parameters(1, MIN_MEMORY_COST, 1)
+
+    def test_env_file_keeps_unrelated_settings(self, tmp_path: Path) -> None:
+        # Arrange
+        env_file = tmp_path / '.env'
+        env_file.write_text('JWT_SECRET=secret\nARGON2_TIME_COST=2\n')
+
+        # Act
+        update_env_file(
+            env_file, 
+            Argon2Parameters(4, 32768, 1).to_env()
+        )
+
+        # Assert
+        assert env_file.read_text().splitlines() == [
+            'JWT_SECRET=secret',
+            'ARGON2_TIME_COST=4',
+            'ARGON2_MEMORY_COST=32768',
+            'ARGON2_PARALLELISM=1'
+        ]
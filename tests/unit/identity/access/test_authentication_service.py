@@ -10,7 +10,7 @@ from marketgram.identity.access.port.adapter.argon2_password_hasher import (
 
 
 class TestAuthenticationService:
-    def test_successful_authenticate(self) -> None:
+    async def test_successful_authenticate(self) -> None:
         # Arrange
         email = 'test@mail.ru'
         password = 'unprotected'
@@ -19,12 +19,28 @@ class TestAuthenticationService:
         user = User(
             uuid4(),
             email,
-            password_hasher.hash(password)
-
+            await password_hasher.hash(password)
         )
         user.activate()
 
         sut = AuthenticationService(password_hasher)
         
         # Act
-        sut.authenticate(user, password)
\ No newline at end of file
+        await sut.authenticate(user, password)
+
+    async def test_outdated_hash_needs_rehash_without_changing_password(self) -> None:
+        # Arrange
+        password = 'unprotected'
+        outdated_hash = await Argon2PasswordHasher(time_cost=1).hash(password)
+
+        user = User(uuid4(), 'test@mail.ru', outdated_hash)
+        user.activate()
+
+        sut = AuthenticationService(Argon2PasswordHasher(time_cost=3))
+
+        # Act
+        await sut.authenticate(user, password)
+
+        # Assert
+        assert sut.needs_rehash(user)
+        assert user.password == outdated_hash
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from marketgram.identity.access.port.adapter.background_password_rehasher import (
+    BackgroundPasswordRehasher
+)
+from marketgram.identity.access.port.adapter.errors import (
+    PasswordHasherOverloadError
+)
+
+
+class OverloadedPasswordHasher:
+    def __init__(self) -> None:
+        self.passwords = []
+
+    async def hash(self, password: str) -> str:
+        self.passwords.append(password)
+        raise PasswordHasherOverloadError()
+
+
+class TestBackgroundPasswordRehasher:
+    def test_queue_is_capped_and_duplicates_are_coalesced(self) -> None:
+        # Arrange
+        user_id = uuid4()
+        sut = BackgroundPasswordRehasher(
+            None,
+            OverloadedPasswordHasher(),
+            max_queued=1
+        )
+
+        # Act
+        sut.schedule(user_id, 'hash', 'first')
+        sut.schedule(user_id, 'hash', 'second')
+        sut.schedule(uuid4(), 'hash', 'third')
+
+        # Assert
+        assert sut.metrics.dropped == 1
+        assert sut._queue.qsize() == 1
+        assert sut._queue.get_nowait().plain_password == 'first'
+
+    async def test_plaintext_is_dropped_once_the_task_is_handled(self) -> None:
+        # Arrange
+        password_hasher = OverloadedPasswordHasher()
+        sut = BackgroundPasswordRehasher(None, password_hasher)
+        sut.schedule(uuid4(), 'hash', 'unprotected')
+        [task] = sut._queue._queue
+
+        # Act
+        sut.start()
+        await sut._queue.join()
+        await sut.stop()
+
+        # Assert
+        assert password_hasher.passwords == ['unprotected']
+        assert task.plain_password is None
+        assert sut._pending == set()
+
+    async def test_stop_discards_queued_plaintext(self) -> None:
+        # Arrange
+        sut = BackgroundPasswordRehasher(None, OverloadedPasswordHasher())
+        sut.schedule(uuid4(), 'hash', 'first')
+        sut.schedule(uuid4(), 'hash', 'second')
+        tasks = list(sut._queue._queue)
+
+        # Act
+        await sut.stop()
+
+        # Assert
+        assert sut._queue.empty()
+        assert sut.metrics.dropped == 2
+        assert [task.plain_password for task in tasks] == [None, None]
+        assert sut._pending == set()
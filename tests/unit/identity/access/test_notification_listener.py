@@ -0,0 +1,56 @@
+import asyncio
+
+from marketgram.identity.access.port.adapter.notification_listener import (
+    NotificationListener
+)
+
+
+class TestNotificationListener:
+    def test_failing_callback_skips_only_its_notification(self) -> None:
+        # Arrange
+        received = []
+        sut = NotificationListener(
+            'postgresql://',
+            'card_views',
+            lambda payload: received.append(int(payload)),
+            lambda: None
+        )
+
+        # Act
+        for payload in ('1', 'not a number', '2'):
+            sut._notify(payload)
+
+        # Assert
+        assert received == [1, 2]
+
+    async def test_listener_reconnects_after_unexpected_error(self) -> None:
+        # Arrange
+        resets = []
+        connected = asyncio.Event()
+        sut = NotificationListener(
+            'postgresql://',
+            'web_sessions',
+            lambda payload: None,
+            lambda: resets.append(True),
+            reconnect_interval=0.01
+        )
+        attempts = []
+
+        async def listen() -> None:
+            attempts.append(True)
+            if len(attempts) == 1:
+                raise ValueError('Malformed payload')
+
+            connected.set()
+            await asyncio.Event().wait()
+
+        sut._listen = listen
+
+        # Act
+        sut.start()
+        await asyncio.wait_for(connected.wait(), 1)
+        await sut.stop()
+
+        # Assert
+        assert len(attempts) == 2
+        assert resets == [True]
@@ -20,7 +20,7 @@ def password_hasher() -> Argon2PasswordHasher:
 
 
 class TestUser:
-    def test_create_new_user(
+    async def test_create_new_user(
         self, 
         password_hasher: Argon2PasswordHasher
     ) -> None:
@@ -31,13 +31,13 @@ class TestUser:
         sut = UserFactory(password_hasher)
 
         # Act
-        new_user = sut.create(email, password)
+        new_user = await sut.create(email, password)
 
         # Assert
-        assert password_hasher.verify(new_user.password, password)
+        assert await password_hasher.verify(new_user.password, password)
         assert new_user.email.islower()
 
-    def test_create_new_user_with_same_password_and_email(
+    async def test_create_new_user_with_same_password_and_email(
         self, 
         password_hasher: Argon2PasswordHasher
     )-> None:
@@ -49,9 +49,9 @@ class TestUser:
 
         # Act
         with pytest.raises(PersonalDataError):
-            sut.create(email, password)
+            await sut.create(email, password)
 
-    def test_change_user_password(
+    async def test_change_user_password(
         self, 
         password_hasher: Argon2PasswordHasher
     )-> None:
@@ -61,17 +61,17 @@ class TestUser:
         sut = User(
             uuid4(), 
             'test@mail.ru', 
-            password_hasher.hash('old_protected')
+            await password_hasher.hash('old_protected')
         )
         sut.activate()
 
         # Act
-        sut.change_password(new_password, password_hasher)
+        await sut.change_password(new_password, password_hasher)
 
         # Assert
-        assert password_hasher.verify(sut.password, new_password)
+        assert await password_hasher.verify(sut.password, new_password)
 
-    def test_inactive_user_password_change(
+    async def test_inactive_user_password_change(
         self, 
         password_hasher: Argon2PasswordHasher
     )-> None:
@@ -81,17 +81,17 @@ class TestUser:
         sut = User(
             uuid4(), 
             'test@mail.ru', 
-            password_hasher.hash('old_protected')
+            await password_hasher.hash('old_protected')
         )
 
         # Act
         with pytest.raises(PersonalDataError):
-            sut.change_password(new_password, password_hasher)
+            await sut.change_password(new_password, password_hasher)
 
         # Assert
-        assert not password_hasher.verify(sut.password, new_password)
+        assert not await password_hasher.verify(sut.password, new_password)
  
-    def test_changing_password_when_email_matches(
+    async def test_changing_password_when_email_matches(
         self, 
         password_hasher: Argon2PasswordHasher
     )-> None:
@@ -101,15 +101,15 @@ class TestUser:
         sut = User(
             uuid4(), 
             'test@mail.ru', 
-            password_hasher.hash('old_protected')
+            await password_hasher.hash('old_protected')
         )
         
         # Act
         with pytest.raises(PersonalDataError):
-            sut.change_password(new_password, password_hasher)
+            await sut.change_password(new_password, password_hasher)
 
         # Act
-        assert not password_hasher.verify(sut.password, new_password)
+        assert not await password_hasher.verify(sut.password, new_password)
 
     def test_user_activation(self) -> None:
         # Arrange
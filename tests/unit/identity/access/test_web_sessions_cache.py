@@ -0,0 +1,130 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from marketgram.identity.access.domain.model.web_session import WebSession
+from marketgram.identity.access.port.adapter.web_sessions_cache import (
+    WebSessionsCache,
+    device_payload,
+    user_payload
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWebSessionsCache:
+    def test_cached_session_is_a_hit(self) -> None:
+        # Arrange
+        current_time = datetime.now(UTC)
+        web_session = self.make_web_session(current_time)
+        sut = WebSessionsCache()
+        sut.put(web_session)
+
+        # Act
+        cached = sut.get(web_session.session_id, current_time)
+
+        # Assert
+        assert cached == web_session
+        assert sut.hits == 1
+        assert sut.misses == 0
+
+    def test_entry_expires_after_ttl(self) -> None:
+        # Arrange
+        clock = FakeClock()
+        current_time = datetime.now(UTC)
+        web_session = self.make_web_session(current_time)
+        sut = WebSessionsCache(ttl=30, clock=clock)
+        sut.put(web_session)
+
+        # Act
+        clock.now = 30
+        cached = sut.get(web_session.session_id, current_time)
+
+        # Assert
+        assert cached is None
+        assert sut.misses == 1
+        assert len(sut) == 0
+
+    def test_expired_web_session_is_not_returned(self) -> None:
+        # Arrange
+        current_time = datetime.now(UTC)
+        web_session = self.make_web_session(current_time)
+        sut = WebSessionsCache()
+        sut.put(web_session)
+
+        # Act
+        cached = sut.get(web_session.session_id, web_session.expires_in)
+
+        # Assert
+        assert cached is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        # Arrange
+        current_time = datetime.now(UTC)
+        first, second, third = [
+            self.make_web_session(current_time) for _ in range(3)
+        ]
+        sut = WebSessionsCache(max_size=2)
+        sut.put(first)
+        sut.put(second)
+        sut.get(first.session_id, current_time)
+
+        # Act
+        sut.put(third)
+
+        # Assert
+        assert sut.get(second.session_id, current_time) is None
+        assert sut.get(first.session_id, current_time) == first
+        assert sut.get(third.session_id, current_time) == third
+
+    def test_notification_invalidates_device_sessions(self) -> None:
+        # Arrange
+        user_id = uuid4()
+        current_time = datetime.now(UTC)
+        phone = self.make_web_session(current_time, user_id, 'Nokia 3210')
+        laptop = self.make_web_session(current_time, user_id, 'ThinkPad')
+        sut = WebSessionsCache()
+        sut.put(phone)
+        sut.put(laptop)
+
+        # Act
+        sut.apply_notification(device_payload(user_id, 'Nokia 3210'))
+
+        # Assert
+        assert sut.get(phone.session_id, current_time) is None
+        assert sut.get(laptop.session_id, current_time) == laptop
+
+    def test_notification_invalidates_all_user_sessions(self) -> None:
+        # Arrange
+        user_id = uuid4()
+        current_time = datetime.now(UTC)
+        phone = self.make_web_session(current_time, user_id, 'Nokia 3210')
+        laptop = self.make_web_session(current_time, user_id, 'ThinkPad')
+        sut = WebSessionsCache()
+        sut.put(phone)
+        sut.put(laptop)
+
+        # Act
+        sut.apply_notification(user_payload(user_id))
+
+        # Assert
+        assert len(sut) == 0
+
+    def make_web_session(
+        self, 
+        current_time: datetime, 
+        user_id=None, 
+        device: str = 'Nokia 3210'
+    ) -> WebSession:
+        return WebSession(
+            user_id or uuid4(),
+            uuid4(),
+            current_time,
+            current_time + timedelta(days=15),
+            device
+        )
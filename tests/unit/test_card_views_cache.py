@@ -0,0 +1,71 @@
+import asyncio
+
+from marketgram.trade.port.adapter.card_views_cache import CardViewsCache
+
+
+class TestCardViewsCache:
+    async def test_concurrent_misses_are_loaded_once(self) -> None:
+        # Arrange
+        loads = []
+
+        async def loader(card_id: int) -> dict:
+            loads.append(card_id)
+            await asyncio.sleep(0.01)
+            return {'card_id': card_id}
+
+        sut = CardViewsCache()
+
+        # Act
+        views = await asyncio.gather(*[sut.get(1, loader) for _ in range(10)])
+        cached = await sut.get(1, loader)
+
+        # Assert
+        assert loads == [1]
+        assert views == [{'card_id': 1}] * 10
+        assert cached == {'card_id': 1}
+        assert (sut.hits, sut.misses, sut.coalesced) == (1, 1, 9)
+
+    async def test_invalidation_during_load_discards_stale_view(self) -> None:
+        # Arrange
+        price = '100'
+        loaded = asyncio.Event()
+        release = asyncio.Event()
+
+        async def loader(card_id: int) -> dict:
+            view = {'price': price}
+            loaded.set()
+            await release.wait()
+            return view
+
+        sut = CardViewsCache()
+        pending = asyncio.create_task(sut.get(1, loader))
+        await loaded.wait()
+
+        # Act
+        price = '80'
+        sut.apply_notification('1')
+        release.set()
+        stale = await pending
+        fresh = await sut.get(1, loader)
+
+        # Assert
+        assert stale == {'price': '100'}
+        assert fresh == {'price': '80'}
+        assert sut.misses == 2
+
+    async def test_expired_view_is_reloaded(self) -> None:
+        # Arrange
+        now = [0.0]
+
+        async def loader(card_id: int) -> dict:
+            return {'loaded_at': now[0]}
+
+        sut = CardViewsCache(ttl=10, clock=lambda: now[0])
+        await sut.get(1, loader)
+
+        # Act
+        now[0] = 11.0
+        view = await sut.get(1, loader)
+
+        # Assert
+        assert view == {'loaded_at': 11.0}
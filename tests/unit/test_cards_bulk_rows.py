@@ -0,0 +1,80 @@
+from typing import AsyncIterator
+
+from marketgram.trade.port.adapter.web_fastapi.cards_bulk_create_request import (
+    csv_rows,
+    jsonl_rows
+)
+from marketgram.trade.port.adapter.web_fastapi.stock_upload_request import (
+    payload_lines,
+    payload_text
+)
+
+CSV_PAYLOAD = (
+    'title,text_description,price\r\n'
+    'Аккаунт 1,"Fresh account\nwith 2FA, aged",100\n'
+    '\n'
+    'Card 2 ,"Says ""hi""  ",  200  \n'
+    'Card 3,Last row without newline,300'
+).encode()
+
+
+class StreamedRequest:
+    def __init__(self, payload: bytes, chunk_size: int) -> None:
+        self._payload = payload
+        self._chunk_size = chunk_size
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._payload), self._chunk_size):
+            yield self._payload[start:start + self._chunk_size]
+
+
+class TestCsvRows:
+    async def test_quoted_newlines_and_spaces_survive_any_chunking(self) -> None:
+        # Arrange
+        expected = [
+            {
+                'title': 'Аккаунт 1',
+                'text_description': 'Fresh account\nwith 2FA, aged',
+                'price': '100'
+            },
+            {
+                'title': 'Card 2 ',
+                'text_description': 'Says "hi"  ',
+                'price': '  200  '
+            },
+            {
+                'title': 'Card 3',
+                'text_description': 'Last row without newline',
+                'price': '300'
+            }
+        ]
+
+        for size in (1, 2, 5, 64, len(CSV_PAYLOAD)):
+            # Act
+            request = StreamedRequest(CSV_PAYLOAD, size)
+            rows = [row async for row in csv_rows(payload_text(request))]
+
+            # Assert
+            assert rows == expected
+
+
+class TestJsonlRows:
+    async def test_invalid_line_is_reported_as_none(self) -> None:
+        # Arrange
+        request = StreamedRequest(
+            b'{"title": "Card 1", "text_description": "a\\nb"}\n'
+            b'not json\r\n'
+            b'\n'
+            b'{"title": "Card 2 "}',
+            7
+        )
+
+        # Act
+        rows = [row async for row in jsonl_rows(payload_lines(request))]
+
+        # Assert
+        assert rows == [
+            {'title': 'Card 1', 'text_description': 'a\nb'},
+            None,
+            {'title': 'Card 2 '}
+        ]
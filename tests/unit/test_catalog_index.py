@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from marketgram.trade.domain.model.trade_item.description import (
+    AccountFormat,
+    Region
+)
+from marketgram.trade.port.adapter.catalog_index import (
+    CatalogDocument,
+    CatalogIndex
+)
+
+
+class TestCatalogIndex:
+    def test_prefix_query_ranks_denser_matches_first(self) -> None:
+        # Arrange
+        sut = CatalogIndex()
+        sut.upsert(self.document(1, 'Telegram account', 'fresh'))
+        sut.upsert(self.document(2, 'Telegram premium', 'telegram stars'))
+        sut.upsert(self.document(3, 'Business bot', 'channel'))
+
+        # Act
+        hits = sut.search('teleg')
+
+        # Assert
+        assert [hit.card_id for hit in hits] == [2, 1]
+
+    def test_all_query_tokens_must_match(self) -> None:
+        # Arrange
+        sut = CatalogIndex()
+        sut.upsert(self.document(1, 'Telegram account', 'fresh'))
+        sut.upsert(self.document(2, 'Telegram premium', 'aged'))
+
+        # Act
+        hits = sut.search('telegram prem')
+
+        # Assert
+        assert [hit.card_id for hit in hits] == [2]
+
+    def test_facet_filters_and_counts(self) -> None:
+        # Arrange
+        sut = CatalogIndex()
+        sut.upsert(self.document(1, 'Telegram', 'a', Region.Europe, price='30'))
+        sut.upsert(self.document(2, 'Telegram', 'b', Region.Asia, price='10'))
+        sut.upsert(self.document(3, 'Telegram', 'c', Region.Asia, price='20'))
+
+        # Act
+        hits = sut.search(region=Region.Asia)
+        facets = sut.facets('telegram')
+
+        # Assert
+        assert [hit.card_id for hit in hits] == [2, 3]
+        assert facets['region'] == {Region.Europe: 1, Region.Asia: 2}
+
+    def test_removed_card_is_not_found(self) -> None:
+        # Arrange
+        sut = CatalogIndex()
+        sut.upsert(self.document(1, 'Telegram', 'a'))
+        sut.upsert(self.document(2, 'Telegram', 'b'))
+
+        # Act
+        sut.remove(1)
+
+        # Assert
+        assert [hit.card_id for hit in sut.search('telegram')] == [2]
+        assert sut.facets()['region'] == {Region.Europe: 1}
+        assert sut.size == 1
+
+    def test_terms_of_removed_card_stop_matching_prefixes(self) -> None:
+        # Arrange
+        sut = CatalogIndex()
+        sut.upsert(self.document(1, 'Zebra telegram', 'alpha'))
+        sut.upsert(self.document(2, 'Telegraph', 'beta'))
+        sut.upsert(self.document(3, 'Tele', 'gamma'))
+
+        # Act
+        sut.remove(2)
+        sut.upsert(self.document(4, 'Telephone', 'delta'))
+
+        # Assert
+        assert sorted(hit.card_id for hit in sut.search('tele')) == [1, 3, 4]
+        assert sut.search('telegraph') == []
+        assert [hit.card_id for hit in sut.search('zeb')] == [1]
+
+    def test_memory_budget_marks_index_incomplete(self) -> None:
+        # Arrange
+        sut = CatalogIndex(memory_budget=1000)
+
+        # Act
+        accepted = [
+            sut.upsert(self.document(card_id, 'Telegram', 'account'))
+            for card_id in range(10)
+        ]
+
+        # Assert
+        assert accepted[0] is True
+        assert accepted[-1] is False
+        assert sut.is_complete is False
+
+    def document(
+        self, 
+        card_id: int, 
+        title: str, 
+        text_description: str, 
+        region: Region = Region.Europe,
+        price: str = '100'
+    ) -> CatalogDocument:
+        return CatalogDocument(
+            card_id,
+            title,
+            text_description,
+            AccountFormat.Autoreg,
+            region,
+            False,
+            Decimal(price)
+        )
@@ -6,6 +6,7 @@ from marketgram.trade.domain.model.p2p.members import Members
 from marketgram.trade.domain.model.p2p.deal.dispute_deal import DisputeDeal
 from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
 from marketgram.trade.domain.model.p2p.time_tags import TimeTags
+from marketgram.trade.domain.model.rule.agreement.entry import PostingEntry
 from marketgram.trade.domain.model.rule.agreement.money import Money
 
 
@@ -16,6 +17,7 @@ class TestDisputeDeal:
             TimeTags(
                 datetime.now(UTC) - timedelta(hours=24),
                 datetime.now(UTC) - timedelta(hours=12),
+                datetime.now(UTC),
                 datetime.now(UTC)
             ),
         )
@@ -26,6 +28,7 @@ class TestDisputeDeal:
         # Assert
         assert sut.is_disputed == True
         assert sut.status == StatusDeal.DISPUTE
+        assert sut._time_tags.closed_at is None
 
     def test_deadline_for_opening_a_dispute(self) -> None:
         # Arrange
@@ -47,11 +50,51 @@ class TestDisputeDeal:
         # Assert
         assert timedelta(hours=inspection_hours) + received_at == result
 
+    def test_satisfy_seller_closes_the_deal(self) -> None:
+        # Arrange
+        closed_at = datetime.now(UTC)
+        sut = self.make_dispute_deal(
+            TimeTags(
+                datetime.now(UTC) - timedelta(hours=24),
+                datetime.now(UTC) - timedelta(hours=12),
+                datetime.now(UTC) - timedelta(hours=1)
+            ),
+            is_disputed=True
+        )
+
+        # Act
+        sut.satisfy_seller(closed_at)
+
+        # Assert
+        assert sut.status == StatusDeal.CLOSED
+        assert sut._time_tags.closed_at == closed_at
+
+    def test_satisfy_buyer_closes_the_deal(self) -> None:
+        # Arrange
+        closed_at = datetime.now(UTC)
+        sut = self.make_dispute_deal(
+            TimeTags(
+                datetime.now(UTC) - timedelta(hours=24),
+                datetime.now(UTC) - timedelta(hours=12),
+                datetime.now(UTC) - timedelta(hours=1)
+            ),
+            is_disputed=True,
+            deal_entries=[]
+        )
+
+        # Act
+        sut.satisfy_buyer(closed_at)
+
+        # Assert
+        assert sut.status == StatusDeal.CANCELLED
+        assert sut._time_tags.closed_at == closed_at
+
     def make_dispute_deal(
         self, 
         time_tags: TimeTags, 
         is_disputed: bool = False,
-        inspection_hours: int = 1
+        inspection_hours: int = 1,
+        deal_entries: list[PostingEntry] | None = None
     ) -> DisputeDeal:
         return DisputeDeal(
             1,
@@ -61,4 +104,5 @@ class TestDisputeDeal:
             time_tags,
             Deadlines(1, 1, inspection_hours),
             StatusDeal.CHECK,
+            deal_entries
         )
\ No newline at end of file
@@ -0,0 +1,63 @@
+import asyncio
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from marketgram.trade.domain.model.events import DealShipped
+from marketgram.trade.port.adapter.event_dispatcher import (
+    EventDispatcher,
+    OutboxMessage
+)
+
+
+class TestEventDispatcher:
+    async def test_messages_are_delivered_in_order_per_aggregate(self) -> None:
+        # Arrange
+        delivered: dict[str, list[int]] = {}
+
+        async def subscriber(message: OutboxMessage) -> None:
+            await asyncio.sleep(random.random() / 1000)
+            delivered.setdefault(message.aggregate_id, []) \
+                .append(message.event_id)
+
+        messages = [
+            self.make_message(event_id, str(event_id % 3))
+            for event_id in range(1, 31)
+        ]
+        sut = EventDispatcher()
+        sut.subscribe(DealShipped, subscriber)
+
+        # Act
+        await sut.dispatch(messages)
+
+        # Assert
+        for aggregate_id, event_ids in delivered.items():
+            assert event_ids == sorted(event_ids)
+            assert len(event_ids) == 10
+
+    async def test_subscriber_failure_fails_the_batch(self) -> None:
+        # Arrange
+        async def subscriber(message: OutboxMessage) -> None:
+            if message.aggregate_id == '2':
+                raise RuntimeError
+
+        sut = EventDispatcher()
+        sut.subscribe('DealShipped', subscriber)
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await sut.dispatch([
+                self.make_message(1, '1'), 
+                self.make_message(2, '2')
+            ])
+
+    def make_message(self, event_id: int, aggregate_id: str) -> OutboxMessage:
+        return OutboxMessage(
+            event_id,
+            'deal',
+            aggregate_id,
+            'DealShipped',
+            {'deal_id': int(aggregate_id)},
+            datetime.now(UTC)
+        )
@@ -0,0 +1,95 @@
+import pickle
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+import pytest
+
+from marketgram.trade.domain.model.rule.agreement.money import Money
+
+
+class TestMoney:
+    @pytest.mark.parametrize(
+        'number, expected',
+        [
+            (100, Decimal('100.00')),
+            ('0.005', Decimal('0.00')),
+            ('0.015', Decimal('0.02')),
+            ('-2.675', Decimal('-2.68')),
+            (Decimal('12.345'), Decimal('12.34')),
+        ]
+    )
+    def test_construction_rounds_half_even(self, number, expected) -> None:
+        # Act
+        sut = Money(number)
+
+        # Assert
+        assert sut.number == expected
+        assert sut == Money(expected)
+
+    @pytest.mark.parametrize(
+        'amount, multiplier',
+        [
+            ('100', Decimal('0.1')),
+            ('0.05', Decimal('0.5')),
+            ('0.15', Decimal('0.5')),
+            ('333.33', Decimal('0.175')),
+            ('-19.99', Decimal('0.055')),
+            ('200', Decimal(0.1)),
+            ('7.77', 3),
+        ]
+    )
+    def test_multiplication_matches_decimal_rounding(
+        self, 
+        amount, 
+        multiplier
+    ) -> None:
+        # Arrange
+        sut = Money(amount)
+        expected = (
+            Decimal(amount) 
+            * Decimal(str(multiplier)).quantize(Decimal('0.01'), ROUND_HALF_EVEN)
+        ).quantize(Decimal('0.01'), ROUND_HALF_EVEN)
+
+        # Act
+        result = sut * multiplier
+
+        # Assert
+        assert result.number == expected
+
+    @pytest.mark.parametrize('amount', ['10.49', '10.50', '11.50', '-10.50', '-10.49'])
+    def test_round_up_rounds_half_away_from_zero(self, amount) -> None:
+        # Act
+        result = Money(amount).round_up()
+
+        # Assert
+        assert result.number == Decimal(amount).quantize(Decimal('1'), ROUND_HALF_UP)
+
+    def test_multiplication_by_zero_is_forbidden(self) -> None:
+        # Act
+        with pytest.raises(ArithmeticError):
+            Money(100) * 0
+
+    def test_arithmetic_and_ordering(self) -> None:
+        # Arrange
+        sut = Money('10.10')
+
+        # Act
+        result = -(sut + Money('0.90') - Money(20))
+
+        # Assert
+        assert result == Money(9)
+        assert abs(-result) == Money(9)
+        assert Money(0) < result <= Money('9.00')
+        assert hash(result) == hash(Money('9.000'))
+
+    def test_is_immutable_and_picklable(self) -> None:
+        # Arrange
+        sut = Money('1.50')
+
+        # Act
+        with pytest.raises(AttributeError):
+            sut.currency = None
+
+        # Assert
+        assert pickle.loads(pickle.dumps(sut)) == sut
+        assert sut.__composite_values__() == (Decimal('1.50'),)
+        assert repr(sut) == '1.50₽'
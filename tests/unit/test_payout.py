@@ -23,6 +23,9 @@ from marketgram.trade.domain.model.rule.agreement.payout_rule import (
 from marketgram.trade.domain.model.rule.agreement.service_agreement import (
     ServiceAgreement
 )
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
 from marketgram.trade.domain.model.rule.agreement.types import (
     AccountType, 
     EventType, 
@@ -193,7 +196,7 @@ class TestPayuot:
         agreement.add_rule(
             EventType.TAX_PAYOUT, 
             PayoutTaxFormula(
-                uuid4(), 
+                TaxAccounts(uuid4()), 
                 AccountType.TAX, 
                 Operation.BUY, 
                 EntryStatus.ACCEPTED
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from marketgram.trade.domain.model.events import DealReceived
+from marketgram.trade.domain.model.p2p.deadlines import Deadlines
+from marketgram.trade.domain.model.p2p.deal.receipt_deal import ReceiptDeal
+from marketgram.trade.domain.model.p2p.status_deal import StatusDeal
+from marketgram.trade.domain.model.p2p.time_tags import TimeTags
+from marketgram.trade.domain.model.trade_item.exceptions import (
+    DomainError
+)
+
+
+class TestReceiptDeal:
+    def test_receive_by_deadline(self) -> None:
+        # Arrange
+        shipped_at = datetime.now(UTC) - timedelta(hours=5)
+        sut = self.make_receipt_deal(shipped_at, receipt_hours=2)
+
+        # Act
+        sut.receive_by_deadline(datetime.now(UTC))
+
+        # Assert
+        assert sut._status == StatusDeal.CHECK
+        assert sut._time_tags.received_at == shipped_at + timedelta(hours=2)
+
+    def test_receive_by_deadline_records_event(self) -> None:
+        # Arrange
+        shipped_at = datetime.now(UTC) - timedelta(hours=5)
+        sut = self.make_receipt_deal(shipped_at, receipt_hours=2)
+
+        # Act
+        sut.receive_by_deadline(datetime.now(UTC))
+
+        # Assert
+        assert sut.release_events() == [
+            DealReceived(1, shipped_at + timedelta(hours=2))
+        ]
+        assert sut.release_events() == []
+
+    def test_receive_before_deadline_is_forbidden(self) -> None:
+        # Arrange
+        sut = self.make_receipt_deal(datetime.now(UTC), receipt_hours=2)
+
+        # Act
+        with pytest.raises(DomainError):
+            sut.receive_by_deadline(datetime.now(UTC))
+
+    def make_receipt_deal(
+        self, 
+        shipped_at: datetime, 
+        receipt_hours: int
+    ) -> ReceiptDeal:
+        return ReceiptDeal(
+            1,
+            TimeTags(shipped_at - timedelta(hours=1), shipped_at),
+            Deadlines(1, receipt_hours, 1),
+            StatusDeal.AWAITING
+        )
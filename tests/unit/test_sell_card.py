@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from marketgram.trade.domain.model.p2p.deadlines import Deadlines
+from marketgram.trade.domain.model.p2p.delivery import Delivery
+from marketgram.trade.domain.model.p2p.format import Format
+from marketgram.trade.domain.model.p2p.transfer_method import (
+    TransferMethod
+)
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.trade_item.exceptions import (
+    DomainError
+)
+from marketgram.trade.domain.model.trade_item.sell_card import SellCard
+
+
+class TestSellCard:
+    def test_buy_single_card(self) -> None:
+        # Arrange
+        sut = self.make_sell_card(
+            Delivery(Format.LOGIN_CODE, TransferMethod.PROVIDES_SELLER)
+        )
+
+        # Act
+        sut.buy(1)
+
+        # Assert
+        assert sut._is_purchased == True
+
+    def test_buy_several_units_of_single_card(self) -> None:
+        # Arrange
+        sut = self.make_sell_card(
+            Delivery(Format.LOGIN_CODE, TransferMethod.PROVIDES_SELLER)
+        )
+
+        # Act
+        with pytest.raises(DomainError):
+            sut.buy(2)
+
+    def test_buy_from_stock_keeps_card_for_sale(self) -> None:
+        # Arrange
+        sut = self.make_sell_card(
+            Delivery(Format.LINK, TransferMethod.AUTO_PROVIDE)
+        )
+
+        # Act
+        sut.buy(5)
+
+        # Assert
+        assert sut.from_stock() == True
+        assert sut._is_purchased == False
+
+    def make_sell_card(self, delivery: Delivery) -> SellCard:
+        return SellCard(
+            1,
+            uuid4(),
+            Money(200),
+            False,
+            False,
+            datetime.now(UTC),
+            delivery,
+            Deadlines(1, 1, 1)
+        )
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from marketgram.trade.domain.model.rule.agreement.limits import Limits
+from marketgram.trade.domain.model.rule.agreement.money import Money
+from marketgram.trade.domain.model.rule.agreement.service_agreement import (
+    ServiceAgreement
+)
+from marketgram.trade.domain.model.trade_item.exceptions import (
+    DomainError
+)
+
+
+class TestServiceAgreement:
+    def test_limits_from_picks_latest_installed_version(self) -> None:
+        # Arrange
+        install_date = datetime(2024, 1, 1)
+        sut = ServiceAgreement(uuid4())
+        for days in (30, 0, 10):
+            sut.new_limits(
+                self.make_limits(Money(100 + days), install_date + timedelta(days=days))
+            )
+
+        # Act
+        before_update = sut.limits_from(install_date + timedelta(days=29))
+        after_update = sut.limits_from(install_date + timedelta(days=30))
+
+        # Assert
+        assert before_update.min_price == Money(110)
+        assert after_update.min_price == Money(130)
+
+    def test_new_limits_invalidate_cached_lookup(self) -> None:
+        # Arrange
+        install_date = datetime(2024, 1, 1)
+        sut = ServiceAgreement(uuid4())
+        sut.new_limits(self.make_limits(Money(100), install_date))
+        sut.limits_from(install_date + timedelta(days=5))
+
+        # Act
+        sut.new_limits(
+            self.make_limits(Money(200), install_date + timedelta(days=5))
+        )
+
+        # Assert
+        assert sut.limits_from(install_date + timedelta(days=5)).min_price == Money(200)
+
+    def test_limits_before_first_version_are_missing(self) -> None:
+        # Arrange
+        sut = ServiceAgreement(uuid4())
+        sut.new_limits(self.make_limits(Money(100), datetime(2024, 1, 1)))
+
+        # Act
+        with pytest.raises(ValueError):
+            sut.limits_from(datetime(2023, 12, 31))
+
+    def test_frozen_agreement_is_read_only(self) -> None:
+        # Arrange
+        sut = ServiceAgreement(uuid4())
+        sut.new_limits(self.make_limits(Money(100), datetime(2024, 1, 1)))
+
+        # Act
+        sut.freeze()
+
+        # Assert
+        assert sut.is_frozen == True
+        assert sut.limits_from(datetime(2024, 2, 1)).min_price == Money(100)
+        with pytest.raises(DomainError):
+            sut.new_limits(self.make_limits(Money(200), datetime(2024, 3, 1)))
+
+    def make_limits(self, min_price: Money, install_date: datetime) -> Limits:
+        return Limits(
+            min_price,
+            Money(100),
+            Money(100),
+            Decimal('0.1'),
+            Decimal('0.1'),
+            Decimal('0.1'),
+            install_date
+        )
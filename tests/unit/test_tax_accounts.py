@@ -0,0 +1,32 @@
+from uuid import uuid4
+
+from marketgram.trade.domain.model.rule.agreement.tax_accounts import (
+    TaxAccounts
+)
+
+
+class TestTaxAccounts:
+    def test_source_is_always_routed_to_the_same_shard(self) -> None:
+        # Arrange
+        superuser_id = uuid4()
+        sources = list(range(1, 1001))
+
+        # Act
+        first = [TaxAccounts(superuser_id, 8).for_source(source) for source in sources]
+        second = [TaxAccounts(superuser_id, 8).for_source(source) for source in sources]
+
+        # Assert
+        assert first == second
+        assert set(first) == set(TaxAccounts(superuser_id, 8).account_ids)
+
+    def test_single_shard_keeps_superuser_account(self) -> None:
+        # Arrange
+        superuser_id = uuid4()
+        sut = TaxAccounts(superuser_id)
+
+        # Act
+        account_id = sut.for_source(uuid4())
+
+        # Assert
+        assert account_id == superuser_id
+        assert sut.for_source(None) == superuser_id